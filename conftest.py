@@ -0,0 +1,31 @@
+"""Shared fixtures for the root-level verification scripts."""
+
+from pathlib import Path
+
+import pytest
+
+from tests._config_helpers import make_tmp_config
+
+ROOT = Path(__file__).parent
+CLI_PATH = ROOT / "src" / "yt_faceless" / "cli.py"
+
+
+@pytest.fixture(scope="session")
+def cli_source():
+    """Source of the CLI module, read once per session."""
+    return CLI_PATH.read_text(encoding="utf-8")
+
+
+@pytest.fixture
+def tmp_config(tmp_path):
+    """MagicMock config with a data_dir of its own under tmp_path."""
+    return make_tmp_config(tmp_path)
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--live-elevenlabs",
+        action="store_true",
+        default=False,
+        help="Call the real ElevenLabs API instead of canned responses",
+    )
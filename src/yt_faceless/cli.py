@@ -1175,7 +1175,6 @@ def _cmd_safety(args: argparse.Namespace) -> int:
 def _cmd_calendar_schedule(args: argparse.Namespace) -> int:
     """Handle calendar schedule command."""
     try:
-        import asyncio
         from datetime import datetime
         from .schedule.calendar import schedule_content
 
@@ -1187,13 +1186,13 @@ def _cmd_calendar_schedule(args: argparse.Namespace) -> int:
             publish_date = datetime.strptime(args.date, "%Y-%m-%d %H:%M")
 
         # Schedule content
-        result = asyncio.run(schedule_content(
+        result = schedule_content(
             config,
             args.slug,
             publish_date=publish_date,
             template=args.template,
             dry_run=args.dry_run
-        ))
+        )
 
         if args.dry_run:
             print(f"[DRY RUN] Would schedule {args.slug}")
@@ -308,6 +308,7 @@ class AppConfig:
         "sponsorships": True,
         "multiplatform_distribution": False,
         "calendar_enabled": True,
+        "calendar_sqlite": False,
     })
     
     # Environment settings
@@ -522,6 +523,7 @@ def load_config() -> AppConfig:
         "sponsorships": os.getenv("FEATURE_SPONSORSHIPS", "true").lower() == "true",
         "multiplatform_distribution": os.getenv("FEATURE_MULTIPLATFORM_DISTRIBUTION", "false").lower() == "true",
         "calendar_enabled": os.getenv("FEATURE_CALENDAR_ENABLED", "true").lower() == "true",
+        "calendar_sqlite": os.getenv("FEATURE_CALENDAR_SQLITE", "false").lower() == "true",
     }
     
     # Create config object
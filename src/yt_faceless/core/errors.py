@@ -121,4 +121,12 @@ class RetryableError(YTFacelessError):
 
 class NonRetryableError(YTFacelessError):
     """Base class for errors that should not trigger a retry."""
-    pass
\ No newline at end of file
+    pass
+
+
+class CircuitBreakerOpenError(NonRetryableError):
+    """Raised when a call is rejected because its circuit breaker is open."""
+    
+    def __init__(self, name: str):
+        super().__init__(f"Circuit breaker is open for {name}")
+        self.name = name
\ No newline at end of file
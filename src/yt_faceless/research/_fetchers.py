@@ -0,0 +1,214 @@
+"""Trend source fetchers (placeholder data until API integrations land).
+
+Imported lazily by ``TrendAnalyzer.get_trending_topics`` so callers that
+only need sustainability or seasonal analysis don't load source clients.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from functools import lru_cache
+from itertools import chain
+from typing import Any, Dict, Final, FrozenSet, Iterable, List, Optional, Tuple
+
+from ..core.schemas import VideoNiche
+
+# Content category -> niches it feeds
+_CATEGORY_NICHES: Final[Dict[str, Tuple[VideoNiche, ...]]] = {
+    "technology": (VideoNiche.AI_NEWS, VideoNiche.TECH_REVIEWS),
+    "finance": (VideoNiche.FINANCE, VideoNiche.CRYPTO, VideoNiche.BUSINESS),
+    "health": (VideoNiche.HEALTH, VideoNiche.PSYCHOLOGY),
+    "education": (VideoNiche.EDUCATION, VideoNiche.SCIENCE),
+    "entertainment": (VideoNiche.TRUE_CRIME, VideoNiche.HISTORY),
+    "lifestyle": (VideoNiche.LIFESTYLE, VideoNiche.MOTIVATION, VideoNiche.PRODUCTIVITY),
+}
+
+# Sample Exploding Topics data, plus the same entries grouped by category
+_EXPLODING_TOPICS: Final[Tuple[Dict[str, Any], ...]] = (
+    {
+        "topic": "AI Agents",
+        "category": "technology",
+        "growth": 850,
+        "search_volume": 45000,
+        "competition": "medium",
+    },
+    {
+        "topic": "Vision Pro Apps",
+        "category": "technology",
+        "growth": 1200,
+        "search_volume": 28000,
+        "competition": "low",
+    },
+    {
+        "topic": "GLP-1 Drugs",
+        "category": "health",
+        "growth": 650,
+        "search_volume": 82000,
+        "competition": "high",
+    },
+)
+
+_EXPLODING_BY_CATEGORY: Final[Dict[str, Tuple[Dict[str, Any], ...]]] = {
+    category: tuple(t for t in _EXPLODING_TOPICS if t["category"] == category)
+    for category in dict.fromkeys(t["category"] for t in _EXPLODING_TOPICS)
+}
+
+
+@lru_cache(maxsize=1)
+def _category_index() -> Dict[str, FrozenSet[VideoNiche]]:
+    """Category -> niches it feeds, as sets for membership tests."""
+    return {category: frozenset(niches) for category, niches in _CATEGORY_NICHES.items()}
+
+
+@lru_cache(maxsize=1)
+def _niche_to_categories() -> Dict[VideoNiche, Tuple[str, ...]]:
+    """Niche -> categories that feed it (inverse of _CATEGORY_NICHES)."""
+    return {
+        niche: tuple(category for category, niches in _CATEGORY_NICHES.items() if niche in niches)
+        for niche in VideoNiche
+    }
+
+
+def get_all_sources(niche: Optional[VideoNiche] = None) -> Tuple[List[Dict[str, Any]], ...]:
+    """Fetch one batch of trends per source."""
+    return (
+        get_exploding_topics(niche),
+        get_google_trends(niche),
+        get_reddit_trends(niche),
+        get_youtube_trends(niche),
+    )
+
+
+def get_exploding_topics(niche: Optional[VideoNiche] = None) -> List[Dict[str, Any]]:
+    """Get trends from Exploding Topics (placeholder)."""
+    if niche is None:
+        topics: Iterable[Dict[str, Any]] = _EXPLODING_TOPICS
+    else:
+        topics = chain.from_iterable(
+            _EXPLODING_BY_CATEGORY.get(category, ())
+            for category in _niche_to_categories().get(niche, ())
+        )
+
+    timestamp = datetime.now().isoformat()
+    return [
+        {
+            "source": "exploding_topics",
+            "topic": topic_data["topic"],
+            "category": topic_data["category"],
+            "growth_percentage": topic_data["growth"],
+            "search_volume": topic_data["search_volume"],
+            "competition": topic_data["competition"],
+            "timestamp": timestamp,
+        }
+        for topic_data in topics
+    ]
+
+
+def get_google_trends(niche: Optional[VideoNiche] = None) -> List[Dict[str, Any]]:
+    """Get trends from Google Trends (placeholder)."""
+    trends = []
+
+    # Would integrate with pytrends or Google Trends API
+    sample_trends = [
+        ("chatgpt plugins", 95, "technology"),
+        ("recession 2024", 88, "finance"),
+        ("ozempic alternatives", 76, "health"),
+    ]
+
+    for topic, interest, category in sample_trends:
+        if niche and not matches_niche(category, niche):
+            continue
+
+        trends.append({
+            "source": "google_trends",
+            "topic": topic,
+            "category": category,
+            "interest_score": interest,
+            "timestamp": datetime.now().isoformat(),
+        })
+
+    return trends
+
+
+def get_reddit_trends(niche: Optional[VideoNiche] = None) -> List[Dict[str, Any]]:
+    """Get trends from Reddit (placeholder)."""
+    trends = []
+
+    # Would integrate with Reddit API
+    subreddit_map = {
+        VideoNiche.AI_NEWS: ["r/artificial", "r/singularity"],
+        VideoNiche.FINANCE: ["r/personalfinance", "r/investing"],
+        VideoNiche.CRYPTO: ["r/cryptocurrency", "r/bitcoin"],
+        VideoNiche.PSYCHOLOGY: ["r/psychology", "r/getmotivated"],
+    }
+
+    # Sample trending posts
+    sample_posts = [
+        {
+            "title": "New AI model beats GPT-4 on benchmarks",
+            "subreddit": "r/artificial",
+            "upvotes": 15000,
+            "comments": 850,
+            "category": "technology",
+        },
+        {
+            "title": "How I saved $50k in 2 years",
+            "subreddit": "r/personalfinance",
+            "upvotes": 8500,
+            "comments": 420,
+            "category": "finance",
+        },
+    ]
+
+    for post in sample_posts:
+        if niche and not matches_niche(post["category"], niche):
+            continue
+
+        trends.append({
+            "source": "reddit",
+            "topic": post["title"],
+            "subreddit": post["subreddit"],
+            "engagement_score": (post["upvotes"] + post["comments"] * 10) / 1000,
+            "category": post["category"],
+            "timestamp": datetime.now().isoformat(),
+        })
+
+    return trends
+
+
+def get_youtube_trends(niche: Optional[VideoNiche] = None) -> List[Dict[str, Any]]:
+    """Get trends from YouTube (placeholder)."""
+    trends = []
+
+    # Would use YouTube API
+    sample_youtube_trends = [
+        {
+            "title": "AI News This Week",
+            "views_velocity": 150000,  # views per day
+            "category": "technology",
+        },
+        {
+            "title": "Market Crash Incoming?",
+            "views_velocity": 85000,
+            "category": "finance",
+        },
+    ]
+
+    for trend in sample_youtube_trends:
+        if niche and not matches_niche(trend["category"], niche):
+            continue
+
+        trends.append({
+            "source": "youtube",
+            "topic": trend["title"],
+            "category": trend["category"],
+            "views_velocity": trend["views_velocity"],
+            "timestamp": datetime.now().isoformat(),
+        })
+
+    return trends
+
+
+def matches_niche(category: str, niche: VideoNiche) -> bool:
+    """Check if a category matches a niche."""
+    return niche in _category_index().get(category.lower(), ())
@@ -2,10 +2,21 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import time
+from bisect import bisect_left
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Final, List, Mapping, Optional, Tuple
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from ..core.config import AppConfig
 from ..core.schemas import VideoNiche
@@ -13,6 +24,62 @@ from ..core.schemas import VideoNiche
 logger = logging.getLogger(__name__)
 
 
+def _dumps(obj: Any) -> bytes:
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(data: bytes) -> Any:
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+
+# Step-function velocity tables: source -> (metric field, thresholds, scores).
+# ``scores[i]`` applies when the metric strictly exceeds ``i`` thresholds.
+_VELOCITY_STEPS: Final[Dict[str, Tuple[str, Tuple[float, ...], Tuple[float, ...]]]] = {
+    "exploding_topics": (
+        "growth_percentage",
+        (100, 200, 500, 1000),
+        (4.0, 5.5, 7.0, 8.5, 10.0),
+    ),
+    "youtube": (
+        "views_velocity",
+        (20000, 50000, 100000),
+        (4.5, 6.0, 7.5, 9.0),
+    ),
+}
+
+# Linear velocity sources: source -> metric field, scored as min(10, value / 10)
+_VELOCITY_LINEAR: Final[Dict[str, str]] = {
+    "google_trends": "interest_score",
+    "reddit": "engagement_score",
+}
+
+_DEFAULT_VELOCITY: Final[float] = 5.0
+
+# Niche-specific seasonal patterns: niche -> month -> topics
+_SEASONAL_PATTERNS: Final[Mapping[VideoNiche, Mapping[int, Tuple[str, ...]]]] = MappingProxyType({
+    VideoNiche.FINANCE: MappingProxyType({
+        1: ("tax preparation", "new year budget", "investment planning"),
+        4: ("tax filing", "quarterly earnings", "spring cleaning finances"),
+        9: ("back to school budgeting", "Q4 planning"),
+        11: ("black friday deals", "holiday budgeting"),
+    }),
+    VideoNiche.HEALTH: MappingProxyType({
+        1: ("new year fitness", "diet resolutions", "gym memberships"),
+        3: ("spring fitness", "allergy season"),
+        6: ("summer body", "outdoor workouts"),
+        10: ("flu season prep", "immune boosting"),
+    }),
+    VideoNiche.TECH_REVIEWS: MappingProxyType({
+        1: ("CES coverage", "new year tech"),
+        6: ("WWDC coverage", "summer gadgets"),
+        9: ("iPhone launch", "back to school tech"),
+        11: ("black friday tech deals", "holiday gift guides"),
+    }),
+})
+
+
 class TrendAnalyzer:
     """Analyzes trends across multiple platforms for content opportunities."""
     
@@ -25,7 +92,8 @@ class TrendAnalyzer:
         self,
         niche: Optional[VideoNiche] = None,
         lookback_days: Optional[int] = None,
-        min_velocity: float = 5.0
+        min_velocity: float = 5.0,
+        force_refresh: bool = False
     ) -> List[Dict[str, Any]]:
         """Get currently trending topics with growth metrics.
         
@@ -33,24 +101,29 @@ class TrendAnalyzer:
             niche: Filter by specific niche
             lookback_days: Days to analyze (default from config)
             min_velocity: Minimum trend velocity score
+            force_refresh: Bypass cache and fetch fresh data
         
         Returns:
             List of trending topics with metrics
         """
         lookback_days = lookback_days or self.config.research.trend_lookback_days
+        cache_file = self._trends_cache_file(niche, lookback_days)
         
-        # Aggregate trends from multiple sources
-        trends = []
-        
-        # Get trends from each source
-        trends.extend(self._get_exploding_topics(niche))
-        trends.extend(self._get_google_trends(niche))
-        trends.extend(self._get_reddit_trends(niche))
-        trends.extend(self._get_youtube_trends(niche))
+        # Check cache unless forced refresh
+        trends = None if force_refresh else self._load_cached_trends(cache_file)
         
-        # Calculate velocity scores
-        for trend in trends:
-            trend["velocity_score"] = self._calculate_velocity(trend)
+        if trends is None:
+            # Aggregate trends from multiple sources, scoring each source batch
+            trends = []
+            
+            from ._fetchers import get_all_sources
+            
+            for batch in get_all_sources(niche):
+                self._assign_velocities(batch)
+                trends.extend(batch)
+            
+            # Cache scored trends before filtering so any min_velocity can reuse them
+            self._cache_trends(cache_file, trends)
         
         # Filter by minimum velocity
         trends = [t for t in trends if t["velocity_score"] >= min_velocity]
@@ -122,278 +195,99 @@ class TrendAnalyzer:
         if target_month is None:
             target_month = (datetime.now().month % 12) + 1
         
-        seasonal_trends = []
-        
-        # Niche-specific seasonal patterns
-        seasonal_patterns = {
-            VideoNiche.FINANCE: {
-                1: ["tax preparation", "new year budget", "investment planning"],
-                4: ["tax filing", "quarterly earnings", "spring cleaning finances"],
-                9: ["back to school budgeting", "Q4 planning"],
-                11: ["black friday deals", "holiday budgeting"],
-            },
-            VideoNiche.HEALTH: {
-                1: ["new year fitness", "diet resolutions", "gym memberships"],
-                3: ["spring fitness", "allergy season"],
-                6: ["summer body", "outdoor workouts"],
-                10: ["flu season prep", "immune boosting"],
-            },
-            VideoNiche.TECH_REVIEWS: {
-                1: ["CES coverage", "new year tech"],
-                6: ["WWDC coverage", "summer gadgets"],
-                9: ["iPhone launch", "back to school tech"],
-                11: ["black friday tech deals", "holiday gift guides"],
-            },
-        }
+        topics = _SEASONAL_PATTERNS.get(niche, {}).get(target_month, ())
         
-        patterns = seasonal_patterns.get(niche, {})
-        topics = patterns.get(target_month, [])
+        # Publish date depends only on the month, not the topic
+        publish_date = self._calculate_publish_date(target_month)
         
-        for topic in topics:
-            seasonal_trends.append({
+        return [
+            {
                 "topic": topic,
                 "niche": niche.value,
                 "target_month": target_month,
                 "seasonality_score": 8.5,  # Placeholder
                 "historical_performance": "high",
-                "recommended_publish_date": self._calculate_publish_date(target_month),
-            })
-        
-        return seasonal_trends
-    
-    def _get_exploding_topics(self, niche: Optional[VideoNiche] = None) -> List[Dict[str, Any]]:
-        """Get trends from Exploding Topics (placeholder)."""
-        trends = []
-        
-        # Sample trending topics
-        sample_topics = [
-            {
-                "topic": "AI Agents",
-                "category": "technology",
-                "growth": 850,
-                "search_volume": 45000,
-                "competition": "medium",
-            },
-            {
-                "topic": "Vision Pro Apps",
-                "category": "technology",
-                "growth": 1200,
-                "search_volume": 28000,
-                "competition": "low",
-            },
-            {
-                "topic": "GLP-1 Drugs",
-                "category": "health",
-                "growth": 650,
-                "search_volume": 82000,
-                "competition": "high",
-            },
+                "recommended_publish_date": publish_date,
+            }
+            for topic in topics
         ]
-        
-        for topic_data in sample_topics:
-            if niche and not self._matches_niche(topic_data["category"], niche):
-                continue
-            
-            trends.append({
-                "source": "exploding_topics",
-                "topic": topic_data["topic"],
-                "category": topic_data["category"],
-                "growth_percentage": topic_data["growth"],
-                "search_volume": topic_data["search_volume"],
-                "competition": topic_data["competition"],
-                "timestamp": datetime.now().isoformat(),
-            })
-        
-        return trends
     
-    def _get_google_trends(self, niche: Optional[VideoNiche] = None) -> List[Dict[str, Any]]:
-        """Get trends from Google Trends (placeholder)."""
-        trends = []
-        
-        # Would integrate with pytrends or Google Trends API
-        sample_trends = [
-            ("chatgpt plugins", 95, "technology"),
-            ("recession 2024", 88, "finance"),
-            ("ozempic alternatives", 76, "health"),
-        ]
-        
-        for topic, interest, category in sample_trends:
-            if niche and not self._matches_niche(category, niche):
-                continue
-            
-            trends.append({
-                "source": "google_trends",
-                "topic": topic,
-                "category": category,
-                "interest_score": interest,
-                "timestamp": datetime.now().isoformat(),
-            })
-        
-        return trends
+    def _trends_cache_file(self, niche: Optional[VideoNiche], lookback_days: int) -> Path:
+        """Get the cache file for a (niche, lookback_days) query."""
+        niche_key = niche.value if niche else "all"
+        key = hashlib.sha1(f"{niche_key}:{lookback_days}".encode()).hexdigest()[:16]
+        return self.cache_dir / f"{key}.json"
     
-    def _get_reddit_trends(self, niche: Optional[VideoNiche] = None) -> List[Dict[str, Any]]:
-        """Get trends from Reddit (placeholder)."""
-        trends = []
-        
-        # Would integrate with Reddit API
-        subreddit_map = {
-            VideoNiche.AI_NEWS: ["r/artificial", "r/singularity"],
-            VideoNiche.FINANCE: ["r/personalfinance", "r/investing"],
-            VideoNiche.CRYPTO: ["r/cryptocurrency", "r/bitcoin"],
-            VideoNiche.PSYCHOLOGY: ["r/psychology", "r/getmotivated"],
-        }
-        
-        # Sample trending posts
-        sample_posts = [
-            {
-                "title": "New AI model beats GPT-4 on benchmarks",
-                "subreddit": "r/artificial",
-                "upvotes": 15000,
-                "comments": 850,
-                "category": "technology",
-            },
-            {
-                "title": "How I saved $50k in 2 years",
-                "subreddit": "r/personalfinance",
-                "upvotes": 8500,
-                "comments": 420,
-                "category": "finance",
-            },
-        ]
-        
-        for post in sample_posts:
-            if niche and not self._matches_niche(post["category"], niche):
-                continue
-            
-            trends.append({
-                "source": "reddit",
-                "topic": post["title"],
-                "subreddit": post["subreddit"],
-                "engagement_score": (post["upvotes"] + post["comments"] * 10) / 1000,
-                "category": post["category"],
-                "timestamp": datetime.now().isoformat(),
-            })
-        
-        return trends
+    def _load_cached_trends(self, cache_file: Path) -> Optional[List[Dict[str, Any]]]:
+        """Load scored trends from cache if fresh."""
+        try:
+            cache_age = time.time() - cache_file.stat().st_mtime
+        except FileNotFoundError:
+            return None
+        
+        if cache_age > self.config.research.cache_days * 86400:
+            logger.info("Trend cache expired, will fetch fresh data")
+            return None
+        
+        try:
+            return _loads(cache_file.read_bytes())
+        except Exception as e:
+            logger.error(f"Failed to load trend cache: {e}")
+            return None
     
-    def _get_youtube_trends(self, niche: Optional[VideoNiche] = None) -> List[Dict[str, Any]]:
-        """Get trends from YouTube (placeholder)."""
-        trends = []
-        
-        # Would use YouTube API
-        sample_youtube_trends = [
-            {
-                "title": "AI News This Week",
-                "views_velocity": 150000,  # views per day
-                "category": "technology",
-            },
-            {
-                "title": "Market Crash Incoming?",
-                "views_velocity": 85000,
-                "category": "finance",
-            },
-        ]
-        
-        for trend in sample_youtube_trends:
-            if niche and not self._matches_niche(trend["category"], niche):
-                continue
-            
-            trends.append({
-                "source": "youtube",
-                "topic": trend["title"],
-                "category": trend["category"],
-                "views_velocity": trend["views_velocity"],
-                "timestamp": datetime.now().isoformat(),
-            })
+    def _cache_trends(self, cache_file: Path, trends: List[Dict[str, Any]]) -> None:
+        """Cache scored trends to disk."""
+        try:
+            cache_file.write_bytes(_dumps(trends))
+            logger.debug(f"Cached {len(trends)} trends to {cache_file}")
+        except Exception as e:
+            logger.error(f"Failed to cache trends: {e}")
+    
+    def _assign_velocities(self, trends: List[Dict[str, Any]]) -> None:
+        """Set ``velocity_score`` on a batch of trends from a single source."""
+        if not trends:
+            return
         
-        return trends
+        score = self._velocity_scorer(trends[0].get("source", ""))
+        for trend in trends:
+            trend["velocity_score"] = score(trend)
     
     def _calculate_velocity(self, trend: Dict[str, Any]) -> float:
         """Calculate trend velocity score (0-10)."""
-        source = trend.get("source", "")
-        
-        if source == "exploding_topics":
-            # Based on growth percentage
-            growth = trend.get("growth_percentage", 0)
-            if growth > 1000:
-                return 10.0
-            elif growth > 500:
-                return 8.5
-            elif growth > 200:
-                return 7.0
-            elif growth > 100:
-                return 5.5
-            else:
-                return 4.0
-        
-        elif source == "google_trends":
-            # Based on interest score
-            interest = trend.get("interest_score", 0)
-            return min(10.0, interest / 10)
-        
-        elif source == "reddit":
-            # Based on engagement
-            engagement = trend.get("engagement_score", 0)
-            return min(10.0, engagement / 10)
-        
-        elif source == "youtube":
-            # Based on views velocity
-            velocity = trend.get("views_velocity", 0)
-            if velocity > 100000:
-                return 9.0
-            elif velocity > 50000:
-                return 7.5
-            elif velocity > 20000:
-                return 6.0
-            else:
-                return 4.5
-        
-        return 5.0  # Default
+        return self._velocity_scorer(trend.get("source", ""))(trend)
     
-    def _matches_niche(self, category: str, niche: VideoNiche) -> bool:
-        """Check if a category matches a niche."""
-        category_map = {
-            "technology": [VideoNiche.AI_NEWS, VideoNiche.TECH_REVIEWS],
-            "finance": [VideoNiche.FINANCE, VideoNiche.CRYPTO, VideoNiche.BUSINESS],
-            "health": [VideoNiche.HEALTH, VideoNiche.PSYCHOLOGY],
-            "education": [VideoNiche.EDUCATION, VideoNiche.SCIENCE],
-            "entertainment": [VideoNiche.TRUE_CRIME, VideoNiche.HISTORY],
-            "lifestyle": [VideoNiche.LIFESTYLE, VideoNiche.MOTIVATION, VideoNiche.PRODUCTIVITY],
-        }
-        
-        for cat, niches in category_map.items():
-            if category.lower() == cat and niche in niches:
-                return True
-        
-        return False
+    @staticmethod
+    def _velocity_scorer(source: str) -> Callable[[Dict[str, Any]], float]:
+        """Resolve the velocity scoring function for a trend source."""
+        step = _VELOCITY_STEPS.get(source)
+        if step is not None:
+            field, thresholds, scores = step
+            return lambda trend: scores[bisect_left(thresholds, trend.get(field, 0))]
+        
+        linear_field = _VELOCITY_LINEAR.get(source)
+        if linear_field is not None:
+            return lambda trend: min(10.0, trend.get(linear_field, 0) / 10)
+        
+        return lambda trend: _DEFAULT_VELOCITY
     
     def _get_historical_data(
         self,
         topic: str,
         days: int
-    ) -> List[Tuple[datetime, float]]:
-        """Get historical data points for a topic."""
-        # Placeholder - would query actual data sources
-        data_points = []
-        
-        for i in range(days):
-            date = datetime.now() - timedelta(days=days-i)
-            # Simulate growth pattern
-            value = 100 * (1 + i/days) * (1 + 0.1 * (i % 7))
-            data_points.append((date, value))
-        
-        return data_points
+    ) -> List[float]:
+        """Get daily historical values for a topic, oldest first."""
+        # Placeholder - would query actual data sources. Only values are
+        # returned; day i corresponds to ``days - i`` days ago.
+        return [100 * (1 + i/days) * (1 + 0.1 * (i % 7)) for i in range(days)]
     
     def _analyze_pattern(
         self,
-        data_points: List[Tuple[datetime, float]]
+        values: List[float]
     ) -> Dict[str, Any]:
         """Analyze trend pattern from historical data."""
-        if not data_points:
+        if not values:
             return {"phase": "unknown", "has_peaked": False}
         
-        values = [v for _, v in data_points]
-        
         # Simple pattern detection
         recent_avg = sum(values[-7:]) / 7 if len(values) >= 7 else sum(values) / len(values)
         historical_avg = sum(values) / len(values)
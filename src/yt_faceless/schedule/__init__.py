@@ -1,5 +1,16 @@
-"""Schedule module for content calendar management."""
+"""Schedule module for content calendar management.
 
-from .calendar import add_item, list_items
+Lightweight JSON Lines calendar used by the ``ytfaceless calendar`` CLI.
+The template-, conflict- and upload-aware ``ContentCalendar`` lives in
+``yt_faceless.scheduling``.
+"""
 
-__all__ = ["add_item", "list_items"]
\ No newline at end of file
+from .calendar import (
+    add_item,
+    add_items,
+    get_publishing_schedule,
+    list_items,
+    schedule_content,
+)
+
+__all__ = ["add_item", "add_items", "list_items", "schedule_content", "get_publishing_schedule"]
\ No newline at end of file
@@ -4,42 +4,186 @@ from __future__ import annotations
 
 import json
 import logging
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict, defaultdict
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from ..core.config import AppConfig
 
 logger = logging.getLogger(__name__)
 
+def _dumps(obj: Any) -> bytes:
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(data: bytes) -> Any:
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
 
 @dataclass(slots=True)
 class CalendarStore:
+    """JSON-Lines calendar file: one item per line, appended in place."""
+
     path: Path
 
     def load(self) -> List[Dict[str, Any]]:
-        return json.loads(self.path.read_text()) if self.path.exists() else []
+        if not self.path.exists():
+            return []
+        return [_loads(line) for line in self.path.read_bytes().splitlines() if line]
+
+    def append(self, item: Dict[str, Any]) -> None:
+        self.extend((item,))
+
+    def extend(self, items: Iterable[Dict[str, Any]]) -> None:
+        data = b"".join(_dumps(item) + b"\n" for item in items)
+        if not data:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("ab") as f:
+            f.write(data)
 
     def save(self, items: List[Dict[str, Any]]) -> None:
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        self.path.write_text(json.dumps(items, indent=2))
+        self.path.write_bytes(b"".join(_dumps(item) + b"\n" for item in items))
 
 
-def add_item(cfg: AppConfig, item: Dict[str, Any]) -> None:
-    store = CalendarStore(cfg.directories.data_dir / "calendar" / "items.json")
+def migrate_legacy_store(calendar_dir: Path) -> int:
+    """Convert a legacy ``items.json`` list into ``items.jsonl``.
+
+    Legacy items are placed ahead of any items already in the JSON-Lines
+    file, and the old file is kept as ``items.json.migrated``.
+
+    Returns:
+        Number of legacy items migrated
+    """
+    legacy_path = calendar_dir / "items.json"
+    if not legacy_path.exists():
+        return 0
+
+    store = CalendarStore(calendar_dir / "items.jsonl")
+    legacy_items = _loads(legacy_path.read_bytes())
+    store.save(legacy_items + store.load())
+    legacy_path.replace(legacy_path.with_name("items.json.migrated"))
+    logger.info(f"Migrated {len(legacy_items)} calendar items to {store.path}")
+    return len(legacy_items)
+
+
+def _get_store(cfg: AppConfig) -> CalendarStore:
+    calendar_dir = cfg.directories.data_dir / "calendar"
+    migrate_legacy_store(calendar_dir)
+    return CalendarStore(calendar_dir / "items.jsonl")
+
+
+@dataclass(slots=True)
+class _CalendarIndex:
+    """Parsed calendar file plus lookup structures derived from it.
+
+    ``epochs``/``timed`` are built on the first time-window query, so slug
+    lookups never parse timestamps.
+    """
+
+    stamp: Tuple[int, int]
+    items: List[Dict[str, Any]]
+    by_slug: Dict[str, List[Dict[str, Any]]]
+    epochs: Optional[List[float]] = None
+    timed: Optional[List[Dict[str, Any]]] = None
+
+
+# Parsed calendar files keyed by path, least recently used first; an entry is
+# reused while the file's (mtime_ns, size) is unchanged
+_INDEX_CACHE: "OrderedDict[Path, _CalendarIndex]" = OrderedDict()
+_INDEX_CACHE_MAX = 8
+
+
+def _item_epoch(item: Dict[str, Any]) -> Optional[float]:
+    """POSIX timestamp of an item's scheduled_time (legacy items lack scheduled_epoch)."""
+    epoch = item.get("scheduled_epoch")
+    if epoch is None and "scheduled_time" in item:
+        epoch = datetime.fromisoformat(item["scheduled_time"]).timestamp()
+    return epoch
+
+
+def _load_index(store: CalendarStore) -> _CalendarIndex:
+    """Load items and their slug index, reusing the parse while the file is unchanged."""
+    try:
+        st = store.path.stat()
+    except FileNotFoundError:
+        return _CalendarIndex((0, 0), [], {})
+
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _INDEX_CACHE.get(store.path)
+    if cached is not None and cached.stamp == stamp:
+        _INDEX_CACHE.move_to_end(store.path)
+        return cached
+
     items = store.load()
-    items.append(item)
-    store.save(items)
+    by_slug: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    for item in items:
+        by_slug[item.get("slug")].append(item)
+
+    index = _CalendarIndex(stamp=stamp, items=items, by_slug=dict(by_slug))
+    _INDEX_CACHE[store.path] = index
+    _INDEX_CACHE.move_to_end(store.path)
+    while len(_INDEX_CACHE) > _INDEX_CACHE_MAX:
+        _INDEX_CACHE.popitem(last=False)
+    return index
+
+
+def _timeline(index: _CalendarIndex) -> Tuple[List[float], List[Dict[str, Any]]]:
+    """Items with a usable scheduled time, sorted by it, with their epochs."""
+    if index.epochs is None:
+        timed = []
+        for item in index.items:
+            try:
+                epoch = _item_epoch(item)
+            except (TypeError, ValueError):
+                logger.warning(f"Skipping calendar item with bad scheduled_time: {item.get('slug')}")
+                continue
+            if epoch is not None:
+                timed.append((epoch, item))
+        timed.sort(key=lambda pair: pair[0])
+        index.epochs = [epoch for epoch, _ in timed]
+        index.timed = [item for _, item in timed]
+    return index.epochs, index.timed
+
+
+def _normalize_item(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Rewrite scheduled_time in ``+00:00`` form and attach scheduled_epoch."""
+    scheduled_time = item.get("scheduled_time")
+    if scheduled_time is None or "scheduled_epoch" in item:
+        return item
+    when = datetime.fromisoformat(scheduled_time)
+    return {**item, "scheduled_time": when.isoformat(), "scheduled_epoch": when.timestamp()}
+
+
+def add_item(cfg: AppConfig, item: Dict[str, Any]) -> None:
+    _get_store(cfg).append(_normalize_item(item))
+
+
+def add_items(cfg: AppConfig, items: Iterable[Dict[str, Any]]) -> None:
+    """Append several items with a single write."""
+    _get_store(cfg).extend(map(_normalize_item, items))
 
 
 def list_items(cfg: AppConfig, slug: Optional[str] = None) -> List[Dict[str, Any]]:
-    store = CalendarStore(cfg.directories.data_dir / "calendar" / "items.json")
-    items = store.load()
-    return [i for i in items if not slug or i.get("slug") == slug]
+    index = _load_index(_get_store(cfg))
+    items = index.by_slug.get(slug, ()) if slug else index.items
+    # Items are flat; copies keep callers from editing the cached parse
+    return [dict(item) for item in items]
 
 
-async def schedule_content(
+def schedule_content(
     cfg: AppConfig,
     slug: str,
     publish_date: Optional[datetime] = None,
@@ -52,6 +196,7 @@ async def schedule_content(
         "slug": slug,
         "platform": "youtube",
         "scheduled_time": when.isoformat(),
+        "scheduled_epoch": when.timestamp(),
         "status": "scheduled",
         "priority": 5,
         "template": template,
@@ -68,16 +213,12 @@ def get_publishing_schedule(
     analyze: bool = False,
 ) -> Dict[str, Any]:
     """Return upcoming schedule (optionally with simple analytics)."""
-    now = datetime.now(timezone.utc)
-    horizon = now + timedelta(days=days_ahead)
-    items = list_items(cfg)
-    upcoming = [
-        i
-        for i in items
-        if "scheduled_time" in i
-        and now <= datetime.fromisoformat(i["scheduled_time"].replace("Z", "+00:00")) <= horizon
-    ]
-    out: Dict[str, Any] = {"upcoming": upcoming}
+    now_ts = datetime.now(timezone.utc).timestamp()
+    horizon_ts = now_ts + days_ahead * 86400
+    epochs, timed = _timeline(_load_index(_get_store(cfg)))
+    lo = bisect_left(epochs, now_ts)
+    hi = bisect_right(epochs, horizon_ts)
+    out: Dict[str, Any] = {"upcoming": [dict(item) for item in timed[lo:hi]]}
     if analyze:
         out["analytics"] = {"status": "no_data"}  # TODO: integrate n8n analytics if desired
     return out
\ No newline at end of file
@@ -1,13 +1,23 @@
-"""Content calendar and scheduling system."""
+"""Content calendar and scheduling system.
+
+Provides ``ContentCalendar`` (templates, conflict resolution, scheduled
+uploads) and its SQLite-backed variant ``ContentCalendarSQLite``, chosen
+by ``open_calendar`` from the ``calendar_sqlite`` feature flag. The
+minimal JSON Lines store used by the CLI is ``yt_faceless.schedule``.
+"""
 
 from .calendar import (
     ContentCalendar,
+    ContentCalendarSQLite,
+    open_calendar,
     schedule_content,
     get_publishing_schedule,
 )
 
 __all__ = [
     "ContentCalendar",
+    "ContentCalendarSQLite",
+    "open_calendar",
     "schedule_content",
     "get_publishing_schedule",
 ]
\ No newline at end of file
@@ -2,17 +2,169 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
+import os
+import sqlite3
+import time
+from bisect import bisect_left, bisect_right
+from contextlib import closing
 from datetime import datetime, timedelta, timezone
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from ..core.config import AppConfig
-from ..integrations.n8n_client import N8NClient
 from ..logging_setup import get_logger
 
+if TYPE_CHECKING:
+    from ..integrations.n8n_client import N8NClient
+
 logger = get_logger(__name__)
 
+# Template day names, indexed by datetime.weekday()
+_WEEKDAY_NAMES = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+_DAYS_MAP = {name: i for i, name in enumerate(_WEEKDAY_NAMES)}
+
+# Default optimal publishing hours by day of week (in local timezone)
+_OPTIMAL_TIMES = {
+    0: (9, 17),      # Monday
+    1: (10, 19),     # Tuesday
+    2: (9, 18),      # Wednesday
+    3: (10, 20),     # Thursday
+    4: (9, 17),      # Friday
+    5: (11, 15),     # Saturday
+    6: (12, 20)      # Sunday
+}
+
+# Niche-specific hour adjustments
+_NICHE_ADJUSTMENTS = {
+    "gaming": 2,      # Later in the day
+    "education": -1,  # Earlier in the day
+    "entertainment": 1,  # Slightly later
+    "business": -2,   # Much earlier
+    "lifestyle": 0    # No adjustment
+}
+
+
+@lru_cache(maxsize=256)
+def _optimal_hour(weekday: int, niche: Optional[str], now_hour: int) -> int:
+    """Optimal publishing hour (0-23) for a weekday, niche and current hour."""
+    adjustment = _NICHE_ADJUSTMENTS.get(niche, 0)
+    first, last = (h + adjustment for h in _OPTIMAL_TIMES.get(weekday, (9, 17)))
+
+    # Pick the first available slot
+    return (first if now_hour < first else last) % 24
+
+
+def _loads(data: bytes) -> Any:
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+
+def _read_json(path: Path) -> Any:
+    """Parse a JSON file, using orjson when available."""
+    return _loads(path.read_bytes())
+
+
+def _json_default(obj: Any) -> str:
+    """Encode datetimes as ISO strings, as orjson does natively, and anything
+    else (paths, enums, ...) as str() so a save never fails on metadata."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    return str(obj)
+
+
+def _dump_json(obj: Any, indent: bool = True) -> bytes:
+    """Serialize to JSON bytes (indented by default), using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            obj, default=_json_default, option=orjson.OPT_INDENT_2 if indent else None
+        )
+    if indent:
+        return json.dumps(obj, indent=2, default=_json_default).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), default=_json_default).encode("utf-8")
+
+
+# Scheduling templates written to templates.json on first run
+_DEFAULT_TEMPLATES = {
+    "daily": {
+        "name": "Daily Upload",
+        "frequency": "daily",
+        "times": ["09:00", "18:00"],
+        "timezone": "UTC",
+        "active": False
+    },
+    "weekday": {
+        "name": "Weekday Upload",
+        "frequency": "weekday",
+        "days": ["monday", "wednesday", "friday"],
+        "time": "15:00",
+        "timezone": "UTC",
+        "active": True
+    },
+    "weekend": {
+        "name": "Weekend Special",
+        "frequency": "weekly",
+        "days": ["saturday"],
+        "time": "12:00",
+        "timezone": "UTC",
+        "active": False
+    },
+    "optimal": {
+        "name": "Optimal Times",
+        "frequency": "custom",
+        "schedule": {
+            "monday": ["09:00", "17:00"],
+            "tuesday": ["10:00", "19:00"],
+            "wednesday": ["09:00", "18:00"],
+            "thursday": ["10:00", "20:00"],
+            "friday": ["09:00", "17:00"],
+            "saturday": ["11:00"],
+            "sunday": ["12:00", "20:00"]
+        },
+        "timezone": "UTC",
+        "active": False
+    }
+}
+
+
+def _default_holidays(year: int) -> List[Dict[str, str]]:
+    """Get default holiday schedule for a year."""
+    return [
+        {"date": f"{year}-01-01", "name": "New Year's Day", "strategy": "avoid"},
+        {"date": f"{year}-02-14", "name": "Valentine's Day", "strategy": "themed"},
+        {"date": f"{year}-03-17", "name": "St. Patrick's Day", "strategy": "themed"},
+        {"date": f"{year}-07-04", "name": "Independence Day", "strategy": "avoid"},
+        {"date": f"{year}-10-31", "name": "Halloween", "strategy": "themed"},
+        {"date": f"{year}-11-11", "name": "Veterans Day", "strategy": "special"},
+        {"date": f"{year}-12-25", "name": "Christmas", "strategy": "avoid"},
+        {"date": f"{year}-12-31", "name": "New Year's Eve", "strategy": "special"}
+    ]
+
+
+@lru_cache(maxsize=1)
+def _default_templates_json() -> bytes:
+    """Default templates file contents, serialized once per process."""
+    return _dump_json(_DEFAULT_TEMPLATES)
+
+
+@lru_cache(maxsize=1)
+def _default_calendar_json(year: int) -> bytes:
+    """Default calendar file contents for a year, serialized once per process."""
+    return _dump_json({
+        "scheduled": [],
+        "published": [],
+        "drafts": [],
+        "recurring": [],
+        "holidays": _default_holidays(year)
+    })
+
 
 class ContentCalendar:
     """Manages content scheduling and publishing calendar."""
@@ -24,7 +176,6 @@ class ContentCalendar:
             config: Application configuration
         """
         self.config = config
-        self.n8n_client = N8NClient(config)
         self.data_dir = config.directories.data_dir / "calendar"
         self.data_dir.mkdir(parents=True, exist_ok=True)
 
@@ -35,91 +186,197 @@ class ContentCalendar:
         self.calendar = self._load_calendar()
         self.templates = self._load_templates()
 
+        # Unsaved calendar changes; writes are deferred while a batch is open
+        self._dirty = False
+        self._batch_depth = 0
+
+        # Scheduled items sorted by POSIX timestamp and their positions by
+        # slug, published times as parallel arrays (timestamp, weekday, hour)
+        # in list order, and "avoid" holidays by date. Each records the list
+        # it was built from so it is rebuilt if the calendar lists are
+        # replaced or resized elsewhere.
+        self._scheduled_times: List[float] = []
+        self._scheduled_by_time: List[Dict[str, Any]] = []
+        self._scheduled_source: Tuple[Optional[List[Dict[str, Any]]], int] = (None, 0)
+        self._slug_positions: Dict[str, List[int]] = {}
+        self._slug_source: Tuple[Optional[List[Dict[str, Any]]], int] = (None, 0)
+        self._published_times: List[float] = []
+        self._published_weekdays: List[int] = []
+        self._published_hours: List[int] = []
+        self._published_source: Tuple[Optional[List[Dict[str, Any]]], int] = (None, 0)
+        self._avoid_holidays: Dict[str, List[Dict[str, Any]]] = {}
+        self._holidays_source: Tuple[Optional[List[Dict[str, Any]]], int] = (None, 0)
+
+        # Build indexes up front so the first scheduling call doesn't pay for them
+        self._scheduled_index()
+        self._get_avoid_holidays()
+
+    @cached_property
+    def n8n_client(self) -> N8NClient:
+        """n8n client, created on first use (only uploads need it)."""
+        from ..integrations.n8n_client import N8NClient
+        return N8NClient(self.config)
+
+    def __enter__(self) -> "ContentCalendar":
+        """Open a batch: changes are written once when the outermost batch exits."""
+        self._batch_depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._batch_depth -= 1
+        if not self._batch_depth:
+            self.flush()
+
     def _load_calendar(self) -> Dict[str, Any]:
         """Load content calendar."""
         if not self.calendar_file.exists():
             # Create default calendar structure
-            default_calendar = {
-                "scheduled": [],
-                "published": [],
-                "drafts": [],
-                "recurring": [],
-                "holidays": self._get_default_holidays()
-            }
-            self.calendar_file.write_text(json.dumps(default_calendar, indent=2))
+            self.calendar_file.write_bytes(_default_calendar_json(datetime.now().year))
             logger.info(f"Created default calendar at {self.calendar_file}")
 
-        with open(self.calendar_file, 'r') as f:
-            return json.load(f)
+        return _read_json(self.calendar_file)
 
     def _save_calendar(self) -> None:
         """Save content calendar."""
-        with open(self.calendar_file, 'w') as f:
-            json.dump(self.calendar, f, indent=2, default=str)
+        self._write_calendar_file(self.calendar)
+
+    def _write_calendar_file(self, calendar: Dict[str, Any]) -> None:
+        """Write calendar data atomically (write a temp file, then rename over)."""
+        tmp_file = self.calendar_file.with_suffix(".json.tmp")
+        tmp_file.write_bytes(_dump_json(calendar))
+        os.replace(tmp_file, self.calendar_file)
+
+    def _scheduled_index(self) -> Tuple[List[float], List[Dict[str, Any]]]:
+        """Get scheduled timestamps in ascending order with their items."""
+        scheduled = self.calendar.get("scheduled", [])
+        source, size = self._scheduled_source
+        if source is not scheduled or size != len(scheduled):
+            pairs = sorted(
+                ((datetime.fromisoformat(item["scheduled_time"]).timestamp(), item) for item in scheduled),
+                key=lambda pair: pair[0]
+            )
+            self._scheduled_times = [ts for ts, _ in pairs]
+            self._scheduled_by_time = [item for _, item in pairs]
+            self._scheduled_source = (scheduled, len(scheduled))
+        return self._scheduled_times, self._scheduled_by_time
+
+    def _slug_index(self) -> Dict[str, List[int]]:
+        """Get positions in ``calendar["scheduled"]`` for each slug."""
+        scheduled = self.calendar.get("scheduled", [])
+        source, size = self._slug_source
+        if source is not scheduled or size != len(scheduled):
+            self._slug_positions = {}
+            for pos, item in enumerate(scheduled):
+                self._slug_positions.setdefault(item["slug"], []).append(pos)
+            self._slug_source = (scheduled, len(scheduled))
+        return self._slug_positions
+
+    def _published_index(self) -> Tuple[List[float], List[int], List[int]]:
+        """Get published timestamps, weekdays and hours, parallel to ``calendar["published"]``."""
+        published = self.calendar.get("published", [])
+        source, size = self._published_source
+        if source is not published or size != len(published):
+            self._published_times, self._published_weekdays, self._published_hours = [], [], []
+            for item in published:
+                self._append_published_time(
+                    datetime.fromisoformat(item.get("published_time", item.get("scheduled_time")))
+                )
+            self._published_source = (published, len(published))
+        return self._published_times, self._published_weekdays, self._published_hours
+
+    def _append_published_time(self, published_time: datetime) -> None:
+        self._published_times.append(published_time.timestamp())
+        self._published_weekdays.append(published_time.weekday())
+        self._published_hours.append(published_time.hour)
+
+    def _get_avoid_holidays(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Get holidays with the "avoid" strategy, grouped by date."""
+        holidays = self.calendar.get("holidays", [])
+        source, size = self._holidays_source
+        if source is not holidays or size != len(holidays):
+            self._avoid_holidays = {}
+            for holiday in holidays:
+                if holiday.get("strategy") == "avoid":
+                    self._avoid_holidays.setdefault(holiday["date"], []).append(holiday)
+            self._holidays_source = (holidays, len(holidays))
+        return self._avoid_holidays
+
+    def _add_scheduled(self, item: Dict[str, Any], ts: float) -> None:
+        """Append a scheduled item and add it to the time and slug indexes."""
+        times, items = self._scheduled_index()
+        pos = bisect_right(times, ts)
+        times.insert(pos, ts)
+        items.insert(pos, item)
+
+        slug_positions = self._slug_index()
+        scheduled = self.calendar["scheduled"]
+        scheduled.append(item)
+        slug_positions.setdefault(item["slug"], []).append(len(scheduled) - 1)
+        self._scheduled_source = self._slug_source = (scheduled, len(scheduled))
+
+    def _remove_scheduled(self, slug: str) -> Optional[Dict[str, Any]]:
+        """Remove and return the scheduled item for a slug, if any."""
+        times, by_time = self._scheduled_index()
+        slug_positions = self._slug_index()
+        scheduled_items = self.calendar.get("scheduled", [])
+
+        positions = slug_positions.get(slug)
+        if not positions:
+            return None
+
+        # Swap-remove: move the last item into the freed position
+        i = min(positions)
+        positions.remove(i)
+        if not positions:
+            del slug_positions[slug]
+        item = scheduled_items[i]
+        last_item = scheduled_items.pop()
+        if i < len(scheduled_items):
+            scheduled_items[i] = last_item
+            moved = slug_positions[last_item["slug"]]
+            moved[moved.index(len(scheduled_items))] = i
+        self._slug_source = (scheduled_items, len(scheduled_items))
+
+        # Drop it from the time index (equal timestamps are disambiguated by identity)
+        pos = bisect_left(times, datetime.fromisoformat(item["scheduled_time"]).timestamp())
+        while by_time[pos] is not item:
+            pos += 1
+        del times[pos], by_time[pos]
+        self._scheduled_source = (scheduled_items, len(scheduled_items))
+        return item
+
+    def _add_published(self, item: Dict[str, Any], published_time: datetime) -> None:
+        """Append a published item and add it to the published index."""
+        self._published_index()
+        published = self.calendar["published"]
+        published.append(item)
+        self._append_published_time(published_time)
+        self._published_source = (published, len(published))
+
+    def _mark_dirty(self) -> None:
+        """Record a calendar change, saving now unless a batch is open."""
+        self._dirty = True
+        if not self._batch_depth:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the calendar if it has unsaved changes."""
+        if self._dirty:
+            self._save_calendar()
+            self._dirty = False
+
+    def close(self) -> None:
+        """Write any unsaved changes; subclasses also release their storage."""
+        self.flush()
 
     def _load_templates(self) -> Dict[str, Any]:
         """Load scheduling templates."""
         if not self.templates_file.exists():
             # Create default templates
-            default_templates = {
-                "daily": {
-                    "name": "Daily Upload",
-                    "frequency": "daily",
-                    "times": ["09:00", "18:00"],
-                    "timezone": "UTC",
-                    "active": False
-                },
-                "weekday": {
-                    "name": "Weekday Upload",
-                    "frequency": "weekday",
-                    "days": ["monday", "wednesday", "friday"],
-                    "time": "15:00",
-                    "timezone": "UTC",
-                    "active": True
-                },
-                "weekend": {
-                    "name": "Weekend Special",
-                    "frequency": "weekly",
-                    "days": ["saturday"],
-                    "time": "12:00",
-                    "timezone": "UTC",
-                    "active": False
-                },
-                "optimal": {
-                    "name": "Optimal Times",
-                    "frequency": "custom",
-                    "schedule": {
-                        "monday": ["09:00", "17:00"],
-                        "tuesday": ["10:00", "19:00"],
-                        "wednesday": ["09:00", "18:00"],
-                        "thursday": ["10:00", "20:00"],
-                        "friday": ["09:00", "17:00"],
-                        "saturday": ["11:00"],
-                        "sunday": ["12:00", "20:00"]
-                    },
-                    "timezone": "UTC",
-                    "active": False
-                }
-            }
-            self.templates_file.write_text(json.dumps(default_templates, indent=2))
+            self.templates_file.write_bytes(_default_templates_json())
             logger.info(f"Created default templates at {self.templates_file}")
 
-        with open(self.templates_file, 'r') as f:
-            return json.load(f)
-
-    def _get_default_holidays(self) -> List[Dict[str, str]]:
-        """Get default holiday schedule."""
-        current_year = datetime.now().year
-        return [
-            {"date": f"{current_year}-01-01", "name": "New Year's Day", "strategy": "avoid"},
-            {"date": f"{current_year}-02-14", "name": "Valentine's Day", "strategy": "themed"},
-            {"date": f"{current_year}-03-17", "name": "St. Patrick's Day", "strategy": "themed"},
-            {"date": f"{current_year}-07-04", "name": "Independence Day", "strategy": "avoid"},
-            {"date": f"{current_year}-10-31", "name": "Halloween", "strategy": "themed"},
-            {"date": f"{current_year}-11-11", "name": "Veterans Day", "strategy": "special"},
-            {"date": f"{current_year}-12-25", "name": "Christmas", "strategy": "avoid"},
-            {"date": f"{current_year}-12-31", "name": "New Year's Eve", "strategy": "special"}
-        ]
+        return _read_json(self.templates_file)
 
     def get_optimal_publish_time(
         self,
@@ -137,46 +394,16 @@ class ContentCalendar:
         Returns:
             Optimal publishing datetime
         """
-        # Default optimal times by day of week (in local timezone)
-        optimal_times = {
-            0: [9, 17],      # Monday
-            1: [10, 19],     # Tuesday
-            2: [9, 18],      # Wednesday
-            3: [10, 20],     # Thursday
-            4: [9, 17],      # Friday
-            5: [11, 15],     # Saturday
-            6: [12, 20]      # Sunday
-        }
-
-        # Niche-specific adjustments
-        niche_adjustments = {
-            "gaming": 2,      # Later in the day
-            "education": -1,  # Earlier in the day
-            "entertainment": 1,  # Slightly later
-            "business": -2,   # Much earlier
-            "lifestyle": 0    # No adjustment
-        }
-
-        day_of_week = date.weekday()
-        base_hours = optimal_times.get(day_of_week, [9, 17])
-
-        # Apply niche adjustment
-        adjustment = niche_adjustments.get(niche, 0)
-        adjusted_hours = [h + adjustment for h in base_hours]
-
-        # Pick the first available slot
-        optimal_hour = adjusted_hours[0] if datetime.now().hour < adjusted_hours[0] else adjusted_hours[-1]
+        optimal_hour = _optimal_hour(date.weekday(), niche, datetime.now().hour)
 
         # Create datetime with optimal time
-        optimal_dt = date.replace(
-            hour=optimal_hour % 24,
+        return date.replace(
+            hour=optimal_hour,
             minute=0,
             second=0,
             microsecond=0
         )
 
-        return optimal_dt
-
     def schedule_content(
         self,
         slug: str,
@@ -195,6 +422,8 @@ class ContentCalendar:
         Returns:
             Scheduling confirmation
         """
+        now = datetime.now(timezone.utc)
+
         # Use template if provided
         if template and template in self.templates:
             template_config = self.templates[template]
@@ -205,7 +434,7 @@ class ContentCalendar:
         # Use optimal time if no date provided
         if not publish_date:
             publish_date = self.get_optimal_publish_time(
-                datetime.now(timezone.utc) + timedelta(days=1),
+                now + timedelta(days=1),
                 niche=metadata.get("niche") if metadata else None
             )
 
@@ -223,11 +452,11 @@ class ContentCalendar:
             "status": "scheduled",
             "template": template,
             "metadata": metadata or {},
-            "created_at": datetime.now(timezone.utc).isoformat()
+            "created_at": now.isoformat()
         }
 
-        self.calendar["scheduled"].append(scheduled_item)
-        self._save_calendar()
+        self._add_scheduled(scheduled_item, publish_date.timestamp())
+        self._mark_dirty()
 
         logger.info(f"Scheduled {slug} for {publish_date}")
 
@@ -238,6 +467,18 @@ class ContentCalendar:
             "status": "scheduled"
         }
 
+    def bulk_schedule(self, items: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Schedule several items, writing the calendar once.
+
+        Args:
+            items: Keyword arguments for ``schedule_content``, one dict per item
+
+        Returns:
+            Scheduling confirmations in input order
+        """
+        with self:
+            return [self.schedule_content(**item) for item in items]
+
     def _get_next_template_slot(self, template: Dict[str, Any]) -> datetime:
         """Get next available slot based on template.
 
@@ -267,19 +508,15 @@ class ContentCalendar:
             time_str = template.get("time", "09:00")
             hour, minute = map(int, time_str.split(":"))
 
-            # Find next matching weekday
-            days_map = {
-                "monday": 0, "tuesday": 1, "wednesday": 2,
-                "thursday": 3, "friday": 4, "saturday": 5, "sunday": 6
-            }
-
-            for i in range(7):
-                check_date = now + timedelta(days=i)
-                day_name = list(days_map.keys())[check_date.weekday()]
-                if day_name in days:
-                    slot = check_date.replace(hour=hour, minute=minute, second=0, microsecond=0)
-                    if slot > now:
-                        return slot
+            # Find next matching weekday within the coming 7 days; today only
+            # counts if its slot is still ahead
+            today_passed = now.replace(hour=hour, minute=minute, second=0, microsecond=0) <= now
+            offsets = [
+                (_DAYS_MAP[day] - now.weekday()) % 7 for day in days if day in _DAYS_MAP
+            ]
+            offsets = [offset for offset in offsets if offset or not today_passed]
+            if offsets:
+                return (now + timedelta(days=min(offsets))).replace(hour=hour, minute=minute, second=0, microsecond=0)
 
         return now + timedelta(days=1)  # Default to tomorrow
 
@@ -295,25 +532,24 @@ class ContentCalendar:
         conflicts = []
 
         # Check for same-day posts (within 4 hours)
-        for item in self.calendar.get("scheduled", []):
-            scheduled_time = datetime.fromisoformat(item["scheduled_time"])
-            time_diff = abs((scheduled_time - publish_date).total_seconds())
-            if time_diff < 4 * 3600:  # Within 4 hours
-                conflicts.append({
-                    "type": "time_proximity",
-                    "item": item["slug"],
-                    "scheduled_time": scheduled_time
-                })
+        times, items = self._scheduled_index()
+        ts = publish_date.timestamp()
+        lo = bisect_right(times, ts - 4 * 3600)
+        hi = bisect_left(times, ts + 4 * 3600)
+        for item in items[lo:hi]:
+            conflicts.append({
+                "type": "time_proximity",
+                "item": item["slug"],
+                "scheduled_time": datetime.fromisoformat(item["scheduled_time"])
+            })
 
         # Check for holiday conflicts
-        date_str = publish_date.strftime("%Y-%m-%d")
-        for holiday in self.calendar.get("holidays", []):
-            if holiday["date"] == date_str and holiday.get("strategy") == "avoid":
-                conflicts.append({
-                    "type": "holiday",
-                    "name": holiday["name"],
-                    "strategy": holiday["strategy"]
-                })
+        for holiday in self._get_avoid_holidays().get(publish_date.date().isoformat(), ()):
+            conflicts.append({
+                "type": "holiday",
+                "name": holiday["name"],
+                "strategy": holiday["strategy"]
+            })
 
         return conflicts
 
@@ -332,17 +568,27 @@ class ContentCalendar:
             Next available datetime
         """
         current_date = start_date
+        end_date = start_date + timedelta(days=max_days)
+        times, _ = self._scheduled_index()
 
-        for _ in range(max_days * 4):  # Check 4 slots per day
+        while current_date < end_date:
             conflicts = self._check_scheduling_conflicts(current_date)
             if not conflicts:
                 return current_date
 
-            # Try next slot (6 hours later)
-            current_date += timedelta(hours=6)
+            # Jump past the conflicts instead of stepping: 4 hours after the
+            # last nearby item, or the same time the next day for a holiday
+            next_date = current_date
+            if any(c["type"] == "time_proximity" for c in conflicts):
+                ts = current_date.timestamp()
+                last_ts = times[bisect_left(times, ts + 4 * 3600) - 1]
+                next_date = current_date + timedelta(seconds=last_ts + 4 * 3600 - ts)
+            if any(c["type"] == "holiday" for c in conflicts):
+                next_date = max(next_date, current_date + timedelta(days=1))
+            current_date = next_date
 
         # If no slot found, return original date + max_days
-        return start_date + timedelta(days=max_days)
+        return end_date
 
     def get_upcoming_schedule(
         self,
@@ -358,25 +604,24 @@ class ContentCalendar:
         Returns:
             List of scheduled items
         """
-        cutoff_date = datetime.now(timezone.utc) + timedelta(days=days_ahead)
-        upcoming = []
+        now_ts = time.time()
+        cutoff_ts = now_ts + days_ahead * 86400
 
-        # Get scheduled items
-        for item in self.calendar.get("scheduled", []):
-            scheduled_time = datetime.fromisoformat(item["scheduled_time"])
-            if datetime.now(timezone.utc) <= scheduled_time <= cutoff_date:
-                upcoming.append(item)
+        # Get scheduled items (already in time order)
+        times, items = self._scheduled_index()
+        upcoming = items[bisect_left(times, now_ts):bisect_right(times, cutoff_ts)]
 
         # Include recently published if requested
         if include_published:
-            cutoff_past = datetime.now(timezone.utc) - timedelta(days=7)
-            for item in self.calendar.get("published", []):
-                published_time = datetime.fromisoformat(item.get("published_time", item.get("scheduled_time")))
-                if cutoff_past <= published_time <= datetime.now(timezone.utc):
-                    upcoming.append(item)
+            cutoff_past_ts = now_ts - 7 * 86400
+            upcoming.extend(
+                item
+                for item, published_ts in zip(self.calendar.get("published", []), self._published_index()[0])
+                if cutoff_past_ts <= published_ts <= now_ts
+            )
 
-        # Sort by time
-        upcoming.sort(key=lambda x: x.get("scheduled_time", x.get("published_time")))
+            # Sort by time
+            upcoming.sort(key=lambda x: x.get("scheduled_time", x.get("published_time")))
 
         return upcoming
 
@@ -399,31 +644,24 @@ class ContentCalendar:
             Success status
         """
         # Find in scheduled items
-        scheduled_items = self.calendar.get("scheduled", [])
-        published_item = None
-
-        for i, item in enumerate(scheduled_items):
-            if item["slug"] == slug:
-                published_item = item
-                scheduled_items.pop(i)
-                break
-
+        published_item = self._remove_scheduled(slug)
         if not published_item:
             logger.warning(f"Scheduled item not found: {slug}")
             return False
 
         # Update item
+        now = datetime.now(timezone.utc)
         published_item.update({
             "status": "published",
-            "published_time": datetime.now(timezone.utc).isoformat(),
+            "published_time": now.isoformat(),
             "video_id": video_id,
             "url": url,
             "analytics": analytics or {}
         })
 
         # Move to published
-        self.calendar["published"].append(published_item)
-        self._save_calendar()
+        self._add_published(published_item, now)
+        self._mark_dirty()
 
         logger.info(f"Marked {slug} as published")
         return True
@@ -439,42 +677,35 @@ class ContentCalendar:
         if not published:
             return {"status": "no_data"}
 
-        # Analyze by day of week
-        day_performance = {i: [] for i in range(7)}
-        hour_performance = {i: [] for i in range(24)}
-
-        for item in published:
-            published_time = datetime.fromisoformat(item.get("published_time", item["scheduled_time"]))
-            analytics = item.get("analytics", {})
+        # Sum and count views in first 24h by day of week and hour, in one
+        # pass. Views are read from the items since analytics are updated
+        # after publishing; weekday and hour come from the published index.
+        _, weekdays, hours = self._published_index()
+        day_sum, day_count = [0] * 7, [0] * 7
+        hour_sum, hour_count = [0] * 24, [0] * 24
+        total_views = 0
 
-            # Get performance metric (views in first 24h)
-            performance = analytics.get("views_24h", 0)
+        for item, day, hour in zip(published, weekdays, hours):
+            performance = item.get("analytics", {}).get("views_24h", 0)
 
-            day_performance[published_time.weekday()].append(performance)
-            hour_performance[published_time.hour].append(performance)
+            day_sum[day] += performance
+            day_count[day] += 1
+            hour_sum[hour] += performance
+            hour_count[hour] += 1
+            total_views += performance
 
         # Calculate averages
-        best_days = []
-        for day, performances in day_performance.items():
-            if performances:
-                avg = sum(performances) / len(performances)
-                best_days.append((day, avg))
-
+        best_days = [(day, day_sum[day] / n) for day, n in enumerate(day_count) if n]
         best_days.sort(key=lambda x: x[1], reverse=True)
 
-        best_hours = []
-        for hour, performances in hour_performance.items():
-            if performances:
-                avg = sum(performances) / len(performances)
-                best_hours.append((hour, avg))
-
+        best_hours = [(hour, hour_sum[hour] / n) for hour, n in enumerate(hour_count) if n]
         best_hours.sort(key=lambda x: x[1], reverse=True)
 
         return {
             "total_published": len(published),
             "best_days": best_days[:3],
             "best_hours": best_hours[:3],
-            "average_views_24h": sum(item.get("analytics", {}).get("views_24h", 0) for item in published) / len(published) if published else 0,
+            "average_views_24h": total_views / len(published),
             "recommendations": self._generate_schedule_recommendations(best_days, best_hours)
         }
 
@@ -507,11 +738,10 @@ class ContentCalendar:
         # Check for consistency
         published = self.calendar.get("published", [])
         if len(published) > 10:
-            # Calculate posting frequency
-            dates = [datetime.fromisoformat(item.get("published_time", item["scheduled_time"])) for item in published[-10:]]
-            dates.sort()
+            # Calculate posting frequency (whole days between posts)
+            timestamps = sorted(self._published_index()[0][-10:])
 
-            gaps = [(dates[i+1] - dates[i]).days for i in range(len(dates)-1)]
+            gaps = [int((timestamps[i+1] - timestamps[i]) // 86400) for i in range(len(timestamps)-1)]
             avg_gap = sum(gaps) / len(gaps) if gaps else 0
 
             if avg_gap > 3:
@@ -531,46 +761,70 @@ class ContentCalendar:
         executed = []
         failed = []
 
-        for item in self.calendar.get("scheduled", []):
-            scheduled_time = datetime.fromisoformat(item["scheduled_time"])
+        # Snapshot due items, since publishing removes them from the schedule
+        times, items = self._scheduled_index()
+        candidates = items[:bisect_right(times, now.timestamp())]
+
+        # One directory listing instead of an exists() call per item
+        existing: set = set()
+        if candidates:
+            try:
+                existing = set(os.listdir(self.config.directories.content_dir))
+            except FileNotFoundError:
+                pass
+
+        due_items = []
+        for item in candidates:
+            if item["slug"] not in existing:
+                logger.error(f"Content directory not found for scheduled upload: {item['slug']}")
+                failed.append(item["slug"])
+            else:
+                due_items.append(item)
+
+        if due_items and not self.config.webhooks.get("scheduled_upload_url"):
+            logger.warning("Scheduled upload webhook not configured")
+            due_items = []
+
+        # Trigger uploads via webhook concurrently
+        semaphore = asyncio.Semaphore(self.config.performance.max_concurrent_requests)
+
+        async def upload(item: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.n8n_client.execute_webhook(
+                    self.config.webhooks.scheduled_upload_url,
+                    {
+                        "slug": item["slug"],
+                        "scheduled_time": item["scheduled_time"],
+                        "metadata": item.get("metadata", {})
+                    },
+                    timeout=60
+                )
 
-            if scheduled_time <= now:
-                slug = item["slug"]
-                content_dir = self.config.directories.content_dir / slug
+        responses = await asyncio.gather(*(upload(item) for item in due_items), return_exceptions=True)
 
-                if not content_dir.exists():
-                    logger.error(f"Content directory not found for scheduled upload: {slug}")
+        # Published items are written once after the whole run. Cancellation
+        # (a BaseException) is re-raised only after the finished uploads are saved.
+        interrupted: Optional[BaseException] = None
+        with self:
+            for item, response in zip(due_items, responses):
+                slug = item["slug"]
+                if isinstance(response, BaseException):
+                    if not isinstance(response, Exception):
+                        interrupted = interrupted or response
+                    logger.error(f"Failed to execute scheduled upload for {slug}: {response!r}")
                     failed.append(slug)
-                    continue
-
-                # Trigger upload via webhook
-                if self.config.webhooks.get("scheduled_upload_url"):
-                    try:
-                        response = await self.n8n_client.execute_webhook(
-                            self.config.webhooks.scheduled_upload_url,
-                            {
-                                "slug": slug,
-                                "scheduled_time": item["scheduled_time"],
-                                "metadata": item.get("metadata", {})
-                            },
-                            timeout=60
-                        )
-
-                        if response.get("success"):
-                            self.mark_as_published(
-                                slug,
-                                video_id=response.get("video_id"),
-                                url=response.get("url")
-                            )
-                            executed.append(slug)
-                        else:
-                            failed.append(slug)
-
-                    except Exception as e:
-                        logger.error(f"Failed to execute scheduled upload for {slug}: {e}")
-                        failed.append(slug)
+                elif response.get("success"):
+                    self.mark_as_published(
+                        slug,
+                        video_id=response.get("video_id"),
+                        url=response.get("url")
+                    )
+                    executed.append(slug)
                 else:
-                    logger.warning("Scheduled upload webhook not configured")
+                    failed.append(slug)
+
+        if interrupted is not None:
+            raise interrupted
 
         return {
             "executed": executed,
@@ -579,6 +833,131 @@ class ContentCalendar:
         }
 
 
+class ContentCalendarSQLite(ContentCalendar):
+    """Content calendar with scheduled and published items stored in SQLite.
+
+    Scheduling and publishing become single-row inserts and deletes instead
+    of rewriting ``schedule.json``. Holidays, drafts and recurring entries
+    stay in the JSON file. Items are loaded into the same in-memory indexes
+    as ``ContentCalendar``, so scheduling logic is shared; use
+    ``export_json`` to write a complete ``schedule.json`` for interchange,
+    or before switching back to the JSON backend: once imported, the items
+    are removed from ``schedule.json`` so stale copies can't resurface.
+    """
+
+    def __init__(self, config: AppConfig):
+        """Initialize content calendar.
+
+        Args:
+            config: Application configuration
+        """
+        self.db_path = config.directories.data_dir / "calendar" / "schedule.db"
+        # Row id for each loaded item, keyed by id(item)
+        self._row_ids: Dict[int, int] = {}
+        super().__init__(config)
+
+    def _load_calendar(self) -> Dict[str, Any]:
+        """Load content calendar, importing JSON items into a new database."""
+        calendar = super()._load_calendar()
+
+        is_new = not self.db_path.exists()
+        self._db = sqlite3.connect(self.db_path)
+        self._init_db()
+
+        if is_new:
+            for item in calendar.get("scheduled", []):
+                self._insert_row("scheduled", item, datetime.fromisoformat(item["scheduled_time"]).timestamp())
+            for item in calendar.get("published", []):
+                published_time = item.get("published_time", item.get("scheduled_time"))
+                self._insert_row("published", item, datetime.fromisoformat(published_time).timestamp())
+            self._db.commit()
+            # The database is now the only copy of the items
+            self._write_calendar_file({**calendar, "scheduled": [], "published": []})
+            logger.info(f"Created calendar database at {self.db_path}")
+
+        self._row_ids.clear()
+        calendar["scheduled"] = self._select_items("scheduled")
+        calendar["published"] = self._select_items("published")
+        return calendar
+
+    def _init_db(self) -> None:
+        """Create calendar tables (rows are kept in insertion order by id)."""
+        for table in ("scheduled", "published"):
+            self._db.execute(f"""
+                CREATE TABLE IF NOT EXISTS {table} (
+                    id INTEGER PRIMARY KEY,
+                    slug TEXT NOT NULL,
+                    ts REAL NOT NULL,
+                    item BLOB NOT NULL
+                )
+            """)
+        self._db.commit()
+
+    def _insert_row(self, table: str, item: Dict[str, Any], ts: float) -> int:
+        cursor = self._db.execute(
+            f"INSERT INTO {table} (slug, ts, item) VALUES (?, ?, ?)",
+            (item["slug"], ts, _dump_json(item, indent=False))
+        )
+        return cursor.lastrowid
+
+    def _select_items(self, table: str) -> List[Dict[str, Any]]:
+        items = []
+        for row_id, data in self._db.execute(f"SELECT id, item FROM {table} ORDER BY id"):
+            item = _loads(data)
+            self._row_ids[id(item)] = row_id
+            items.append(item)
+        return items
+
+    def _add_scheduled(self, item: Dict[str, Any], ts: float) -> None:
+        super()._add_scheduled(item, ts)
+        self._row_ids[id(item)] = self._insert_row("scheduled", item, ts)
+
+    def _remove_scheduled(self, slug: str) -> Optional[Dict[str, Any]]:
+        item = super()._remove_scheduled(slug)
+        row_id = self._row_ids.pop(id(item), None) if item is not None else None
+        if row_id is not None:
+            self._db.execute("DELETE FROM scheduled WHERE id = ?", (row_id,))
+        return item
+
+    def _add_published(self, item: Dict[str, Any], published_time: datetime) -> None:
+        super()._add_published(item, published_time)
+        self._row_ids[id(item)] = self._insert_row("published", item, published_time.timestamp())
+
+    def _save_calendar(self) -> None:
+        """Commit pending calendar changes."""
+        self._db.commit()
+
+    def export_json(self) -> Path:
+        """Write the full calendar, including all items, to ``schedule.json``.
+
+        Returns:
+            Path to the written calendar file
+        """
+        super()._save_calendar()
+        return self.calendar_file
+
+    def close(self) -> None:
+        """Commit pending changes and close the database."""
+        self.flush()
+        self._db.close()
+
+
+def open_calendar(config: AppConfig) -> ContentCalendar:
+    """Open the content calendar with the configured storage backend.
+
+    Args:
+        config: Application configuration
+
+    Returns:
+        ``ContentCalendarSQLite`` if the ``calendar_sqlite`` feature is
+        enabled, otherwise the JSON-backed ``ContentCalendar``. Call
+        ``close()`` when done (e.g. via ``contextlib.closing``).
+    """
+    if config.features.get("calendar_sqlite"):
+        return ContentCalendarSQLite(config)
+    return ContentCalendar(config)
+
+
 async def schedule_content(
     config: AppConfig,
     slug: str,
@@ -602,41 +981,40 @@ async def schedule_content(
         logger.info("Content calendar feature is disabled")
         return {"status": "disabled"}
 
-    calendar = ContentCalendar(config)
-
     # Load metadata
     content_dir = config.directories.content_dir / slug
     metadata_path = content_dir / "metadata.json"
 
-    metadata = {}
-    if metadata_path.exists():
-        with open(metadata_path, 'r') as f:
-            metadata = json.load(f)
+    try:
+        metadata = _read_json(metadata_path)
+    except FileNotFoundError:
+        metadata = {}
 
-    if dry_run:
-        # Simulate scheduling
-        if not publish_date:
-            publish_date = calendar.get_optimal_publish_time(
-                datetime.now(timezone.utc) + timedelta(days=1),
-                niche=metadata.get("niche")
-            )
-
-        return {
-            "status": "dry_run",
-            "would_schedule": {
-                "slug": slug,
-                "publish_date": publish_date.isoformat(),
-                "template": template
+    with closing(open_calendar(config)) as calendar:
+        if dry_run:
+            # Simulate scheduling
+            if not publish_date:
+                publish_date = calendar.get_optimal_publish_time(
+                    datetime.now(timezone.utc) + timedelta(days=1),
+                    niche=metadata.get("niche")
+                )
+
+            return {
+                "status": "dry_run",
+                "would_schedule": {
+                    "slug": slug,
+                    "publish_date": publish_date.isoformat(),
+                    "template": template
+                }
             }
-        }
 
-    # Actually schedule
-    result = calendar.schedule_content(
-        slug,
-        publish_date=publish_date,
-        template=template,
-        metadata=metadata
-    )
+        # Actually schedule
+        result = calendar.schedule_content(
+            slug,
+            publish_date=publish_date,
+            template=template,
+            metadata=metadata
+        )
 
     return result
 
@@ -656,14 +1034,13 @@ def get_publishing_schedule(
     Returns:
         Schedule and optional analytics
     """
-    calendar = ContentCalendar(config)
-
-    result = {
-        "upcoming": calendar.get_upcoming_schedule(days_ahead),
-        "timestamp": datetime.now(timezone.utc).isoformat()
-    }
+    with closing(open_calendar(config)) as calendar:
+        result = {
+            "upcoming": calendar.get_upcoming_schedule(days_ahead),
+            "timestamp": datetime.now(timezone.utc).isoformat()
+        }
 
-    if analyze:
-        result["analytics"] = calendar.analyze_publishing_patterns()
+        if analyze:
+            result["analytics"] = calendar.analyze_publishing_patterns()
 
     return result
\ No newline at end of file
@@ -2,21 +2,226 @@
 
 from __future__ import annotations
 
+import atexit
 import hashlib
 import json
 import logging
+import math
+import os
 import pickle
+import shutil
 import sqlite3
+import struct
+import threading
 import time
+import weakref
+import zlib
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional, Union
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
 
 from ..core.config import AppConfig
 from ..core.errors import CacheError
 
 logger = logging.getLogger(__name__)
 
+# Number of SQLite files the cache is spread over (a power of two); keys are
+# routed by crc32(key) so writers to different shards don't contend
+_SHARD_COUNT = 16
+
+# Memory cache snapshots older than this are ignored on startup
+_MEMORY_SNAPSHOT_MAX_AGE = 300
+
+# Snapshot files already loaded by this process. Only the first manager on
+# a cache_dir warms from the snapshot; later ones would otherwise resurrect
+# values that have since been overwritten or deleted on disk.
+_LOADED_SNAPSHOTS: set[Path] = set()
+_LOADED_SNAPSHOTS_LOCK = threading.Lock()
+
+# UPDATE ... RETURNING needs SQLite 3.35+
+_SQLITE_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# Cache statements, kept as constants so sqlite3's statement cache reuses
+# the compiled form (it is keyed on SQL text). Values live in the blobs
+# table keyed by digest; rows written before that have value set inline.
+_SQL_VALUE = "COALESCE(value, (SELECT data FROM blobs WHERE blobs.digest = cache.digest))"
+_SQL_SELECT = f"SELECT {_SQL_VALUE}, expires_at FROM cache WHERE key = ? AND expires_at > ?"
+_SQL_HIT = "UPDATE cache SET hit_count = hit_count + 1 WHERE key = ?"
+_SQL_HIT_RETURNING = f"""
+    UPDATE cache SET hit_count = hit_count + 1
+    WHERE key = ? AND expires_at > ?
+    RETURNING {_SQL_VALUE}, expires_at
+"""
+_SQL_BLOB_INSERT = "INSERT OR IGNORE INTO blobs (digest, data, refcount) VALUES (?, ?, 0)"
+_SQL_BLOB_INCREF = "UPDATE blobs SET refcount = refcount + 1 WHERE digest = ?"
+_SQL_UPSERT = """
+    INSERT OR REPLACE INTO cache
+    (key, digest, created_at, expires_at, size_bytes)
+    VALUES (?, ?, ?, ?, ?)
+"""
+_SQL_DELETE = "DELETE FROM cache WHERE key = ?"
+# Expiry sweeps delete at most _SWEEP_BATCH rows per transaction, walking
+# idx_expires from the oldest entry, so writers get the lock in between
+_SWEEP_BATCH = 1000
+_SQL_DELETE_EXPIRED = f"""
+    DELETE FROM cache WHERE rowid IN (
+        SELECT rowid FROM cache WHERE expires_at <= ?
+        ORDER BY expires_at LIMIT {_SWEEP_BATCH}
+    )
+"""
+
+
+# Memory cache hit counters saturate at one byte and are halved once all of
+# them reach the upper half
+_MAX_HIT_COUNTER = 255
+_HALVE_COUNTERS_AT = 128
+
+# FileCache Bloom filter size (128 KiB); each key sets two bits taken from
+# its SHA-256 file name, about 1% false positives at 70k files
+_BLOOM_BITS = 1 << 20
+
+
+def _bloom_bits(key_hash: str) -> tuple[int, int]:
+    """Two 20-bit filter positions from a hex SHA-256 digest."""
+    return int(key_hash[:5], 16), int(key_hash[5:10], 16)
+
+
+# Argument types whose repr is a stable cache key on its own
+_KEY_SCALAR_TYPES = {str, int, float, bool, type(None)}
+
+# Serialized values carry a one-byte tag: JSON for plain JSON-native data,
+# pickle for everything else. Untagged blobs are legacy pickles.
+_TAG_JSON = b"J"
+_TAG_PICKLE = b"P"
+# FileCache only: protocol 5 pickle stream, then its out-of-band buffers,
+# then each buffer length (u64) and the buffer count (u32)
+_TAG_PICKLE_OOB = b"O"
+_JSON_SCALAR_TYPES = {str, int, bool, type(None)}
+
+
+def _is_json_native(value: Any) -> bool:
+    """Check that value survives a JSON round trip with its exact types."""
+    value_type = type(value)
+    if value_type in _JSON_SCALAR_TYPES:
+        return True
+    if value_type is float:
+        return math.isfinite(value)
+    if value_type is list:
+        return all(_is_json_native(v) for v in value)
+    if value_type is dict:
+        return all(type(k) is str and _is_json_native(v) for k, v in value.items())
+    return False
+
+
+def _encode(value: Any) -> bytes:
+    """Serialize a cache value, preferring orjson over pickle."""
+    if ORJSON_AVAILABLE and _is_json_native(value):
+        try:
+            return _TAG_JSON + orjson.dumps(value)
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits
+    return _TAG_PICKLE + pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _decode(blob: bytes) -> Any:
+    """Deserialize a value written by _encode (or a legacy pickle)."""
+    tag = blob[:1]
+    if tag == _TAG_JSON:
+        data = memoryview(blob)[1:]
+        return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(bytes(data))
+    if tag == _TAG_PICKLE:
+        return pickle.loads(memoryview(blob)[1:])
+    if tag == _TAG_PICKLE_OOB:
+        return _decode_oob(memoryview(blob))
+    return pickle.loads(blob)
+
+
+def _dump_oob(value: Any, f: BinaryIO) -> None:
+    """Stream a protocol 5 pickle of value to f, buffers written out-of-band."""
+    buffers: list[pickle.PickleBuffer] = []
+    f.write(_TAG_PICKLE_OOB)
+    pickle.dump(value, f, protocol=5, buffer_callback=buffers.append)
+    
+    lengths = []
+    for buffer in buffers:
+        raw = buffer.raw()
+        f.write(raw)
+        lengths.append(raw.nbytes)
+    f.write(struct.pack(f"<{len(lengths)}QI", *lengths, len(lengths)))
+
+
+def _decode_oob(data: memoryview) -> Any:
+    """Load a _dump_oob payload, handing pickle slices of data as its buffers."""
+    (count,) = struct.unpack_from("<I", data, len(data) - 4)
+    trailer = len(data) - 4 - 8 * count
+    lengths = struct.unpack_from(f"<{count}Q", data, trailer)
+    
+    buffers = []
+    end = trailer
+    for length in reversed(lengths):
+        buffers.append(data[end - length:end])
+        end -= length
+    buffers.reverse()
+    
+    return pickle.loads(data[1:end], buffers=buffers)
+
+
+# ioctl request number for FICLONE (reflink a whole file) on Linux
+_FICLONE = 0x40049409
+
+
+def _clone_or_copy(src: Path, dst: Path) -> None:
+    """Copy src to dst, sharing data extents where the filesystem allows.
+    
+    Tries a FICLONE reflink (btrfs, XFS), then copy_file_range (an in-kernel
+    copy that some filesystems also reflink), then shutil.copy2. Hardlinks
+    are deliberately not used: TTS chunk files are rewritten in place, which
+    would change the cached audio through the shared inode.
+    """
+    if FCNTL_AVAILABLE and hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                try:
+                    fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+                except OSError:
+                    remaining = os.fstat(fsrc.fileno()).st_size
+                    while remaining > 0:
+                        copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                        if copied == 0:
+                            break
+                        remaining -= copied
+            shutil.copystat(src, dst)
+            return
+        except OSError:
+            pass  # e.g. EXDEV on older kernels; fall back to a plain copy
+    
+    shutil.copy2(src, dst)
+
+
+@contextmanager
+def _immediate_transaction(conn: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    """Run a block in a BEGIN IMMEDIATE transaction on an autocommit connection."""
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
 
 class CacheManager:
     """Manages caching for various data types."""
@@ -26,32 +231,116 @@ class CacheManager:
         self.cache_dir = config.directories.cache_dir
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         
-        # Initialize SQLite cache for structured data
-        self.db_path = self.cache_dir / "cache.db"
-        self._init_db()
-        
-        # Memory cache for frequently accessed items
-        self._memory_cache: Dict[str, tuple[Any, float]] = {}
+        # SQLite cache for structured data, sharded by key hash. Each thread
+        # opens its own connection to a shard on first use, so readers never
+        # queue behind each other (WAL) and writers only meet in SQLite's
+        # own file lock.
+        self._remove_unsharded_db()
+        self.db_paths = [self.cache_dir / f"cache.{i:02x}.db" for i in range(_SHARD_COUNT)]
+        self._tls = threading.local()
+        self._conns_lock = threading.Lock()
+        self._all_conns: List[sqlite3.Connection] = []
+        self._initialized_shards: set[int] = set()
+        
+        # Memory cache for frequently accessed items:
+        # key -> [value, expires_at, size_bytes, hit_counter]
+        self._memory_cache: Dict[str, list] = {}
+        self._memory_lock = threading.Lock()
         self._memory_cache_size = 0
         self._max_memory_size = 100 * 1024 * 1024  # 100MB
+        
+        # Warm the memory cache from the last process's snapshot; live
+        # managers are snapshotted again at exit
+        self._snapshot_path = self.cache_dir / "memcache.bin"
+        self.load_memory_snapshot()
+        _LIVE_MANAGERS.add(self)
     
-    def _init_db(self) -> None:
-        """Initialize SQLite database for caching."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS cache (
-                    key TEXT PRIMARY KEY,
-                    value BLOB,
-                    created_at REAL,
-                    expires_at REAL,
-                    hit_count INTEGER DEFAULT 0,
-                    size_bytes INTEGER
-                )
-            """)
-            conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_expires 
-                ON cache(expires_at)
-            """)
+    def _remove_unsharded_db(self) -> None:
+        """Delete the single-file cache.db used before sharding.
+        
+        Nothing reads it any more; its entries are only a cache, so they are
+        dropped rather than migrated.
+        """
+        for suffix in ("", "-wal", "-shm"):
+            path = self.cache_dir / f"cache.db{suffix}"
+            try:
+                path.unlink()
+                logger.info(f"Removed unsharded cache file {path}")
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Failed to remove unsharded cache file {path}: {e}")
+    
+    def _shard(self, key: str) -> int:
+        """Index of the shard holding key."""
+        return zlib.crc32(key.encode()) & (_SHARD_COUNT - 1)
+    
+    def _connection(self, shard: int) -> sqlite3.Connection:
+        """Get this thread's connection to a shard, opening it on first use."""
+        conns = getattr(self._tls, "conns", None)
+        if conns is None:
+            conns = self._tls.conns = [None] * _SHARD_COUNT
+        
+        conn = conns[shard]
+        if conn is None:
+            conn = sqlite3.connect(self.db_paths[shard], isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA mmap_size=268435456")
+            conn.execute("PRAGMA recursive_triggers=ON")
+            with self._conns_lock:
+                if shard not in self._initialized_shards:
+                    self._init_db(conn)
+                    self._initialized_shards.add(shard)
+                self._all_conns.append(conn)
+            conns[shard] = conn
+        return conn
+    
+    def _existing_shards(self) -> List[int]:
+        """Shards that have a database file on disk."""
+        return [shard for shard in range(_SHARD_COUNT) if self.db_paths[shard].exists()]
+    
+    def _init_db(self, conn: sqlite3.Connection) -> None:
+        """Initialize a SQLite shard database for caching."""
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS cache (
+                key TEXT PRIMARY KEY,
+                value BLOB,
+                created_at REAL,
+                expires_at REAL,
+                hit_count INTEGER DEFAULT 0,
+                size_bytes INTEGER
+            )
+        """)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_expires 
+            ON cache(expires_at)
+        """)
+        
+        # Identical values are stored once, keyed by their digest and
+        # reference counted by the cache rows pointing at them
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(cache)")}
+        if "digest" not in columns:
+            conn.execute("ALTER TABLE cache ADD COLUMN digest BLOB")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS blobs (
+                digest BLOB PRIMARY KEY,
+                data BLOB,
+                refcount INTEGER
+            )
+        """)
+        # Drop a reference whenever a row goes away, including rows
+        # replaced by INSERT OR REPLACE (needs recursive_triggers, which
+        # every connection turns on)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS cache_release_blob
+            AFTER DELETE ON cache WHEN OLD.digest IS NOT NULL
+            BEGIN
+                UPDATE blobs SET refcount = refcount - 1 WHERE digest = OLD.digest;
+                DELETE FROM blobs WHERE digest = OLD.digest AND refcount <= 0;
+            END
+        """)
     
     def get(
         self,
@@ -70,43 +359,42 @@ class CacheManager:
             Cached value or default
         """
         # Check memory cache first
-        if use_memory and key in self._memory_cache:
-            value, expires_at = self._memory_cache[key]
-            if expires_at > time.time():
-                logger.debug(f"Memory cache hit for {key}")
-                return value
-            else:
+        if use_memory:
+            entry = self._memory_cache.get(key)
+            if entry is not None:
+                if entry[1] > time.time():
+                    if entry[3] < _MAX_HIT_COUNTER:
+                        entry[3] += 1
+                    logger.debug(f"Memory cache hit for {key}")
+                    return entry[0]
                 # Expired, remove from memory
-                del self._memory_cache[key]
+                with self._memory_lock:
+                    if self._memory_cache.get(key) is entry:
+                        self._memory_pop(key)
         
         # Check disk cache
+        shard = self._shard(key)
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute(
-                    """
-                    SELECT value, expires_at FROM cache 
-                    WHERE key = ? AND expires_at > ?
-                    """,
-                    (key, time.time())
-                )
-                row = cursor.fetchone()
-                
+            conn = self._connection(shard)
+            if _SQLITE_HAS_RETURNING:
+                # Read the entry and bump its hit count in one statement
+                rows = conn.execute(_SQL_HIT_RETURNING, (key, time.time())).fetchall()
+                row = rows[0] if rows else None
+            else:
+                row = conn.execute(_SQL_SELECT, (key, time.time())).fetchone()
                 if row:
-                    value_blob, expires_at = row
-                    value = pickle.loads(value_blob)
-                    
-                    # Update hit count
-                    conn.execute(
-                        "UPDATE cache SET hit_count = hit_count + 1 WHERE key = ?",
-                        (key,)
-                    )
-                    
-                    # Add to memory cache if small enough
-                    if use_memory and len(value_blob) < 1024 * 1024:  # < 1MB
-                        self._memory_cache[key] = (value, expires_at)
-                    
-                    logger.debug(f"Disk cache hit for {key}")
-                    return value
+                    conn.execute(_SQL_HIT, (key,))
+            
+            if row:
+                value_blob, expires_at = row
+                value = _decode(value_blob)
+                
+                # Add to memory cache if small enough
+                if use_memory and len(value_blob) < 1024 * 1024:  # < 1MB
+                    self._memory_put(key, value, expires_at, len(value_blob))
+                
+                logger.debug(f"Disk cache hit for {key}")
+                return value
         
         except Exception as e:
             logger.error(f"Cache read error for {key}: {e}")
@@ -132,7 +420,7 @@ class CacheManager:
             ttl_seconds = self.config.performance.cache_ttl_hours * 3600
         
         expires_at = time.time() + ttl_seconds
-        value_blob = pickle.dumps(value)
+        value_blob = _encode(value)
         size_bytes = len(value_blob)
         
         # Check size limit
@@ -141,22 +429,23 @@ class CacheManager:
             logger.warning(f"Value too large to cache: {size_bytes} bytes")
             return
         
+        digest = hashlib.blake2b(value_blob, digest_size=16).digest()
+        shard = self._shard(key)
+        
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            # Take the reference before replacing the row so rewriting a
+            # key with the same value never drops the blob's count to zero
+            with _immediate_transaction(self._connection(shard)) as conn:
+                conn.execute(_SQL_BLOB_INSERT, (digest, value_blob))
+                conn.execute(_SQL_BLOB_INCREF, (digest,))
                 conn.execute(
-                    """
-                    INSERT OR REPLACE INTO cache 
-                    (key, value, created_at, expires_at, size_bytes)
-                    VALUES (?, ?, ?, ?, ?)
-                    """,
-                    (key, value_blob, time.time(), expires_at, size_bytes)
+                    _SQL_UPSERT,
+                    (key, digest, time.time(), expires_at, size_bytes)
                 )
             
             # Add to memory cache if small enough
             if use_memory and size_bytes < 1024 * 1024:  # < 1MB
-                self._memory_cache[key] = (value, expires_at)
-                self._memory_cache_size += size_bytes
-                self._evict_memory_cache()
+                self._memory_put(key, value, expires_at, size_bytes)
             
             logger.debug(f"Cached {key} ({size_bytes} bytes, TTL: {ttl_seconds}s)")
             
@@ -174,21 +463,50 @@ class CacheManager:
             True if deleted, False if not found
         """
         # Remove from memory cache
-        if key in self._memory_cache:
-            del self._memory_cache[key]
+        with self._memory_lock:
+            self._memory_pop(key)
         
         # Remove from disk cache
+        shard = self._shard(key)
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute(
-                    "DELETE FROM cache WHERE key = ?",
-                    (key,)
-                )
-                return cursor.rowcount > 0
+            cursor = self._connection(shard).execute(_SQL_DELETE, (key,))
+            return cursor.rowcount > 0
         except Exception as e:
             logger.error(f"Cache delete error for {key}: {e}")
             return False
     
+    def delete_many(self, keys: Iterable[str]) -> int:
+        """Delete several cached values with one transaction per shard.
+        
+        Args:
+            keys: Cache keys
+        
+        Returns:
+            Number of entries deleted from disk
+        """
+        keys = list(keys)
+        
+        # Remove from memory cache
+        with self._memory_lock:
+            for key in keys:
+                self._memory_pop(key)
+        
+        by_shard: Dict[int, List[str]] = {}
+        for key in keys:
+            by_shard.setdefault(self._shard(key), []).append(key)
+        
+        # Remove from disk cache
+        count = 0
+        try:
+            for shard, shard_keys in by_shard.items():
+                with _immediate_transaction(self._connection(shard)) as conn:
+                    cursor = conn.executemany(_SQL_DELETE, ((key,) for key in shard_keys))
+                count += cursor.rowcount
+            return count
+        except Exception as e:
+            logger.error(f"Cache delete error for {len(keys)} keys: {e}")
+            return count
+    
     def clear(self, expired_only: bool = False) -> int:
         """Clear cache.
         
@@ -199,36 +517,46 @@ class CacheManager:
             Number of entries cleared
         """
         # Clear memory cache
-        if not expired_only:
-            self._memory_cache.clear()
-            self._memory_cache_size = 0
-        else:
-            current_time = time.time()
-            expired_keys = [
-                k for k, (_, exp) in self._memory_cache.items()
-                if exp <= current_time
-            ]
-            for key in expired_keys:
-                del self._memory_cache[key]
+        with self._memory_lock:
+            if not expired_only:
+                self._memory_cache.clear()
+                self._memory_cache_size = 0
+            else:
+                current_time = time.time()
+                expired_keys = [
+                    k for k, entry in self._memory_cache.items()
+                    if entry[1] <= current_time
+                ]
+                for key in expired_keys:
+                    self._memory_pop(key)
         
         # Clear disk cache
+        count = 0
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                if expired_only:
-                    cursor = conn.execute(
-                        "DELETE FROM cache WHERE expires_at <= ?",
-                        (time.time(),)
-                    )
-                else:
-                    cursor = conn.execute("DELETE FROM cache")
+            now = time.time()
+            for shard in self._existing_shards():
+                conn = self._connection(shard)
+                if not expired_only:
+                    # Take the write lock up front so the clear runs as one
+                    # transaction instead of waiting mid-statement on writers
+                    with _immediate_transaction(conn):
+                        count += conn.execute("DELETE FROM cache").rowcount
+                    continue
                 
-                count = cursor.rowcount
-                logger.info(f"Cleared {count} cache entries")
-                return count
+                # Expired entries go in short batches, one transaction each
+                while True:
+                    with _immediate_transaction(conn):
+                        deleted = conn.execute(_SQL_DELETE_EXPIRED, (now,)).rowcount
+                    count += deleted
+                    if deleted < _SWEEP_BATCH:
+                        break
+            
+            logger.info(f"Cleared {count} cache entries")
+            return count
         
         except Exception as e:
             logger.error(f"Cache clear error: {e}")
-            return 0
+            return count
     
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics.
@@ -246,50 +574,116 @@ class CacheManager:
         }
         
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                # Total entries
-                cursor = conn.execute("SELECT COUNT(*) FROM cache")
-                stats["disk_cache_size"] = cursor.fetchone()[0]
-                
-                # Total size
-                cursor = conn.execute("SELECT SUM(size_bytes) FROM cache")
-                stats["disk_cache_bytes"] = cursor.fetchone()[0] or 0
-                
-                # Total hits
-                cursor = conn.execute("SELECT SUM(hit_count) FROM cache")
-                stats["total_hits"] = cursor.fetchone()[0] or 0
-                
-                # Expired entries
-                cursor = conn.execute(
-                    "SELECT COUNT(*) FROM cache WHERE expires_at <= ?",
-                    (time.time(),)
-                )
-                stats["expired_count"] = cursor.fetchone()[0]
+            now = time.time()
+            for shard in self._existing_shards():
+                # Entries, size, hits and expired entries in one pass
+                entries, size_bytes, hits, expired = self._connection(shard).execute(
+                    """
+                    SELECT COUNT(*), SUM(size_bytes), SUM(hit_count),
+                           SUM(expires_at <= ?)
+                    FROM cache
+                    """,
+                    (now,)
+                ).fetchone()
+                stats["disk_cache_size"] += entries
+                stats["disk_cache_bytes"] += size_bytes or 0
+                stats["total_hits"] += hits or 0
+                stats["expired_count"] += expired or 0
         
         except Exception as e:
             logger.error(f"Failed to get cache stats: {e}")
         
         return stats
     
+    def close(self) -> None:
+        """Close the cache database connections."""
+        with self._conns_lock:
+            for conn in self._all_conns:
+                conn.close()
+            self._all_conns.clear()
+            # Fresh thread-local state so no thread reuses a closed connection
+            self._tls = threading.local()
+    
+    def save_memory_snapshot(self) -> None:
+        """Write the unexpired memory cache entries to memcache.bin."""
+        _write_memory_snapshot(self._snapshot_path, [self])
+    
+    def load_memory_snapshot(self) -> int:
+        """Load memory cache entries from a recent memcache.bin.
+        
+        The snapshot is read at most once per process and cache directory.
+        
+        Returns:
+            Number of entries loaded
+        """
+        with _LOADED_SNAPSHOTS_LOCK:
+            if self._snapshot_path in _LOADED_SNAPSHOTS:
+                return 0
+            _LOADED_SNAPSHOTS.add(self._snapshot_path)
+        
+        try:
+            if time.time() - self._snapshot_path.stat().st_mtime > _MEMORY_SNAPSHOT_MAX_AGE:
+                return 0
+            with open(self._snapshot_path, "rb") as f:
+                entries = pickle.load(f)
+        except FileNotFoundError:
+            return 0
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable memory cache snapshot: {e}")
+            return 0
+        
+        now = time.time()
+        loaded = 0
+        with self._memory_lock:
+            for key, entry in entries.items():
+                if entry[1] > now and key not in self._memory_cache:
+                    self._memory_cache[key] = list(entry)
+                    self._memory_cache_size += entry[2]
+                    loaded += 1
+            self._evict_memory_cache()
+        
+        logger.debug(f"Loaded {loaded} memory cache entries from snapshot")
+        return loaded
+    
+    def _memory_put(self, key: str, value: Any, expires_at: float, size_bytes: int) -> None:
+        """Insert or replace a memory cache entry."""
+        with self._memory_lock:
+            self._memory_pop(key)
+            self._memory_cache[key] = [value, expires_at, size_bytes, 1]
+            self._memory_cache_size += size_bytes
+            self._evict_memory_cache()
+    
+    def _memory_pop(self, key: str) -> None:
+        """Remove a memory cache entry, if present. Caller holds _memory_lock."""
+        entry = self._memory_cache.pop(key, None)
+        if entry is not None:
+            self._memory_cache_size -= entry[2]
+    
     def _evict_memory_cache(self) -> None:
-        """Evict items from memory cache if size limit exceeded."""
+        """Evict least frequently hit items if size limit exceeded.
+        
+        Entries are bucketed by hit counter in one scan and evicted from the
+        lowest bucket up (oldest first within a bucket). When every counter
+        has saturated past half range, all counters are halved so recent
+        activity keeps deciding the victims. Caller holds _memory_lock.
+        """
         if self._memory_cache_size <= self._max_memory_size:
             return
         
-        # Sort by expiration time and evict oldest
-        sorted_items = sorted(
-            self._memory_cache.items(),
-            key=lambda x: x[1][1]  # Sort by expires_at
-        )
+        buckets: Dict[int, list] = {}
+        for key, entry in self._memory_cache.items():
+            buckets.setdefault(entry[3], []).append(key)
         
-        while self._memory_cache_size > self._max_memory_size * 0.8:  # Keep 80% full
-            if not sorted_items:
-                break
-            
-            key, (value, _) = sorted_items.pop(0)
-            del self._memory_cache[key]
-            # Estimate size reduction (rough)
-            self._memory_cache_size -= len(pickle.dumps(value))
+        target = self._max_memory_size * 0.8  # Keep 80% full
+        for counter in sorted(buckets):
+            for key in buckets[counter]:
+                if self._memory_cache_size <= target:
+                    break
+                self._memory_pop(key)
+        
+        if self._memory_cache and min(buckets) >= _HALVE_COUNTERS_AT:
+            for entry in self._memory_cache.values():
+                entry[3] >>= 1
     
     def cache_key(self, *args, **kwargs) -> str:
         """Generate cache key from arguments.
@@ -301,13 +695,30 @@ class CacheManager:
         Returns:
             Cache key string
         """
-        key_data = {
-            "args": args,
-            "kwargs": kwargs,
-        }
+        # Scalar-only arguments (the common case) skip JSON: their repr is
+        # already unambiguous. The prefixes keep the two forms apart.
+        if all(type(arg) in _KEY_SCALAR_TYPES for arg in args) and all(
+            type(value) in _KEY_SCALAR_TYPES for value in kwargs.values()
+        ):
+            key_str = "r:" + repr((args, sorted(kwargs.items())))
+        else:
+            key_data = {
+                "args": args,
+                "kwargs": kwargs,
+            }
+            if ORJSON_AVAILABLE:
+                try:
+                    key_bytes = b"j:" + orjson.dumps(
+                        key_data,
+                        option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+                        default=str,
+                    )
+                    return hashlib.blake2b(key_bytes, digest_size=16).hexdigest()
+                except TypeError:
+                    pass  # e.g. integers beyond 64 bits; use the stdlib encoder
+            key_str = "j:" + json.dumps(key_data, sort_keys=True, default=str)
 
-        key_str = json.dumps(key_data, sort_keys=True, default=str)
-        return hashlib.sha256(key_str.encode()).hexdigest()
+        return hashlib.blake2b(key_str.encode(), digest_size=16).hexdigest()
 
     def get_cached_audio(self, key: str) -> Optional[Path]:
         """Get cached audio file path.
@@ -346,14 +757,47 @@ class CacheManager:
 
         try:
             # Copy file to cache
-            import shutil
-            shutil.copy2(source_path, cached_path)
+            _clone_or_copy(source_path, cached_path)
             logger.debug(f"Cached audio file {key} ({source_path.stat().st_size} bytes)")
         except Exception as e:
             logger.error(f"Failed to cache audio file: {e}")
             raise CacheError(f"Failed to cache audio file: {e}")
 
 
+# CacheManagers still alive, snapshotted together at interpreter exit
+_LIVE_MANAGERS: "weakref.WeakSet[CacheManager]" = weakref.WeakSet()
+
+
+def _write_memory_snapshot(path: Path, managers: Iterable[CacheManager]) -> None:
+    """Merge the managers' unexpired memory entries into one snapshot file."""
+    now = time.time()
+    entries: Dict[str, list] = {}
+    for manager in managers:
+        with manager._memory_lock:
+            entries.update(
+                (key, entry) for key, entry in manager._memory_cache.items()
+                if entry[1] > now
+            )
+    
+    tmp_path = path.with_suffix(".tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            pickle.dump(entries, f, protocol=5)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        logger.warning(f"Failed to write memory cache snapshot {path}: {e}")
+
+
+@atexit.register
+def _snapshot_live_managers() -> None:
+    """Snapshot every live CacheManager, one merged file per cache directory."""
+    by_path: Dict[Path, List[CacheManager]] = {}
+    for manager in list(_LIVE_MANAGERS):
+        by_path.setdefault(manager._snapshot_path, []).append(manager)
+    for path, managers in by_path.items():
+        _write_memory_snapshot(path, managers)
+
+
 def cached(
     ttl_seconds: Optional[int] = 3600,
     key_prefix: Optional[str] = None,
@@ -402,45 +846,107 @@ def cached(
 
 
 class FileCache:
-    """Simple file-based cache for large objects."""
+    """Simple file-based cache for large objects.
+    
+    An in-memory Bloom filter of the keys on disk (seeded from the file
+    names at startup) answers misses with a single stat of the key's
+    subdirectory: while its mtime is the one recorded when it was scanned,
+    a negative is final. When another instance or process has written
+    there since, the subdirectory is rescanned into the filter first.
+    """
     
     def __init__(self, cache_dir: Path):
         self.cache_dir = cache_dir
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        
+        self._bloom = bytearray(_BLOOM_BITS // 8)
+        # Subdirectory name -> mtime_ns when it was last scanned
+        self._scanned: Dict[str, int] = {}
+        for entry in os.scandir(self.cache_dir):
+            if entry.is_dir():
+                self._scan_subdir(entry.name)
     
     def get_path(self, key: str) -> Path:
         """Get file path for cache key."""
+        return self._path(hashlib.sha256(key.encode()).hexdigest())
+    
+    def _path(self, key_hash: str) -> Path:
+        """Get file path for a hashed cache key."""
         # Use first 2 chars as subdirectory for better file system performance
-        key_hash = hashlib.sha256(key.encode()).hexdigest()
         subdir = self.cache_dir / key_hash[:2]
         subdir.mkdir(exist_ok=True)
         return subdir / f"{key_hash}.cache"
     
+    def _bloom_add(self, key_hash: str) -> None:
+        """Record a hashed key in the Bloom filter."""
+        for bit in _bloom_bits(key_hash):
+            self._bloom[bit >> 3] |= 1 << (bit & 7)
+    
+    def _scan_subdir(self, name: str) -> None:
+        """Add the files in one subdirectory to the Bloom filter."""
+        subdir = self.cache_dir / name
+        try:
+            # Stat before listing so a write during the listing triggers a rescan
+            self._scanned[name] = subdir.stat().st_mtime_ns
+            with os.scandir(subdir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".cache"):
+                        self._bloom_add(entry.name[:-len(".cache")])
+        except FileNotFoundError:
+            self._scanned.pop(name, None)
+    
+    def _bloom_contains(self, key_hash: str) -> bool:
+        """Check whether a hashed key may be on disk."""
+        if self._bloom_bits_set(key_hash):
+            return True
+        # Negative: final unless the subdirectory changed since its scan
+        name = key_hash[:2]
+        try:
+            mtime_ns = (self.cache_dir / name).stat().st_mtime_ns
+        except FileNotFoundError:
+            return False
+        if self._scanned.get(name) == mtime_ns:
+            return False
+        self._scan_subdir(name)
+        return self._bloom_bits_set(key_hash)
+    
+    def _bloom_bits_set(self, key_hash: str) -> bool:
+        """Check the Bloom filter bits for a hashed key."""
+        return all(self._bloom[bit >> 3] & (1 << (bit & 7)) for bit in _bloom_bits(key_hash))
+    
     def exists(self, key: str) -> bool:
         """Check if cached file exists."""
-        return self.get_path(key).exists()
+        key_hash = hashlib.sha256(key.encode()).hexdigest()
+        return self._bloom_contains(key_hash) and self._path(key_hash).exists()
     
     def get(self, key: str) -> Optional[Any]:
         """Get cached object from file."""
-        path = self.get_path(key)
-        
-        if not path.exists():
+        key_hash = hashlib.sha256(key.encode()).hexdigest()
+        if not self._bloom_contains(key_hash):
             return None
         
+        path = self._path(key_hash)
         try:
-            with open(path, "rb") as f:
-                return pickle.load(f)
+            return _decode(path.read_bytes())
+        except FileNotFoundError:
+            return None
         except Exception as e:
             logger.error(f"Failed to load cache file {path}: {e}")
             return None
     
     def set(self, key: str, value: Any) -> bool:
         """Save object to cache file."""
-        path = self.get_path(key)
+        key_hash = hashlib.sha256(key.encode()).hexdigest()
+        path = self._path(key_hash)
+        self._bloom_add(key_hash)
         
         try:
-            with open(path, "wb") as f:
-                pickle.dump(value, f)
+            if ORJSON_AVAILABLE and _is_json_native(value):
+                path.write_bytes(_encode(value))
+            else:
+                # Stream large objects instead of building the pickle in memory
+                with open(path, "wb") as f:
+                    _dump_oob(value, f)
             return True
         except Exception as e:
             logger.error(f"Failed to save cache file {path}: {e}")
@@ -470,4 +976,6 @@ class FileCache:
             except Exception as e:
                 logger.error(f"Failed to delete {cache_file}: {e}")
         
+        self._bloom = bytearray(_BLOOM_BITS // 8)
+        self._scanned.clear()
         return count
\ No newline at end of file
@@ -3,45 +3,143 @@
 from __future__ import annotations
 
 import logging
-from typing import Dict, List, Optional, Set
+import re
+from functools import lru_cache
+from typing import AbstractSet, Dict, List, Optional, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Separators folded to "-" and the spelled-out name collapsed to "cc"
+_SEPARATOR_TABLE = str.maketrans({"_": "-", " ": "-"})
+_CREATIVE_COMMONS_RE = re.compile("creative-?commons")
+
+# Match patterns like "cc by 4.0" or "cc-by 4.0"
+_CC_LICENSE_RE = re.compile(r"(cc-?(?:by|sa|nc|nd)(?:-(?:by|sa|nc|nd))*)\s*(\d+(?:\.\d+)?)?")
+_VERSION_RE = re.compile(r"(\d+\.\d+)")
+
+# Substring markers, each group folded into one alternation so a single
+# scan replaces a Python-level any() loop
+_PUBLIC_DOMAIN_RE = re.compile("public domain|publicdomain|pd mark|pdm|no copyright")
+_NON_COMMERCIAL_RE = re.compile("nc|non-commercial|noncommercial")
+_SHAREALIKE_RE = re.compile("sa|share-alike|sharealike")
+_NO_DERIVATIVES_RE = re.compile("nd|no-deriv|noderivs|no-derivatives")
+
+
+def _substring_matcher(licenses: AbstractSet[str]):
+    """Build a test for ``any(l in s or s in l for l in licenses)``.
+
+    The first half is one regex search over all identifiers; the second
+    is a substring test against the identifiers joined by NUL, which no
+    normalized license string contains.
+    """
+    pattern = re.compile("|".join(map(re.escape, sorted(licenses, key=len, reverse=True))))
+    joined = "\0".join(licenses)
+
+    def matches(normalized: str) -> bool:
+        if pattern.search(normalized):
+            return True
+        return "\0" not in normalized and normalized in joined
+
+    return matches
+
+
+# Asset lists repeat the same few license strings, and every LicenseValidator
+# check re-normalizes its input, so both lookups are memoized
+@lru_cache(maxsize=1024)
+def _normalize_license(license_str: str) -> str:
+    """Normalize a license string (see LicenseValidator.normalize_license)."""
+    if not license_str:
+        return "unknown"
+
+    # Convert to lowercase and clean
+    normalized = license_str.lower().strip().translate(_SEPARATOR_TABLE)
+    normalized = _CREATIVE_COMMONS_RE.sub("cc", normalized)
+
+    # Handle version numbers
+    match = _CC_LICENSE_RE.search(normalized)
+
+    if match:
+        base = match.group(1).replace(" ", "-")
+        version = match.group(2)
+        if version:
+            return f"{base}-{version}"
+        return base
+
+    # Check for public domain variations
+    if _PUBLIC_DOMAIN_RE.search(normalized):
+        return "pd"
+
+    if "cc0" in normalized or "zero" in normalized:
+        return "cc0"
+
+    return normalized[:50]  # Limit length
+
+
+@lru_cache(maxsize=1024)
+def _license_url(normalized: str) -> Optional[str]:
+    """Map a normalized license identifier to its official URL."""
+    # Extract version
+    version_match = _VERSION_RE.search(normalized)
+    version = version_match.group(1) if version_match else "4.0"
+
+    # Map to URLs
+    if normalized == "cc0" or "cc0" in normalized:
+        return "https://creativecommons.org/publicdomain/zero/1.0/"
+    elif normalized == "pd" or "public" in normalized:
+        return "https://creativecommons.org/publicdomain/mark/1.0/"
+    elif "cc-by-sa" in normalized:
+        return f"https://creativecommons.org/licenses/by-sa/{version}/"
+    elif "cc-by-nc-sa" in normalized:
+        return f"https://creativecommons.org/licenses/by-nc-sa/{version}/"
+    elif "cc-by-nc-nd" in normalized:
+        return f"https://creativecommons.org/licenses/by-nc-nd/{version}/"
+    elif "cc-by-nc" in normalized:
+        return f"https://creativecommons.org/licenses/by-nc/{version}/"
+    elif "cc-by-nd" in normalized:
+        return f"https://creativecommons.org/licenses/by-nd/{version}/"
+    elif "cc-by" in normalized:
+        return f"https://creativecommons.org/licenses/by/{version}/"
+
+    return None
+
 
 class LicenseValidator:
     """Validates and manages content licenses."""
 
     # Licenses safe for commercial use
-    COMMERCIAL_SAFE = {
+    COMMERCIAL_SAFE = frozenset({
         "cc0", "cc-0", "cc0-1.0",  # Creative Commons Zero
         "pd", "pdm", "publicdomain", "public-domain",  # Public Domain
         "cc-by", "cc-by-1.0", "cc-by-2.0", "cc-by-2.5", "cc-by-3.0", "cc-by-4.0",  # Attribution
         "cc-by-sa", "cc-by-sa-1.0", "cc-by-sa-2.0", "cc-by-sa-2.5", "cc-by-sa-3.0", "cc-by-sa-4.0",  # ShareAlike
-    }
+    })
 
     # Licenses that require attribution
-    ATTRIBUTION_REQUIRED = {
+    ATTRIBUTION_REQUIRED = frozenset({
         "cc-by", "cc-by-1.0", "cc-by-2.0", "cc-by-2.5", "cc-by-3.0", "cc-by-4.0",
         "cc-by-sa", "cc-by-sa-1.0", "cc-by-sa-2.0", "cc-by-sa-2.5", "cc-by-sa-3.0", "cc-by-sa-4.0",
-    }
+    })
 
     # ShareAlike licenses (viral - output must use same license)
-    SHAREALIKE = {
+    SHAREALIKE = frozenset({
         "cc-by-sa", "cc-by-sa-1.0", "cc-by-sa-2.0", "cc-by-sa-2.5", "cc-by-sa-3.0", "cc-by-sa-4.0",
-    }
+    })
 
     # Non-commercial licenses (NOT safe for monetized content)
-    NON_COMMERCIAL = {
+    NON_COMMERCIAL = frozenset({
         "cc-by-nc", "cc-by-nc-2.0", "cc-by-nc-3.0", "cc-by-nc-4.0",
         "cc-by-nc-sa", "cc-by-nc-sa-2.0", "cc-by-nc-sa-3.0", "cc-by-nc-sa-4.0",
         "cc-by-nc-nd", "cc-by-nc-nd-2.0", "cc-by-nc-nd-3.0", "cc-by-nc-nd-4.0",
-    }
+    })
 
     # No derivatives licenses (cannot modify)
-    NO_DERIVATIVES = {
+    NO_DERIVATIVES = frozenset({
         "cc-by-nd", "cc-by-nd-2.0", "cc-by-nd-3.0", "cc-by-nd-4.0",
         "cc-by-nc-nd", "cc-by-nc-nd-2.0", "cc-by-nc-nd-3.0", "cc-by-nc-nd-4.0",
-    }
+    })
+
+    _matches_commercial_safe = staticmethod(_substring_matcher(COMMERCIAL_SAFE))
+    _matches_attribution_required = staticmethod(_substring_matcher(ATTRIBUTION_REQUIRED))
 
     @classmethod
     def normalize_license(cls, license_str: str) -> str:
@@ -53,37 +151,7 @@ class LicenseValidator:
         Returns:
             Normalized license identifier
         """
-        if not license_str:
-            return "unknown"
-
-        # Convert to lowercase and clean
-        normalized = license_str.lower().strip()
-        normalized = normalized.replace("_", "-")
-        normalized = normalized.replace(" ", "-")
-        normalized = normalized.replace("creative-commons", "cc")
-        normalized = normalized.replace("creativecommons", "cc")
-
-        # Handle version numbers
-        import re
-        # Match patterns like "cc by 4.0" or "cc-by 4.0"
-        pattern = re.compile(r"(cc-?(?:by|sa|nc|nd)(?:-(?:by|sa|nc|nd))*)\s*(\d+(?:\.\d+)?)?")
-        match = pattern.search(normalized)
-
-        if match:
-            base = match.group(1).replace(" ", "-")
-            version = match.group(2)
-            if version:
-                return f"{base}-{version}"
-            return base
-
-        # Check for public domain variations
-        if any(pd in normalized for pd in ["public domain", "publicdomain", "pd mark", "pdm", "no copyright"]):
-            return "pd"
-
-        if "cc0" in normalized or "zero" in normalized:
-            return "cc0"
-
-        return normalized[:50]  # Limit length
+        return _normalize_license(license_str)
 
     @classmethod
     def is_commercial_safe(cls, license_str: str) -> bool:
@@ -95,16 +163,18 @@ class LicenseValidator:
         Returns:
             True if commercial use is allowed
         """
-        normalized = cls.normalize_license(license_str)
+        return cls._is_commercial_safe_normalized(cls.normalize_license(license_str))
 
+    @classmethod
+    def _is_commercial_safe_normalized(cls, normalized: str) -> bool:
+        """is_commercial_safe for an already-normalized identifier."""
         # Check if explicitly non-commercial
-        if any(nc in normalized for nc in ["nc", "non-commercial", "noncommercial"]):
+        if _NON_COMMERCIAL_RE.search(normalized):
             return False
 
         # Check if in commercial safe list
-        for safe in cls.COMMERCIAL_SAFE:
-            if safe in normalized or normalized in safe:
-                return True
+        if cls._matches_commercial_safe(normalized):
+            return True
 
         # Unknown licenses are not safe
         logger.warning(f"Unknown license for commercial use: {normalized}")
@@ -120,13 +190,12 @@ class LicenseValidator:
         Returns:
             True if attribution is required
         """
-        normalized = cls.normalize_license(license_str)
+        return cls._requires_attribution_normalized(cls.normalize_license(license_str))
 
-        for attr_license in cls.ATTRIBUTION_REQUIRED:
-            if attr_license in normalized or normalized in attr_license:
-                return True
-
-        return False
+    @classmethod
+    def _requires_attribution_normalized(cls, normalized: str) -> bool:
+        """requires_attribution for an already-normalized identifier."""
+        return cls._matches_attribution_required(normalized)
 
     @classmethod
     def is_sharealike(cls, license_str: str) -> bool:
@@ -138,9 +207,12 @@ class LicenseValidator:
         Returns:
             True if ShareAlike is required
         """
-        normalized = cls.normalize_license(license_str)
+        return cls._is_sharealike_normalized(cls.normalize_license(license_str))
 
-        return any(sa in normalized for sa in ["sa", "share-alike", "sharealike"])
+    @classmethod
+    def _is_sharealike_normalized(cls, normalized: str) -> bool:
+        """is_sharealike for an already-normalized identifier."""
+        return _SHAREALIKE_RE.search(normalized) is not None
 
     @classmethod
     def allows_modification(cls, license_str: str) -> bool:
@@ -152,10 +224,13 @@ class LicenseValidator:
         Returns:
             True if modifications are allowed
         """
-        normalized = cls.normalize_license(license_str)
+        return cls._allows_modification_normalized(cls.normalize_license(license_str))
 
+    @classmethod
+    def _allows_modification_normalized(cls, normalized: str) -> bool:
+        """allows_modification for an already-normalized identifier."""
         # Check if explicitly no-derivatives
-        if any(nd in normalized for nd in ["nd", "no-deriv", "noderivs", "no-derivatives"]):
+        if _NO_DERIVATIVES_RE.search(normalized):
             return False
 
         # Most CC licenses allow modification
@@ -163,7 +238,7 @@ class LicenseValidator:
             return True
 
         # Public domain allows everything
-        if normalized in ["pd", "cc0", "publicdomain"]:
+        if normalized in ("pd", "cc0", "publicdomain"):
             return True
 
         # Unknown licenses - be conservative
@@ -181,30 +256,7 @@ class LicenseValidator:
         """
         normalized = cls.normalize_license(license_str)
 
-        # Extract version
-        import re
-        version_match = re.search(r"(\d+\.\d+)", normalized)
-        version = version_match.group(1) if version_match else "4.0"
-
-        # Map to URLs
-        if normalized == "cc0" or "cc0" in normalized:
-            return "https://creativecommons.org/publicdomain/zero/1.0/"
-        elif normalized == "pd" or "public" in normalized:
-            return "https://creativecommons.org/publicdomain/mark/1.0/"
-        elif "cc-by-sa" in normalized:
-            return f"https://creativecommons.org/licenses/by-sa/{version}/"
-        elif "cc-by-nc-sa" in normalized:
-            return f"https://creativecommons.org/licenses/by-nc-sa/{version}/"
-        elif "cc-by-nc-nd" in normalized:
-            return f"https://creativecommons.org/licenses/by-nc-nd/{version}/"
-        elif "cc-by-nc" in normalized:
-            return f"https://creativecommons.org/licenses/by-nc/{version}/"
-        elif "cc-by-nd" in normalized:
-            return f"https://creativecommons.org/licenses/by-nd/{version}/"
-        elif "cc-by" in normalized:
-            return f"https://creativecommons.org/licenses/by/{version}/"
-
-        return None
+        return _license_url(normalized)
 
 
 def format_attribution(
@@ -233,7 +285,7 @@ def format_attribution(
         parts.append(f'"{title}"')
 
     # Creator
-    if creator and creator.lower() not in ["unknown", "anonymous"]:
+    if creator and creator.lower() not in ("unknown", "anonymous"):
         parts.append(f"by {creator}")
 
     # Source
@@ -241,23 +293,35 @@ def format_attribution(
         parts.append(f"from {source}")
 
     # License
-    normalized_license = LicenseValidator.normalize_license(license)
-    license_url = LicenseValidator.get_license_url(normalized_license)
-
-    if normalized_license in ["pd", "cc0"]:
-        parts.append("(Public Domain)")
-    elif normalized_license != "unknown":
-        parts.append(f"licensed under {normalized_license.upper()}")
+    license_label, license_link = _attribution_license_parts(license)
+    if license_label:
+        parts.append(license_label)
 
     # URL
     if url:
         parts.append(f"({url})")
-    elif license_url:
-        parts.append(f"({license_url})")
+    elif license_link:
+        parts.append(license_link)
 
     return " ".join(parts)
 
 
+@lru_cache(maxsize=1024)
+def _attribution_license_parts(license: str) -> Tuple[Optional[str], Optional[str]]:
+    """Attribution label and parenthesized license URL for a license string."""
+    normalized_license = LicenseValidator.normalize_license(license)
+    license_url = LicenseValidator.get_license_url(normalized_license)
+
+    if normalized_license in ("pd", "cc0"):
+        label = "(Public Domain)"
+    elif normalized_license != "unknown":
+        label = f"licensed under {normalized_license.upper()}"
+    else:
+        label = None
+
+    return label, f"({license_url})" if license_url else None
+
+
 def generate_attribution_block(
     assets: List[Dict],
     format: str = "markdown"
@@ -279,10 +343,10 @@ def generate_attribution_block(
     has_sharealike = False
 
     for asset in assets:
-        license = asset.get("license", "")
-        if LicenseValidator.requires_attribution(license):
+        normalized = LicenseValidator.normalize_license(asset.get("license", ""))
+        if LicenseValidator._requires_attribution_normalized(normalized):
             attributed_assets.append(asset)
-        if LicenseValidator.is_sharealike(license):
+        if LicenseValidator._is_sharealike_normalized(normalized):
             has_sharealike = True
 
     if not attributed_assets and not has_sharealike:
@@ -353,20 +417,24 @@ def check_license_compatibility(licenses: List[str]) -> Dict[str, any]:
 
     normalized_licenses = [LicenseValidator.normalize_license(l) for l in licenses]
 
-    # Check each license
+    # Check each license. The checks have always normalized their argument
+    # again, and normalization is not idempotent ("cc-by-4.0" -> "cc-by"),
+    # so do that second pass once here rather than in every check.
     for license in normalized_licenses:
-        if not LicenseValidator.is_commercial_safe(license):
+        checked = LicenseValidator.normalize_license(license)
+
+        if not LicenseValidator._is_commercial_safe_normalized(checked):
             result["commercial_safe"] = False
             result["warnings"].append(f"License '{license}' does not allow commercial use")
 
-        if LicenseValidator.requires_attribution(license):
+        if LicenseValidator._requires_attribution_normalized(checked):
             result["requires_attribution"] = True
 
-        if LicenseValidator.is_sharealike(license):
+        if LicenseValidator._is_sharealike_normalized(checked):
             result["requires_sharealike"] = True
             result["recommendations"].append("Output must be licensed under same ShareAlike terms")
 
-        if not LicenseValidator.allows_modification(license):
+        if not LicenseValidator._allows_modification_normalized(checked):
             result["allows_modification"] = False
             result["warnings"].append(f"License '{license}' does not allow modifications")
 
@@ -3,13 +3,21 @@
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
+import contextvars
+import email.utils
 import functools
+import itertools
 import logging
+import os
 import random
+import threading
 import time
-from typing import Any, Callable, Optional, Tuple, Type, Union
+from datetime import datetime, timezone
+from typing import Any, Callable, Generator, Iterable, Literal, Optional, Tuple, Type, Union
 
 from ..core.errors import (
+    CircuitBreakerOpenError,
     NonRetryableError,
     RateLimitError,
     RetryableError,
@@ -18,9 +26,54 @@ from ..core.errors import (
 logger = logging.getLogger(__name__)
 
 
+def _sleep(wait_time: float) -> None:
+    """Sleep between synchronous retries.
+    
+    The sync retry path blocks its thread, which is fine in worker threads
+    but stalls everything when the caller is running inside an event loop.
+    Coroutines should use async_retry/async_execute_with_retry instead;
+    calls that would block a running loop are flagged here.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        logger.warning(
+            "Blocking retry sleep of %.2fs inside a running event loop; "
+            "use async_retry or async_execute_with_retry from async code",
+            wait_time,
+        )
+    time.sleep(wait_time)
+
+
+_rng_tick = itertools.count(1)
+
+
+def _new_rng() -> random.Random:
+    """Independently seeded RNG for one strategy's jitter.
+    
+    Mixes the clock, pid and thread with a per-call counter so strategies
+    created together, or in workers forked from one parent, don't draw the
+    same jitter and retry in lockstep.
+    """
+    tick = next(_rng_tick)
+    seed = time.time_ns() ^ os.getpid() ^ threading.get_ident() ^ (tick * 0x9E3779B9)
+    return random.Random(seed & 0xFFFFFFFFFFFFFFFF)
+
+
 class RetryStrategy:
     """Base class for retry strategies."""
     
+    _rng: Optional[random.Random] = None
+    
+    @property
+    def rng(self) -> random.Random:
+        """RNG used for jitter, created on first use unless one was given."""
+        if self._rng is None:
+            self._rng = _new_rng()
+        return self._rng
+    
     def get_wait_time(self, attempt: int) -> float:
         """Get wait time for the given attempt number.
         
@@ -31,29 +84,139 @@ class RetryStrategy:
             Wait time in seconds
         """
         raise NotImplementedError
+    
+    def schedule(self, max_attempts: int) -> Optional[Tuple[float, ...]]:
+        """Un-jittered wait for each attempt, if it depends only on the attempt.
+        
+        Args:
+            max_attempts: Number of attempts to cover
+        
+        Returns:
+            Wait caps indexed by attempt, or None when waits must come from
+            get_wait_time on every call
+        """
+        return None
+    
+    def apply_jitter(self, wait_time: float) -> float:
+        """Randomize a wait taken from schedule()."""
+        return wait_time
+
 
+JitterMode = Literal["full", "half", "decorrelated", "none"]
 
 class ExponentialBackoff(RetryStrategy):
-    """Exponential backoff retry strategy."""
+    """Exponential backoff retry strategy.
+    
+    Jitter modes:
+        full: uniform in [0, capped backoff] (default), so clients that
+            failed together spread out instead of retrying in lockstep
+        half: capped backoff scaled by 50%-150%
+        decorrelated: uniform in [base, 3 * previous wait], capped; the
+            previous wait restarts with attempt 0
+        none: the capped backoff itself
+    
+    Pass a seeded rng to make the jitter reproducible, e.g. in tests.
+    """
     
     def __init__(
         self,
         base: float = 2.0,
         max_wait: float = 60.0,
-        jitter: bool = True
+        jitter: bool = True,
+        jitter_mode: Optional[JitterMode] = None,
+        rng: Optional[random.Random] = None,
     ):
         self.base = base
         self.max_wait = max_wait
         self.jitter = jitter
+        self.jitter_mode = jitter_mode or ("full" if jitter else "none")
+        self._prev = base
+        self._rng = rng
     
     def get_wait_time(self, attempt: int) -> float:
         """Calculate wait time with exponential backoff."""
-        wait_time = min(self.base ** attempt, self.max_wait)
+        if self.jitter_mode == "decorrelated":
+            if attempt == 0:
+                self._prev = self.base
+            self._prev = min(self.max_wait, self.rng.uniform(self.base, self._prev * 3))
+            return self._prev
         
+        return self.apply_jitter(min(self.base ** attempt, self.max_wait))
+    
+    def schedule(self, max_attempts: int) -> Optional[Tuple[float, ...]]:
+        """Capped backoff per attempt (None for decorrelated jitter)."""
+        if self.jitter_mode == "decorrelated":
+            return None
+        return tuple(min(self.base ** attempt, self.max_wait) for attempt in range(max_attempts))
+    
+    def apply_jitter(self, wait_time: float) -> float:
+        """Add random jitter to prevent thundering herd."""
+        if self.jitter_mode == "full":
+            return self.rng.uniform(0, wait_time)
+        if self.jitter_mode == "half":
+            return wait_time * (0.5 + self.rng.random())
+        return wait_time
+
+
+class DecorrelatedJitter(ExponentialBackoff):
+    """Decorrelated jitter backoff: each wait is drawn from [base, 3 * previous]."""
+    
+    def __init__(
+        self,
+        base: float = 1.0,
+        max_wait: float = 60.0,
+        rng: Optional[random.Random] = None,
+    ):
+        super().__init__(base=base, max_wait=max_wait, jitter_mode="decorrelated", rng=rng)
+
+
+def _fibonacci(count: int) -> Tuple[int, ...]:
+    """First count Fibonacci numbers starting 1, 1, 2, ..."""
+    seq = [1, 1]
+    while len(seq) < count:
+        seq.append(seq[-1] + seq[-2])
+    return tuple(seq[:count])
+
+
+class FibonacciBackoff(RetryStrategy):
+    """Fibonacci backoff retry strategy.
+    
+    Grows more gently than doubling: waits are base * 1, 1, 2, 3, 5, 8, ...
+    capped at max_wait, with optional full jitter.
+    """
+    
+    # Far past any useful retry count; later attempts reuse the last entry
+    FIBONACCI = _fibonacci(48)
+    
+    def __init__(
+        self,
+        base: float = 1.0,
+        max_wait: float = 60.0,
+        jitter: bool = True,
+        rng: Optional[random.Random] = None,
+    ):
+        self.base = base
+        self.max_wait = max_wait
+        self.jitter = jitter
+        self._rng = rng
+    
+    def get_wait_time(self, attempt: int) -> float:
+        """Calculate wait time from the Fibonacci sequence."""
+        fib = self.FIBONACCI[min(attempt, len(self.FIBONACCI) - 1)]
+        return self.apply_jitter(min(self.base * fib, self.max_wait))
+    
+    def schedule(self, max_attempts: int) -> Optional[Tuple[float, ...]]:
+        """Capped Fibonacci wait per attempt."""
+        last = len(self.FIBONACCI) - 1
+        return tuple(
+            min(self.base * self.FIBONACCI[min(attempt, last)], self.max_wait)
+            for attempt in range(max_attempts)
+        )
+    
+    def apply_jitter(self, wait_time: float) -> float:
+        """Full jitter, if enabled."""
         if self.jitter:
-            # Add random jitter to prevent thundering herd
-            wait_time *= (0.5 + random.random())
-        
+            return self.rng.uniform(0, wait_time)
         return wait_time
 
 
@@ -71,6 +234,10 @@ class LinearBackoff(RetryStrategy):
     def get_wait_time(self, attempt: int) -> float:
         """Calculate wait time with linear backoff."""
         return min(self.increment * (attempt + 1), self.max_wait)
+    
+    def schedule(self, max_attempts: int) -> Optional[Tuple[float, ...]]:
+        """Linear wait per attempt."""
+        return tuple(self.get_wait_time(attempt) for attempt in range(max_attempts))
 
 
 class FixedDelay(RetryStrategy):
@@ -82,10 +249,20 @@ class FixedDelay(RetryStrategy):
     def get_wait_time(self, attempt: int) -> float:
         """Return fixed wait time."""
         return self.delay
+    
+    def schedule(self, max_attempts: int) -> Optional[Tuple[float, ...]]:
+        """The fixed delay for every attempt."""
+        return (self.delay,) * max_attempts
 
 
 class RetryConfig:
-    """Configuration for retry behavior."""
+    """Configuration for retry behavior.
+    
+    non_retryable_exceptions defaults to (NonRetryableError,), which also
+    covers CircuitBreakerOpenError so an open circuit fails fast.
+    asyncio.CancelledError, KeyboardInterrupt and SystemExit are always
+    re-raised immediately, even if retryable_exceptions would match them.
+    """
     
     def __init__(
         self,
@@ -100,8 +277,89 @@ class RetryConfig:
         self.strategy = strategy or ExponentialBackoff()
         self.retryable_exceptions = retryable_exceptions or (Exception,)
         self.non_retryable_exceptions = non_retryable_exceptions or (NonRetryableError,)
+        
+        overlap = set(self.retryable_exceptions) & set(self.non_retryable_exceptions)
+        if overlap:
+            names = ", ".join(sorted(exc.__name__ for exc in overlap))
+            raise ValueError(f"Exceptions cannot be both retryable and non-retryable: {names}")
+        
+        # Narrowest tuples for the isinstance checks: non-retryable wins, so
+        # drop retryable types it already covers, and any subsumed duplicates
+        self._non_retryable = tuple(self.non_retryable_exceptions)
+        self._retryable = _narrow_exceptions(
+            exc for exc in self.retryable_exceptions
+            if not issubclass(exc, self._non_retryable)
+        )
         self.on_retry = on_retry
         self.on_failure = on_failure
+        
+        # Callbacks are fixed here, so classify them once rather than per retry
+        self._on_retry_is_coro = on_retry is not None and asyncio.iscoroutinefunction(on_retry)
+        self._on_failure_is_coro = on_failure is not None and asyncio.iscoroutinefunction(on_failure)
+        
+        # Attempt-indexed wait caps, computed once; jitter is applied per retry
+        self._caps = _strategy_schedule(self.strategy, max_attempts)
+    
+    def wait_time(self, attempt: int) -> float:
+        """Wait before retrying after the given (0-based) attempt."""
+        if self._caps is None or attempt >= len(self._caps):
+            return self.strategy.get_wait_time(attempt)
+        return self.strategy.apply_jitter(self._caps[attempt])
+
+
+def _narrow_exceptions(exceptions: Iterable[Type[BaseException]]) -> Tuple[Type[BaseException], ...]:
+    """Drop exception types already covered by a base class in the same set."""
+    exceptions = tuple(dict.fromkeys(exceptions))
+    return tuple(
+        exc for exc in exceptions
+        if not any(other is not exc and issubclass(exc, other) for other in exceptions)
+    )
+
+
+def _strategy_schedule(strategy: RetryStrategy, max_attempts: int) -> Optional[Tuple[float, ...]]:
+    """Precomputed caps for a strategy, unless a subclass overrides get_wait_time.
+    
+    schedule() only describes get_wait_time of the class that defines it; a
+    subclass that customizes get_wait_time alone must keep being called.
+    """
+    mro = type(strategy).__mro__
+    schedule_owner = next(cls for cls in mro if "schedule" in cls.__dict__)
+    wait_owner = next(cls for cls in mro if "get_wait_time" in cls.__dict__)
+    if schedule_owner is not wait_owner:
+        return None
+    return strategy.schedule(max_attempts)
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_config(*args: Any) -> RetryConfig:
+    return RetryConfig(*args)
+
+
+def _build_config(
+    max_attempts: int,
+    strategy: Optional[RetryStrategy],
+    retryable_exceptions: Optional[Tuple[Type[Exception], ...]],
+    non_retryable_exceptions: Optional[Tuple[Type[Exception], ...]],
+    on_retry: Optional[Callable],
+    on_failure: Optional[Callable],
+) -> RetryConfig:
+    """Build a RetryConfig, sharing one instance between identical decorators.
+    
+    Falls back to a fresh config when any argument is unhashable.
+    """
+    args = (
+        max_attempts,
+        strategy,
+        retryable_exceptions,
+        non_retryable_exceptions,
+        on_retry,
+        on_failure,
+    )
+    try:
+        hash(args)
+    except TypeError:
+        return RetryConfig(*args)
+    return _cached_config(*args)
 
 
 def retry(
@@ -125,13 +383,13 @@ def retry(
     Returns:
         Decorated function with retry logic
     """
-    config = RetryConfig(
-        max_attempts=max_attempts,
-        strategy=strategy,
-        retryable_exceptions=retryable_exceptions,
-        non_retryable_exceptions=non_retryable_exceptions,
-        on_retry=on_retry,
-        on_failure=on_failure,
+    config = _build_config(
+        max_attempts,
+        strategy,
+        retryable_exceptions,
+        non_retryable_exceptions,
+        on_retry,
+        on_failure,
     )
     
     def decorator(func: Callable) -> Callable:
@@ -144,6 +402,134 @@ def retry(
     return decorator
 
 
+_RETRY_AFTER_CAP = 60.0  # Used when the strategy has no max_wait
+_RETRY_AFTER_JITTER = 0.25
+
+
+def _normalize_retry_after(
+    value: Union[int, float, str, None], cap: float, rng: random.Random
+) -> Optional[float]:
+    """Turn a server Retry-After hint into a bounded, jittered wait.
+    
+    Accepts delay-seconds (number or numeric string) or an HTTP-date. The
+    wait is capped so a bogus hint cannot park a worker for hours, then up
+    to 25% jitter is added so clients honoring the same hint spread out.
+    
+    Args:
+        value: Retry-After value from the server
+        cap: Maximum wait before jitter
+        rng: Source of the jitter (the strategy's, so seeded runs reproduce)
+    
+    Returns:
+        Wait in seconds, or None if the hint is missing or unusable
+    """
+    if value is None or isinstance(value, bool):
+        return None
+    
+    if isinstance(value, str):
+        value = value.strip()
+        try:
+            seconds = float(value)
+        except ValueError:
+            try:
+                when = email.utils.parsedate_to_datetime(value)
+            except (TypeError, ValueError):
+                return None
+            if when.tzinfo is None:
+                when = when.replace(tzinfo=timezone.utc)
+            seconds = (when - datetime.now(timezone.utc)).total_seconds()
+    else:
+        seconds = float(value)
+    
+    if not seconds > 0:
+        return None
+    
+    seconds = min(seconds, cap)
+    return seconds + rng.uniform(0, _RETRY_AFTER_JITTER * seconds)
+
+
+# Never retried, whatever retryable_exceptions says
+_NEVER_RETRY = (asyncio.CancelledError, KeyboardInterrupt, SystemExit)
+
+_CALL = ("call", None)
+_RAISE = ("raise", None)
+
+
+def _retry_machine(
+    func_name: str,
+    config: RetryConfig
+) -> Generator[Tuple[str, Any], Optional[BaseException], None]:
+    """Retry decisions shared by the sync and async executors.
+    
+    Yields events for the caller to act on:
+        ("call", None): run the function; on failure send() the exception
+        ("raise", None): re-raise the exception just sent
+        ("retry", (attempt, exc, wait_time)): notify on_retry, sleep, next()
+        ("fail", last_exception): all attempts used; notify on_failure, raise
+    """
+    # Hoisted out of the loop: each is read on every failed attempt
+    max_attempts = config.max_attempts
+    last_attempt = max_attempts - 1
+    non_retryable = config._non_retryable
+    retryable = config._retryable
+    wait_time_for = config.wait_time
+    last_exception = None
+    
+    for attempt in range(max_attempts):
+        e = yield _CALL
+        
+        if isinstance(e, _NEVER_RETRY):
+            # Cancellation and interpreter shutdown propagate untouched
+            yield _RAISE
+            return
+        
+        if isinstance(e, non_retryable):
+            # Don't retry these exceptions
+            logger.error("%s failed with non-retryable error: %s", func_name, e)
+            yield _RAISE
+            return
+        
+        if isinstance(e, RateLimitError):
+            # Special handling for rate limits
+            last_exception = e
+            if attempt < last_attempt:
+                wait_time = _normalize_retry_after(
+                    e.retry_after,
+                    getattr(config.strategy, "max_wait", _RETRY_AFTER_CAP),
+                    config.strategy.rng,
+                )
+                if wait_time is None:
+                    wait_time = wait_time_for(attempt)
+                logger.warning(
+                    "%s rate limited, waiting %ss (attempt %d/%d)",
+                    func_name, wait_time, attempt + 1, max_attempts,
+                )
+                yield ("retry", (attempt, e, wait_time))
+                continue
+            break
+        
+        if isinstance(e, retryable):
+            last_exception = e
+            if attempt < last_attempt:
+                wait_time = wait_time_for(attempt)
+                logger.warning(
+                    "%s failed with %s: %s, retrying in %ss (attempt %d/%d)",
+                    func_name, type(e).__name__, e, wait_time, attempt + 1, max_attempts,
+                )
+                yield ("retry", (attempt, e, wait_time))
+                continue
+            break
+        
+        # Not ours to handle
+        yield _RAISE
+        return
+    
+    logger.error(
+        "%s failed after %d attempts: %s", func_name, max_attempts, last_exception
+    )
+    yield ("fail", last_exception)
+
+
 def execute_with_retry(
     func: Callable,
     args: tuple,
@@ -152,6 +538,9 @@ def execute_with_retry(
 ) -> Any:
     """Execute function with retry logic.
     
+    Waits between attempts block the calling thread. Use
+    async_execute_with_retry from coroutines so the event loop keeps running.
+    
     Args:
         func: Function to execute
         args: Function arguments
@@ -164,61 +553,35 @@ def execute_with_retry(
     Raises:
         Last exception if all retries fail
     """
-    last_exception = None
+    on_retry = config.on_retry
+    on_failure = config.on_failure
+    machine = _retry_machine(func.__name__, config)
+    event = next(machine)
     
-    for attempt in range(config.max_attempts):
-        try:
-            return func(*args, **kwargs)
-            
-        except config.non_retryable_exceptions as e:
-            # Don't retry these exceptions
-            logger.error(f"{func.__name__} failed with non-retryable error: {e}")
-            raise
-            
-        except RateLimitError as e:
-            # Special handling for rate limits
-            if attempt < config.max_attempts - 1:
-                wait_time = e.retry_after if e.retry_after else config.strategy.get_wait_time(attempt)
-                logger.warning(
-                    f"{func.__name__} rate limited, waiting {wait_time}s "
-                    f"(attempt {attempt + 1}/{config.max_attempts})"
-                )
-                
-                if config.on_retry:
-                    config.on_retry(attempt, e, wait_time)
-                
-                time.sleep(wait_time)
-                last_exception = e
-            else:
-                last_exception = e
-                break
-                
-        except config.retryable_exceptions as e:
-            last_exception = e
-            
-            if attempt < config.max_attempts - 1:
-                wait_time = config.strategy.get_wait_time(attempt)
-                logger.warning(
-                    f"{func.__name__} failed with {type(e).__name__}: {e}, "
-                    f"retrying in {wait_time}s (attempt {attempt + 1}/{config.max_attempts})"
-                )
-                
-                if config.on_retry:
-                    config.on_retry(attempt, e, wait_time)
-                
-                time.sleep(wait_time)
-            else:
-                break
-    
-    # All retries failed
-    logger.error(
-        f"{func.__name__} failed after {config.max_attempts} attempts: {last_exception}"
-    )
-    
-    if config.on_failure:
-        config.on_failure(last_exception)
-    
-    raise last_exception
+    while True:
+        action, value = event
+        
+        if action == "call":
+            try:
+                return func(*args, **kwargs)
+            except BaseException as e:
+                event = machine.send(e)
+                if event[0] == "raise":
+                    raise
+            continue
+        
+        if action == "retry":
+            attempt, exc, wait_time = value
+            if on_retry:
+                on_retry(attempt, exc, wait_time)
+            _sleep(wait_time)
+            event = next(machine)
+            continue
+        
+        # All retries failed
+        if on_failure:
+            on_failure(value)
+        raise value
 
 
 def async_retry(
@@ -242,13 +605,13 @@ def async_retry(
     Returns:
         Decorated async function with retry logic
     """
-    config = RetryConfig(
-        max_attempts=max_attempts,
-        strategy=strategy,
-        retryable_exceptions=retryable_exceptions,
-        non_retryable_exceptions=non_retryable_exceptions,
-        on_retry=on_retry,
-        on_failure=on_failure,
+    config = _build_config(
+        max_attempts,
+        strategy,
+        retryable_exceptions,
+        non_retryable_exceptions,
+        on_retry,
+        on_failure,
     )
     
     def decorator(func: Callable) -> Callable:
@@ -281,71 +644,74 @@ async def async_execute_with_retry(
     Raises:
         Last exception if all retries fail
     """
-    last_exception = None
-    
-    for attempt in range(config.max_attempts):
-        try:
-            return await func(*args, **kwargs)
-            
-        except config.non_retryable_exceptions as e:
-            logger.error(f"{func.__name__} failed with non-retryable error: {e}")
+    if config.max_attempts < 1:
+        machine = _retry_machine(func.__name__, config)
+        return await _async_retry_loop(func, args, kwargs, config, machine, next(machine))
+    
+    # Fast path: the first attempt usually succeeds, so only set up the
+    # retry machinery once it fails
+    try:
+        return await func(*args, **kwargs)
+    except BaseException as e:
+        machine = _retry_machine(func.__name__, config)
+        next(machine)
+        event = machine.send(e)
+        if event[0] == "raise":
             raise
-            
-        except RateLimitError as e:
-            if attempt < config.max_attempts - 1:
-                wait_time = e.retry_after if e.retry_after else config.strategy.get_wait_time(attempt)
-                logger.warning(
-                    f"{func.__name__} rate limited, waiting {wait_time}s "
-                    f"(attempt {attempt + 1}/{config.max_attempts})"
-                )
-                
-                if config.on_retry:
-                    if asyncio.iscoroutinefunction(config.on_retry):
-                        await config.on_retry(attempt, e, wait_time)
-                    else:
-                        config.on_retry(attempt, e, wait_time)
-                
-                await asyncio.sleep(wait_time)
-                last_exception = e
-            else:
-                last_exception = e
-                break
-                
-        except config.retryable_exceptions as e:
-            last_exception = e
-            
-            if attempt < config.max_attempts - 1:
-                wait_time = config.strategy.get_wait_time(attempt)
-                logger.warning(
-                    f"{func.__name__} failed with {type(e).__name__}: {e}, "
-                    f"retrying in {wait_time}s (attempt {attempt + 1}/{config.max_attempts})"
-                )
-                
-                if config.on_retry:
-                    if asyncio.iscoroutinefunction(config.on_retry):
-                        await config.on_retry(attempt, e, wait_time)
-                    else:
-                        config.on_retry(attempt, e, wait_time)
-                
-                await asyncio.sleep(wait_time)
-            else:
-                break
     
-    logger.error(
-        f"{func.__name__} failed after {config.max_attempts} attempts: {last_exception}"
-    )
-    
-    if config.on_failure:
-        if asyncio.iscoroutinefunction(config.on_failure):
-            await config.on_failure(last_exception)
-        else:
-            config.on_failure(last_exception)
+    return await _async_retry_loop(func, args, kwargs, config, machine, event)
+
+
+async def _async_retry_loop(
+    func: Callable,
+    args: tuple,
+    kwargs: dict,
+    config: RetryConfig,
+    machine: Generator[Tuple[str, Any], Optional[BaseException], None],
+    event: Tuple[str, Any],
+) -> Any:
+    """Carry on async retries from the given machine event."""
+    on_retry = config.on_retry
+    on_failure = config.on_failure
     
-    raise last_exception
+    while True:
+        action, value = event
+        
+        if action == "call":
+            try:
+                return await func(*args, **kwargs)
+            except BaseException as e:
+                event = machine.send(e)
+                if event[0] == "raise":
+                    raise
+            continue
+        
+        if action == "retry":
+            attempt, exc, wait_time = value
+            if on_retry:
+                if config._on_retry_is_coro:
+                    await on_retry(attempt, exc, wait_time)
+                else:
+                    on_retry(attempt, exc, wait_time)
+            await asyncio.sleep(wait_time)
+            event = next(machine)
+            continue
+        
+        # All retries failed
+        if on_failure:
+            if config._on_failure_is_coro:
+                await on_failure(value)
+            else:
+                on_failure(value)
+        raise value
 
 
 class CircuitBreaker:
-    """Circuit breaker pattern for preventing cascading failures."""
+    """Circuit breaker pattern for preventing cascading failures.
+    
+    Safe to share between threads: state transitions happen under a lock and
+    only one probe call is let through while half-open.
+    """
     
     def __init__(
         self,
@@ -358,8 +724,26 @@ class CircuitBreaker:
         self.expected_exception = expected_exception
         
         self.failure_count = 0
-        self.last_failure_time = None
+        self.last_failure_time = None  # time.monotonic() of the last failure
         self.state = "closed"  # closed, open, half-open
+        
+        self._lock = threading.Lock()
+        self._probe_inflight = False
+    
+    def __call__(self, func: Callable) -> Callable:
+        """Use the breaker as a decorator on a sync or async function."""
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                return await self.acall(func, *args, **kwargs)
+            
+            return async_wrapper
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return self.call(func, *args, **kwargs)
+        
+        return wrapper
     
     def call(self, func: Callable, *args, **kwargs) -> Any:
         """Call function with circuit breaker protection.
@@ -373,50 +757,114 @@ class CircuitBreaker:
             Function result
         
         Raises:
-            Exception if circuit is open or function fails
+            CircuitBreakerOpenError: If the circuit is open (never retried by
+                the default retry config, being a NonRetryableError)
+            Exception: Whatever the function raises
         """
-        if self.state == "open":
-            if self._should_attempt_reset():
-                self.state = "half-open"
-            else:
-                raise Exception(f"Circuit breaker is open for {func.__name__}")
+        probe = self._admit(func.__name__)
         
         try:
             result = func(*args, **kwargs)
-            self._on_success()
-            return result
-            
-        except self.expected_exception as e:
+        except self.expected_exception:
             self._on_failure()
             raise
+        except BaseException:
+            self._release_probe(probe)
+            raise
+        
+        self._on_success()
+        return result
+    
+    async def acall(self, func: Callable, *args, **kwargs) -> Any:
+        """Await async function with circuit breaker protection.
+        
+        Shares state with call(), so sync and async callers trip the same
+        circuit. The lock is only held for state checks, never across the await.
+        
+        Args:
+            func: Async function to call
+            *args: Function arguments
+            **kwargs: Function keyword arguments
+        
+        Returns:
+            Function result
+        
+        Raises:
+            CircuitBreakerOpenError: If the circuit is open
+            Exception: Whatever the function raises
+        """
+        probe = self._admit(func.__name__)
+        
+        try:
+            result = await func(*args, **kwargs)
+        except self.expected_exception:
+            self._on_failure()
+            raise
+        except BaseException:
+            self._release_probe(probe)
+            raise
+        
+        self._on_success()
+        return result
+    
+    def _admit(self, name: str) -> bool:
+        """Let a call through or raise if the circuit is open.
+        
+        Returns:
+            True if the call is the single half-open probe
+        """
+        with self._lock:
+            if self.state == "open":
+                if self._should_attempt_reset():
+                    self.state = "half-open"
+                else:
+                    raise CircuitBreakerOpenError(name)
+            
+            if self.state == "half-open":
+                if self._probe_inflight:
+                    raise CircuitBreakerOpenError(name)
+                self._probe_inflight = True
+                return True
+        
+        return False
+    
+    def _release_probe(self, probe: bool) -> None:
+        """Free the probe slot after an exception the breaker doesn't count."""
+        if probe:
+            with self._lock:
+                self._probe_inflight = False
     
     def _should_attempt_reset(self) -> bool:
         """Check if circuit breaker should attempt reset."""
         if self.last_failure_time is None:
             return True
         
-        return time.time() - self.last_failure_time >= self.recovery_timeout
+        return time.monotonic() - self.last_failure_time >= self.recovery_timeout
     
     def _on_success(self) -> None:
         """Handle successful call."""
-        if self.state == "half-open":
-            self.state = "closed"
-            self.failure_count = 0
-            logger.info("Circuit breaker reset to closed")
+        with self._lock:
+            if self.state == "half-open":
+                self.state = "closed"
+                self.failure_count = 0
+                self._probe_inflight = False
+                logger.info("Circuit breaker reset to closed")
     
     def _on_failure(self) -> None:
         """Handle failed call."""
-        self.failure_count += 1
-        self.last_failure_time = time.time()
-        
-        if self.failure_count >= self.failure_threshold:
-            self.state = "open"
-            logger.warning(
-                f"Circuit breaker opened after {self.failure_count} failures"
-            )
-        elif self.state == "half-open":
-            self.state = "open"
-            logger.warning("Circuit breaker reopened after failure in half-open state")
+        with self._lock:
+            self.failure_count += 1
+            self.last_failure_time = time.monotonic()
+            
+            if self.failure_count >= self.failure_threshold:
+                self.state = "open"
+                logger.warning(
+                    "Circuit breaker opened after %d failures", self.failure_count
+                )
+            elif self.state == "half-open":
+                self.state = "open"
+                logger.warning("Circuit breaker reopened after failure in half-open state")
+            self._probe_inflight = False
 
 
 def retry_with_backoff(
@@ -425,7 +873,7 @@ def retry_with_backoff(
     base_delay: float = 1.0,
     max_delay: float = 60.0
 ) -> Any:
-    """Simple retry with exponential backoff helper.
+    """Simple retry helper with decorrelated-jitter exponential backoff.
 
     Args:
         func: Function to execute
@@ -439,7 +887,7 @@ def retry_with_backoff(
     Raises:
         Last exception if all retries fail
     """
-    strategy = ExponentialBackoff(base=base_delay, max_wait=max_delay)
+    strategy = DecorrelatedJitter(base=base_delay, max_wait=max_delay)
     config = RetryConfig(
         max_attempts=max_attempts,
         strategy=strategy,
@@ -450,6 +898,30 @@ def retry_with_backoff(
     return execute_with_retry(func, (), {}, config)
 
 
+def _start_in_daemon_thread(func: Callable, args: tuple, kwargs: dict) -> concurrent.futures.Future:
+    """Run func(*args, **kwargs) on its own daemon thread and return its Future.
+
+    One thread per call, so a call that hangs only ever holds its own thread
+    and never keeps the interpreter from exiting. The caller's contextvars
+    are carried over.
+    """
+    future: concurrent.futures.Future = concurrent.futures.Future()
+    context = contextvars.copy_context()
+
+    def run() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            result = context.run(func, *args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+
+    threading.Thread(target=run, name=f"with_timeout-{func.__name__}", daemon=True).start()
+    return future
+
+
 def with_timeout(timeout: float) -> Callable:
     """Decorator to add timeout to functions.
     
@@ -468,38 +940,27 @@ def with_timeout(timeout: float) -> Callable:
                     timeout=timeout
                 )
             except asyncio.TimeoutError:
-                logger.error(f"{func.__name__} timed out after {timeout}s")
+                logger.error("%s timed out after %ss", func.__name__, timeout)
                 raise
         
         @functools.wraps(func)
         def sync_wrapper(*args, **kwargs):
-            # For sync functions, we'd need threading or multiprocessing
-            # This is a simplified version
-            import signal
-            
-            def timeout_handler(signum, frame):
-                raise TimeoutError(f"{func.__name__} timed out after {timeout}s")
-            
-            # Set the timeout handler
-            signal.signal(signal.SIGALRM, timeout_handler)
-            signal.alarm(int(timeout))
-            
+            # Run on a daemon thread so the timeout works from any thread and
+            # on any platform; the thread cannot be interrupted, so a timed
+            # out call keeps running in the background until it returns
+            future = _start_in_daemon_thread(func, args, kwargs)
             try:
-                result = func(*args, **kwargs)
-                signal.alarm(0)  # Disable the alarm
-                return result
-            except TimeoutError:
-                logger.error(f"{func.__name__} timed out after {timeout}s")
-                raise
+                return future.result(timeout=timeout)
+            except concurrent.futures.TimeoutError:
+                # On 3.11+ this is the builtin TimeoutError, so it may be
+                # func's own; only a still-running future means we timed out
+                if future.done():
+                    return future.result()
+                logger.error("%s timed out after %ss", func.__name__, timeout)
+                raise TimeoutError(f"{func.__name__} timed out after {timeout}s") from None
         
         if asyncio.iscoroutinefunction(func):
             return async_wrapper
-        else:
-            # Note: signal-based timeout only works on Unix-like systems
-            import platform
-            if platform.system() == "Windows":
-                logger.warning("Timeout decorator not fully supported on Windows for sync functions")
-                return func
-            return sync_wrapper
+        return sync_wrapper
     
     return decorator
\ No newline at end of file
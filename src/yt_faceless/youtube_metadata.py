@@ -11,12 +11,11 @@ class VideoChapters:
     items: list[tuple[int, str]]  # (seconds, title)
 
     def to_description_block(self) -> str:
-        lines = ["Chapters:"]
-        for seconds, title in self.items:
-            mm = seconds // 60
-            ss = seconds % 60
-            lines.append(f"{mm:02d}:{ss:02d} - {title}")
-        return "\n".join(lines)
+        def _fmt(item: tuple[int, str]) -> str:
+            mm, ss = divmod(item[0], 60)
+            return f"{mm:02d}:{ss:02d} - {item[1]}"
+
+        return "\n".join(["Chapters:", *map(_fmt, self.items)])
 
 
 @dataclass(slots=True)
@@ -29,10 +28,14 @@ class VideoMetadata:
     chapters: VideoChapters | None = None
 
     def full_description(self) -> str:
-        parts: list[str] = [self.description.strip()]
+        description = self.description.strip()
         if self.chapters and self.chapters.items:
-            parts.append("\n" + self.chapters.to_description_block())
-        return "\n".join(parts)
+            # Blank line between the description and the chapter block
+            return "\n\n".join((description, self.chapters.to_description_block()))
+        return description
+
+
+_POWER_WORDS = ("secret", "ultimate", "new", "2025", "ai", "earn", "fast")
 
 
 def choose_best_title(candidates: Sequence[str]) -> str:
@@ -41,13 +44,11 @@ def choose_best_title(candidates: Sequence[str]) -> str:
     Prefers: brevity (<= 60 chars), power words, and clarity.
     """
     def score(title: str) -> int:
-        s = 0
-        if len(title) <= 60:
-            s += 2
-        power = ["secret", "ultimate", "new", "2025", "ai", "earn", "fast"]
-        s += sum(1 for w in power if w in title.lower())
-        if ":" in title or "-" in title:
-            s += 1
-        return s
+        lower_title = title.lower()
+        return (
+            (2 if len(title) <= 60 else 0)
+            + sum(w in lower_title for w in _POWER_WORDS)
+            + (":" in title or "-" in title)
+        )
 
     return max(candidates, key=score)
@@ -4,137 +4,284 @@ Comprehensive test suite for all n8n MCP workflows.
 Tests all 5 workflows: TTS, YouTube Upload, Analytics, Cross-Platform, and Affiliate Shortener.
 """
 
+import aiohttp
+import asyncio
 import requests
 import json
-import time
+import logging
+import logging.handlers
 import os
+import sys
+import time
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any, List
 import base64
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+from tests._analytics_helpers import loads_json, n8n_is_up
+
 # Load environment variables
 from dotenv import load_dotenv
 load_dotenv()
 
+# Output goes through a buffered logger: records collect in memory and are
+# written in one go when LOG_BUFFER is flushed (or at interpreter exit)
+LOG = logging.getLogger("mcp_tests")
+LOG.setLevel(logging.INFO)
+LOG.propagate = False
+_stdout_handler = logging.StreamHandler(sys.stdout)
+_stdout_handler.setFormatter(logging.Formatter("%(message)s"))
+LOG_BUFFER = logging.handlers.MemoryHandler(capacity=10000, target=_stdout_handler)
+LOG.addHandler(LOG_BUFFER)
+
 # Configuration
 N8N_BASE_URL = os.getenv("N8N_BASE_URL", "http://localhost:5678")
 BACKEND_URL = os.getenv("BACKEND_URL", "http://localhost:8000")
 YOUTUBE_API_KEY = os.getenv("YOUTUBE_API_KEY", "")
+# Opt in to the single test-all fan-out call once that workflow is deployed;
+# otherwise every run would pay for a POST that 404s before the fallback
+N8N_TEST_ALL = os.getenv("N8N_TEST_ALL", "").lower() in ("1", "true", "yes")
+
+# Keep-alive pool for the synchronous requests (the workflow tests share an
+# aiohttp session instead)
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.2)
+))
+
+# Workflow test payload templates; the *_payload builders overlay the
+# timestamped fields so a whole run shares one datetime.now()
+_TTS_TEMPLATE = {
+    "text": "Hello, this is a test of the text to speech system. It should handle multiple sentences well. This is the third sentence to ensure we have enough content.",
+    "voice_id": "EXAVITQu4vr4xnSDxMaL",
+    "provider": "elevenlabs",
+    "model_id": "eleven_monolingual_v1",
+    "chunk_size": 100  # Small chunk size for testing
+}
 
-# Test results storage
+_UPLOAD_TEMPLATE = {
+    "video_path": "C:/AI projects/test_video.mp4",
+    "description": "This is an automated test of the YouTube upload workflow via n8n MCP integration.",
+    "tags": ["test", "automation", "n8n", "mcp"],
+    "category_id": "22",
+    "privacy": "private",
+    "thumbnail_path": "C:/AI projects/test_thumbnail.jpg",
+    "playlist_id": "PLtest123",
+    "slug": "test_upload",
+    "chapters": [
+        {"start": "0:00", "title": "Introduction"},
+        {"start": "1:30", "title": "Main Content"},
+        {"start": "5:00", "title": "Conclusion"}
+    ]
+}
+
+_ANALYTICS_TEMPLATE = {
+    "video_ids": ["dQw4w9WgXcQ", "jNQXAC9IVRw"],  # Famous YouTube videos for testing
+    "metrics": ["views", "likes", "comments", "dislikes"],
+    "start_date": "2024-01-01",
+    "end_date": "2024-12-31"
+}
+
+_DISTRIBUTION_TEMPLATE = {
+    "content": {
+        "description": "Check out this incredible test content! Testing cross-platform distribution via n8n MCP workflows.",
+        "video_path": "https://example.com/test_video.mp4",
+        "thumbnail_path": "https://example.com/test_thumb.jpg",
+        "hashtags": ["test", "automation", "viral", "tech"]
+    },
+    "platforms": ["twitter", "instagram", "linkedin", "tiktok"],
+    "schedule_time": None,  # Post immediately
+    "custom_messages": {
+        "twitter": "🚀 New video alert! Check it out:",
+        "instagram": "New content dropping! 🎬",
+        "linkedin": "Excited to share my latest work on automation",
+        "tiktok": "You won't believe this! #viral"
+    }
+}
+
+_AFFILIATE_TEMPLATE = {
+    "original_url": "https://www.amazon.com/dp/B08N5WRWNW?tag=test-20",
+    "source": "youtube",
+    "medium": "video_description",
+    "content": "product_link",
+    "custom_domain": "bit.ly",
+    "title": "Echo Dot (4th Gen) - Test Link",
+    "tags": ["amazon", "affiliate", "smart-home"],
+    "track_clicks": True,
+    "generate_qr": True
+}
+
+def tts_payload(now: datetime) -> Dict[str, Any]:
+    """TTS payload with a per-run slug."""
+    return {**_TTS_TEMPLATE, "slug": f"test_tts_{now:%Y%m%d_%H%M%S}"}
+
+def upload_payload(now: datetime) -> Dict[str, Any]:
+    """Upload payload with a timestamped title."""
+    return {**_UPLOAD_TEMPLATE, "title": f"Test Upload - {now:%Y-%m-%d %H:%M}"}
+
+def analytics_payload(now: datetime) -> Dict[str, Any]:
+    """Analytics payload (nothing time-dependent)."""
+    return _ANALYTICS_TEMPLATE
+
+def distribution_payload(now: datetime) -> Dict[str, Any]:
+    """Distribution payload with a timestamped content title."""
+    content = {**_DISTRIBUTION_TEMPLATE["content"], "title": f"Amazing Content Test - {now:%H:%M}"}
+    return {**_DISTRIBUTION_TEMPLATE, "content": content}
+
+def affiliate_payload(now: datetime) -> Dict[str, Any]:
+    """Affiliate payload with a dated campaign."""
+    return {**_AFFILIATE_TEMPLATE, "campaign": f"youtube_test_{now:%Y%m%d}"}
+
+# Envelope key -> (workflow name, payload builder) for the test-all multiplex webhook
+BATCH_KEYS = {
+    "tts": ("TTS Generation", tts_payload),
+    "upload": ("YouTube Upload", upload_payload),
+    "analytics": ("YouTube Analytics", analytics_payload),
+    "distribute": ("Cross-Platform Distribution", distribution_payload),
+    "affiliate": ("Affiliate Shortener", affiliate_payload),
+}
+
+# Test results summary; per-workflow results are streamed to a JSON Lines file
 test_results = {
     "timestamp": datetime.now().isoformat(),
-    "workflows": {},
     "summary": {"passed": 0, "failed": 0, "total": 5}
 }
 
+def dumps_json(data: Any, indent: bool = True) -> bytes:
+    """Serialize results as UTF-8 JSON, with orjson when available."""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, option=option, default=str)
+    return json.dumps(data, indent=2 if indent else None, default=str, ensure_ascii=False).encode("utf-8")
+
+def record_result(out, name: str, result: Dict[str, Any]):
+    """Count a workflow result and append it to the JSON Lines results file."""
+    if result.get("success"):
+        test_results["summary"]["passed"] += 1
+    else:
+        test_results["summary"]["failed"] += 1
+    out.write(dumps_json({"workflow": name, **result}, indent=False) + b"\n")
+    out.flush()
+
+def jsonl_to_results(path: str) -> Dict[str, Any]:
+    """Rebuild the nested {timestamp, workflows, summary} report from a .jsonl file."""
+    results = {"workflows": {}}
+    with open(path, "rb") as f:
+        for line in f:
+            record = loads_json(line)
+            if not record:
+                continue
+            if "workflow" in record:
+                results["workflows"][record.pop("workflow")] = record
+            else:
+                results.update(record)
+    return results
+
 def print_header(title: str):
     """Print a formatted header."""
-    print("\n" + "=" * 70)
-    print(f"  {title}")
-    print("=" * 70)
+    LOG.info("\n" + "=" * 70)
+    LOG.info(f"  {title}")
+    LOG.info("=" * 70)
 
 def print_test_result(workflow: str, success: bool, details: str = ""):
     """Print formatted test result."""
     icon = "✅" if success else "❌"
-    print(f"{icon} {workflow}: {'PASSED' if success else 'FAILED'}")
+    LOG.info(f"{icon} {workflow}: {'PASSED' if success else 'FAILED'}")
     if details:
-        print(f"   Details: {details}")
-
-def test_tts_webhook() -> Dict[str, Any]:
+        LOG.info(f"   Details: {details}")
+
+def success_details(workflow: str, result: Dict[str, Any]) -> str:
+    """Summary line for a passed workflow test."""
+    response, test_data = result["response"], result["test_data"]
+    if workflow == "TTS Generation":
+        return f"Audio chunks processed for slug: {test_data['slug']}"
+    if workflow == "YouTube Upload":
+        return f"Video ID: {response.get('video_id', 'unknown')}"
+    if workflow == "YouTube Analytics":
+        return f"Analyzed {len(test_data['video_ids'])} videos"
+    if workflow == "Cross-Platform Distribution":
+        platforms_posted = response.get("successful_platforms", [])
+        return f"Posted to {len(platforms_posted)}/{len(test_data['platforms'])} platforms"
+    return f"Shortened URL: {response.get('short_url', 'N/A')}"
+
+async def check_tts_webhook(session: aiohttp.ClientSession, now: datetime) -> Dict[str, Any]:
     """Test TTS Generation webhook workflow."""
     print_header("Testing TTS Generation Workflow")
 
     webhook_url = f"{N8N_BASE_URL}/webhook/tts-generation"
-    test_data = {
-        "text": "Hello, this is a test of the text to speech system. It should handle multiple sentences well. This is the third sentence to ensure we have enough content.",
-        "slug": "test_tts_" + datetime.now().strftime("%Y%m%d_%H%M%S"),
-        "voice_id": "EXAVITQu4vr4xnSDxMaL",
-        "provider": "elevenlabs",
-        "model_id": "eleven_monolingual_v1",
-        "chunk_size": 100  # Small chunk size for testing
-    }
+    test_data = tts_payload(now)
 
-    print(f"Webhook URL: {webhook_url}")
-    print(f"Test slug: {test_data['slug']}")
+    LOG.info(f"Webhook URL: {webhook_url}")
+    LOG.info(f"Test slug: {test_data['slug']}")
 
     try:
-        response = requests.post(
+        async with session.post(
             webhook_url,
             json=test_data,
             headers={"Content-Type": "application/json"},
-            timeout=30
-        )
-
-        success = response.status_code == 200
-        result = {
-            "success": success,
-            "status_code": response.status_code,
-            "response": response.json() if success else response.text,
-            "test_data": test_data
-        }
+            timeout=aiohttp.ClientTimeout(total=30)
+        ) as response:
+            success = response.status == 200
+            result = {
+                "success": success,
+                "status_code": response.status,
+                "response": loads_json(await response.read()) if success else await response.text(),
+                "test_data": test_data
+            }
 
         if success:
-            print_test_result("TTS Generation", True, f"Audio chunks processed for slug: {test_data['slug']}")
+            print_test_result("TTS Generation", True, success_details("TTS Generation", result))
         else:
-            print_test_result("TTS Generation", False, f"Status code: {response.status_code}")
+            print_test_result("TTS Generation", False, f"Status code: {response.status}")
 
         return result
 
-    except requests.exceptions.ConnectionError:
+    except aiohttp.ClientConnectionError:
         print_test_result("TTS Generation", False, "Cannot connect to n8n webhook")
         return {"success": False, "error": "Connection refused"}
     except Exception as e:
         print_test_result("TTS Generation", False, str(e))
         return {"success": False, "error": str(e)}
 
-def test_youtube_upload() -> Dict[str, Any]:
+async def check_youtube_upload(session: aiohttp.ClientSession, now: datetime) -> Dict[str, Any]:
     """Test YouTube Upload webhook workflow."""
     print_header("Testing YouTube Upload Workflow")
 
     webhook_url = f"{N8N_BASE_URL}/webhook/youtube-upload"
-    test_data = {
-        "video_path": "C:/AI projects/test_video.mp4",
-        "title": "Test Upload - " + datetime.now().strftime("%Y-%m-%d %H:%M"),
-        "description": "This is an automated test of the YouTube upload workflow via n8n MCP integration.",
-        "tags": ["test", "automation", "n8n", "mcp"],
-        "category_id": "22",
-        "privacy": "private",
-        "thumbnail_path": "C:/AI projects/test_thumbnail.jpg",
-        "playlist_id": "PLtest123",
-        "slug": "test_upload",
-        "chapters": [
-            {"start": "0:00", "title": "Introduction"},
-            {"start": "1:30", "title": "Main Content"},
-            {"start": "5:00", "title": "Conclusion"}
-        ]
-    }
+    test_data = upload_payload(now)
 
-    print(f"Webhook URL: {webhook_url}")
-    print(f"Video title: {test_data['title']}")
+    LOG.info(f"Webhook URL: {webhook_url}")
+    LOG.info(f"Video title: {test_data['title']}")
 
     try:
-        response = requests.post(
+        async with session.post(
             webhook_url,
             json=test_data,
             headers={"Content-Type": "application/json"},
-            timeout=60
-        )
-
-        success = response.status_code == 200
-        result = {
-            "success": success,
-            "status_code": response.status_code,
-            "response": response.json() if success else response.text,
-            "test_data": test_data
-        }
+            timeout=aiohttp.ClientTimeout(total=60)
+        ) as response:
+            success = response.status == 200
+            result = {
+                "success": success,
+                "status_code": response.status,
+                "response": loads_json(await response.read()) if success else await response.text(),
+                "test_data": test_data
+            }
 
         if success:
-            video_id = result["response"].get("video_id", "unknown")
-            print_test_result("YouTube Upload", True, f"Video ID: {video_id}")
+            print_test_result("YouTube Upload", True, success_details("YouTube Upload", result))
         else:
-            print_test_result("YouTube Upload", False, f"Status code: {response.status_code}")
+            print_test_result("YouTube Upload", False, f"Status code: {response.status}")
 
         return result
 
@@ -142,45 +289,38 @@ def test_youtube_upload() -> Dict[str, Any]:
         print_test_result("YouTube Upload", False, str(e))
         return {"success": False, "error": str(e)}
 
-def test_youtube_analytics() -> Dict[str, Any]:
+async def check_youtube_analytics(session: aiohttp.ClientSession, now: datetime) -> Dict[str, Any]:
     """Test YouTube Analytics webhook workflow."""
     print_header("Testing YouTube Analytics Workflow")
 
     webhook_url = f"{N8N_BASE_URL}/webhook/youtube-analytics"
-    test_data = {
-        "video_ids": ["dQw4w9WgXcQ", "jNQXAC9IVRw"],  # Famous YouTube videos for testing
-        "metrics": ["views", "likes", "comments", "dislikes"],
-        "start_date": "2024-01-01",
-        "end_date": "2024-12-31"
-    }
+    test_data = analytics_payload(now)
 
-    print(f"Webhook URL: {webhook_url}")
-    print(f"Analyzing {len(test_data['video_ids'])} videos")
+    LOG.info(f"Webhook URL: {webhook_url}")
+    LOG.info(f"Analyzing {len(test_data['video_ids'])} videos")
 
     try:
-        response = requests.post(
+        async with session.post(
             webhook_url,
             json=test_data,
             headers={
                 "Content-Type": "application/json",
                 "X-API-Key": YOUTUBE_API_KEY
             },
-            timeout=30
-        )
-
-        success = response.status_code == 200
-        result = {
-            "success": success,
-            "status_code": response.status_code,
-            "response": response.json() if success else response.text,
-            "test_data": test_data
-        }
+            timeout=aiohttp.ClientTimeout(total=30)
+        ) as response:
+            success = response.status == 200
+            result = {
+                "success": success,
+                "status_code": response.status,
+                "response": loads_json(await response.read()) if success else await response.text(),
+                "test_data": test_data
+            }
 
         if success:
-            metrics = result["response"].get("aggregate_metrics", {})
-            print_test_result("YouTube Analytics", True, f"Analyzed {len(test_data['video_ids'])} videos")
+            print_test_result("YouTube Analytics", True, success_details("YouTube Analytics", result))
         else:
-            print_test_result("YouTube Analytics", False, f"Status code: {response.status_code}")
+            print_test_result("YouTube Analytics", False, f"Status code: {response.status}")
 
         return result
 
@@ -188,54 +328,36 @@ def test_youtube_analytics() -> Dict[str, Any]:
         print_test_result("YouTube Analytics", False, str(e))
         return {"success": False, "error": str(e)}
 
-def test_cross_platform_distribution() -> Dict[str, Any]:
+async def check_cross_platform_distribution(session: aiohttp.ClientSession, now: datetime) -> Dict[str, Any]:
     """Test Cross-Platform Distribution webhook workflow."""
     print_header("Testing Cross-Platform Distribution Workflow")
 
     webhook_url = f"{N8N_BASE_URL}/webhook/cross-platform-distribute"
-    test_data = {
-        "content": {
-            "title": "Amazing Content Test - " + datetime.now().strftime("%H:%M"),
-            "description": "Check out this incredible test content! Testing cross-platform distribution via n8n MCP workflows.",
-            "video_path": "https://example.com/test_video.mp4",
-            "thumbnail_path": "https://example.com/test_thumb.jpg",
-            "hashtags": ["test", "automation", "viral", "tech"]
-        },
-        "platforms": ["twitter", "instagram", "linkedin", "tiktok"],
-        "schedule_time": None,  # Post immediately
-        "custom_messages": {
-            "twitter": "🚀 New video alert! Check it out:",
-            "instagram": "New content dropping! 🎬",
-            "linkedin": "Excited to share my latest work on automation",
-            "tiktok": "You won't believe this! #viral"
-        }
-    }
+    test_data = distribution_payload(now)
 
-    print(f"Webhook URL: {webhook_url}")
-    print(f"Platforms: {', '.join(test_data['platforms'])}")
+    LOG.info(f"Webhook URL: {webhook_url}")
+    LOG.info(f"Platforms: {', '.join(test_data['platforms'])}")
 
     try:
-        response = requests.post(
+        async with session.post(
             webhook_url,
             json=test_data,
             headers={"Content-Type": "application/json"},
-            timeout=45
-        )
-
-        success = response.status_code == 200
-        result = {
-            "success": success,
-            "status_code": response.status_code,
-            "response": response.json() if success else response.text,
-            "test_data": test_data
-        }
+            timeout=aiohttp.ClientTimeout(total=45)
+        ) as response:
+            success = response.status == 200
+            result = {
+                "success": success,
+                "status_code": response.status,
+                "response": loads_json(await response.read()) if success else await response.text(),
+                "test_data": test_data
+            }
 
         if success:
-            platforms_posted = result["response"].get("successful_platforms", [])
             print_test_result("Cross-Platform Distribution", True,
-                            f"Posted to {len(platforms_posted)}/{len(test_data['platforms'])} platforms")
+                            success_details("Cross-Platform Distribution", result))
         else:
-            print_test_result("Cross-Platform Distribution", False, f"Status code: {response.status_code}")
+            print_test_result("Cross-Platform Distribution", False, f"Status code: {response.status}")
 
         return result
 
@@ -243,48 +365,35 @@ def test_cross_platform_distribution() -> Dict[str, Any]:
         print_test_result("Cross-Platform Distribution", False, str(e))
         return {"success": False, "error": str(e)}
 
-def test_affiliate_shortener() -> Dict[str, Any]:
+async def check_affiliate_shortener(session: aiohttp.ClientSession, now: datetime) -> Dict[str, Any]:
     """Test Affiliate Link Shortener webhook workflow."""
     print_header("Testing Affiliate Link Shortener Workflow")
 
     webhook_url = f"{N8N_BASE_URL}/webhook/affiliate-shorten"
-    test_data = {
-        "original_url": "https://www.amazon.com/dp/B08N5WRWNW?tag=test-20",
-        "campaign": "youtube_test_" + datetime.now().strftime("%Y%m%d"),
-        "source": "youtube",
-        "medium": "video_description",
-        "content": "product_link",
-        "custom_domain": "bit.ly",
-        "title": "Echo Dot (4th Gen) - Test Link",
-        "tags": ["amazon", "affiliate", "smart-home"],
-        "track_clicks": True,
-        "generate_qr": True
-    }
+    test_data = affiliate_payload(now)
 
-    print(f"Webhook URL: {webhook_url}")
-    print(f"Original URL: {test_data['original_url'][:50]}...")
+    LOG.info(f"Webhook URL: {webhook_url}")
+    LOG.info(f"Original URL: {test_data['original_url'][:50]}...")
 
     try:
-        response = requests.post(
+        async with session.post(
             webhook_url,
             json=test_data,
             headers={"Content-Type": "application/json"},
-            timeout=20
-        )
-
-        success = response.status_code == 200
-        result = {
-            "success": success,
-            "status_code": response.status_code,
-            "response": response.json() if success else response.text,
-            "test_data": test_data
-        }
+            timeout=aiohttp.ClientTimeout(total=20)
+        ) as response:
+            success = response.status == 200
+            result = {
+                "success": success,
+                "status_code": response.status,
+                "response": loads_json(await response.read()) if success else await response.text(),
+                "test_data": test_data
+            }
 
         if success:
-            short_url = result["response"].get("short_url", "N/A")
-            print_test_result("Affiliate Shortener", True, f"Shortened URL: {short_url}")
+            print_test_result("Affiliate Shortener", True, success_details("Affiliate Shortener", result))
         else:
-            print_test_result("Affiliate Shortener", False, f"Status code: {response.status_code}")
+            print_test_result("Affiliate Shortener", False, f"Status code: {response.status}")
 
         return result
 
@@ -292,111 +401,181 @@ def test_affiliate_shortener() -> Dict[str, Any]:
         print_test_result("Affiliate Shortener", False, str(e))
         return {"success": False, "error": str(e)}
 
-def run_all_tests():
-    """Run all workflow tests and generate report."""
-    print("\n" + "🚀" * 35)
-    print("     N8N MCP WORKFLOWS - COMPREHENSIVE TEST SUITE")
-    print("🚀" * 35)
-    print(f"\nTimestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"n8n URL: {N8N_BASE_URL}")
-    print(f"Backend URL: {BACKEND_URL}")
-    print(f"API Key: {YOUTUBE_API_KEY[:10]}..." if YOUTUBE_API_KEY else "API Key: Not set")
-
-    # Run all tests
+async def run_batched_tests(session: aiohttp.ClientSession, now: datetime):
+    """Run every workflow test through the test-all multiplex webhook.
+
+    The webhook fans the envelope out to the five workflows inside n8n and
+    answers with {key: {"status_code": ..., "response": ...}} per workflow.
+
+    Returns:
+        Results in BATCH_KEYS order, or None if the webhook isn't deployed
+    """
+    webhook_url = f"{N8N_BASE_URL}/webhook/test-all"
+    payloads = {key: build(now) for key, (_, build) in BATCH_KEYS.items()}
+
+    print_header("Testing All Workflows (batched)")
+    LOG.info(f"Webhook URL: {webhook_url}")
+
+    try:
+        async with session.post(
+            webhook_url,
+            json=payloads,
+            headers={
+                "Content-Type": "application/json",
+                "X-API-Key": YOUTUBE_API_KEY
+            },
+            timeout=aiohttp.ClientTimeout(total=90)
+        ) as response:
+            if response.status == 404:
+                LOG.info("test-all webhook not deployed, calling each workflow instead")
+                return None
+            if response.status != 200:
+                LOG.info(f"test-all webhook failed with status {response.status}, calling each workflow instead")
+                return None
+            batch = loads_json(await response.read()) or {}
+    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+        LOG.info(f"test-all webhook unavailable ({e}), calling each workflow instead")
+        return None
+
+    results = []
+    for key, (name, _) in BATCH_KEYS.items():
+        entry = batch.get(key) or {}
+        status_code = entry.get("status_code")
+        success = status_code == 200
+        result = {
+            "success": success,
+            "status_code": status_code,
+            "response": entry.get("response"),
+            "test_data": payloads[key]
+        }
+        if success:
+            print_test_result(name, True, success_details(name, result))
+        else:
+            print_test_result(name, False, f"Status code: {status_code}")
+        results.append(result)
+    return results
+
+async def run_all_tests():
+    """Run all workflow tests concurrently and generate report."""
+    LOG.info("\n" + "🚀" * 35)
+    LOG.info("     N8N MCP WORKFLOWS - COMPREHENSIVE TEST SUITE")
+    LOG.info("🚀" * 35)
+    now = datetime.now()
+    LOG.info(f"\nTimestamp: {now:%Y-%m-%d %H:%M:%S}")
+    LOG.info(f"n8n URL: {N8N_BASE_URL}")
+    LOG.info(f"Backend URL: {BACKEND_URL}")
+    LOG.info(f"API Key: {YOUTUBE_API_KEY[:10]}..." if YOUTUBE_API_KEY else "API Key: Not set")
+
     tests = [
-        ("TTS Generation", test_tts_webhook),
-        ("YouTube Upload", test_youtube_upload),
-        ("YouTube Analytics", test_youtube_analytics),
-        ("Cross-Platform Distribution", test_cross_platform_distribution),
-        ("Affiliate Shortener", test_affiliate_shortener)
+        ("TTS Generation", check_tts_webhook),
+        ("YouTube Upload", check_youtube_upload),
+        ("YouTube Analytics", check_youtube_analytics),
+        ("Cross-Platform Distribution", check_cross_platform_distribution),
+        ("Affiliate Shortener", check_affiliate_shortener)
     ]
 
-    for name, test_func in tests:
+    async def run_recorded(name, test_func, session, out):
         try:
-            result = test_func()
-            test_results["workflows"][name] = result
-            if result.get("success"):
-                test_results["summary"]["passed"] += 1
-            else:
-                test_results["summary"]["failed"] += 1
+            result = await test_func(session, now)
         except Exception as e:
-            print(f"❌ Failed to run {name} test: {e}")
-            test_results["workflows"][name] = {"success": False, "error": str(e)}
-            test_results["summary"]["failed"] += 1
+            LOG.info(f"❌ Failed to run {name} test: {e}")
+            result = {"success": False, "error": str(e)}
+        record_result(out, name, result)
+
+    # Each result is written as soon as it is known, so a crash mid-run
+    # still leaves the finished workflows on disk
+    results_file = f"test_results_{now:%Y%m%d_%H%M%S}.jsonl"
+    with open(results_file, "wb") as out:
+        async with aiohttp.ClientSession() as session:
+            results = await run_batched_tests(session, now) if N8N_TEST_ALL else None
+            if results is not None:
+                for (name, _), result in zip(tests, results):
+                    record_result(out, name, result)
+            else:
+                # The workflows are independent, so fire all webhooks at once
+                await asyncio.gather(
+                    *[run_recorded(name, test_func, session, out) for name, test_func in tests]
+                )
 
-        time.sleep(1)  # Small delay between tests
+        out.write(dumps_json(test_results, indent=False) + b"\n")
 
     # Print summary
     print_header("TEST SUMMARY")
-    print(f"Total Tests: {test_results['summary']['total']}")
-    print(f"✅ Passed: {test_results['summary']['passed']}")
-    print(f"❌ Failed: {test_results['summary']['failed']}")
-    print(f"Success Rate: {(test_results['summary']['passed'] / test_results['summary']['total'] * 100):.1f}%")
+    LOG.info(f"Total Tests: {test_results['summary']['total']}")
+    LOG.info(f"✅ Passed: {test_results['summary']['passed']}")
+    LOG.info(f"❌ Failed: {test_results['summary']['failed']}")
+    LOG.info(f"Success Rate: {(test_results['summary']['passed'] / test_results['summary']['total'] * 100):.1f}%")
 
-    # Save detailed results
-    results_file = f"test_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-    with open(results_file, "w") as f:
-        json.dump(test_results, f, indent=2, default=str)
-    print(f"\n📄 Detailed results saved to: {results_file}")
+    LOG.info(f"\n📄 Detailed results saved to: {results_file}")
+    LOG.info(f"   Nested JSON report: python test_all_mcp_workflows.py to-json {results_file}")
 
     # Print workflow-specific notes
-    print("\n📝 NOTES:")
-    print("1. TTS workflow requires ElevenLabs API or Google TTS configured")
-    print("2. YouTube workflows need backend API running (python youtube_backend_api.py)")
-    print("3. Cross-platform needs social media API credentials")
-    print("4. Affiliate shortener needs Bitly/TinyURL access")
-    print("5. Make sure all workflows are ACTIVE in n8n")
-
+    LOG.info("\n📝 NOTES:")
+    LOG.info("1. TTS workflow requires ElevenLabs API or Google TTS configured")
+    LOG.info("2. YouTube workflows need backend API running (python youtube_backend_api.py)")
+    LOG.info("3. Cross-platform needs social media API credentials")
+    LOG.info("4. Affiliate shortener needs Bitly/TinyURL access")
+    LOG.info("5. Make sure all workflows are ACTIVE in n8n")
+
+    LOG_BUFFER.flush()
     return test_results["summary"]["passed"] == test_results["summary"]["total"]
 
+async def run_single_test(test_func) -> Dict[str, Any]:
+    """Run one workflow test with its own client session."""
+    async with aiohttp.ClientSession() as session:
+        return await test_func(session, datetime.now())
+
 def quick_connectivity_check():
     """Quick check to ensure n8n is reachable."""
-    print("\n🔍 Quick Connectivity Check...")
+    LOG.info("\n🔍 Quick Connectivity Check...")
 
-    try:
-        # Try to reach n8n
-        response = requests.get(f"{N8N_BASE_URL}/", timeout=5)
-        print(f"✅ n8n is reachable at {N8N_BASE_URL}")
+    if n8n_is_up(N8N_BASE_URL, SESSION):
+        LOG.info(f"✅ n8n is reachable at {N8N_BASE_URL}")
         return True
-    except:
-        print(f"❌ Cannot reach n8n at {N8N_BASE_URL}")
-        print("   Make sure n8n is running and accessible")
-        return False
 
-if __name__ == "__main__":
-    import sys
+    LOG.info(f"❌ Cannot reach n8n at {N8N_BASE_URL}")
+    LOG.info("   Make sure n8n is running and accessible")
+    return False
 
+if __name__ == "__main__":
     # Check for specific test argument
     if len(sys.argv) > 1:
         test_name = sys.argv[1].lower()
 
-        if test_name == "tts":
-            test_tts_webhook()
-        elif test_name == "upload":
-            test_youtube_upload()
-        elif test_name == "analytics":
-            test_youtube_analytics()
-        elif test_name == "distribute":
-            test_cross_platform_distribution()
-        elif test_name == "affiliate":
-            test_affiliate_shortener()
+        single_tests = {
+            "tts": check_tts_webhook,
+            "upload": check_youtube_upload,
+            "analytics": check_youtube_analytics,
+            "distribute": check_cross_platform_distribution,
+            "affiliate": check_affiliate_shortener,
+        }
+
+        if test_name in single_tests:
+            asyncio.run(run_single_test(single_tests[test_name]))
         elif test_name == "check":
             quick_connectivity_check()
+        elif test_name == "to-json" and len(sys.argv) > 2:
+            jsonl_path = Path(sys.argv[2])
+            json_path = jsonl_path.with_suffix(".json")
+            json_path.write_bytes(dumps_json(jsonl_to_results(str(jsonl_path))))
+            LOG.info(f"Nested JSON report written to: {json_path}")
         else:
-            print(f"Unknown test: {test_name}")
-            print("\nAvailable tests:")
-            print("  python test_all_mcp_workflows.py         # Run all tests")
-            print("  python test_all_mcp_workflows.py tts     # Test TTS only")
-            print("  python test_all_mcp_workflows.py upload  # Test YouTube upload only")
-            print("  python test_all_mcp_workflows.py analytics # Test analytics only")
-            print("  python test_all_mcp_workflows.py distribute # Test distribution only")
-            print("  python test_all_mcp_workflows.py affiliate # Test affiliate only")
-            print("  python test_all_mcp_workflows.py check   # Quick connectivity check")
+            LOG.info(f"Unknown test: {test_name}")
+            LOG.info("\nAvailable tests:")
+            LOG.info("  python test_all_mcp_workflows.py         # Run all tests")
+            LOG.info("  N8N_TEST_ALL=1 python test_all_mcp_workflows.py # Run all via the test-all webhook")
+            LOG.info("  python test_all_mcp_workflows.py tts     # Test TTS only")
+            LOG.info("  python test_all_mcp_workflows.py upload  # Test YouTube upload only")
+            LOG.info("  python test_all_mcp_workflows.py analytics # Test analytics only")
+            LOG.info("  python test_all_mcp_workflows.py distribute # Test distribution only")
+            LOG.info("  python test_all_mcp_workflows.py affiliate # Test affiliate only")
+            LOG.info("  python test_all_mcp_workflows.py check   # Quick connectivity check")
+            LOG.info("  python test_all_mcp_workflows.py to-json test_results_<ts>.jsonl # Nested JSON report")
     else:
         # Run all tests
         if quick_connectivity_check():
-            success = run_all_tests()
+            success = asyncio.run(run_all_tests())
             sys.exit(0 if success else 1)
         else:
-            print("\n⚠️  Fix connectivity issues before running tests")
+            LOG.info("\n⚠️  Fix connectivity issues before running tests")
             sys.exit(1)
\ No newline at end of file
@@ -1,278 +1,134 @@
 #!/usr/bin/env python3
-"""Comprehensive test of the fixed YouTube Analytics workflow."""
-
-import requests
-import json
-import time
-
-BASE_URL = "http://localhost:5678/webhook/youtube-analytics"
-
-def test_analytics_basic():
-    """Test basic functionality."""
-    print("\n" + "="*60)
-    print("TEST 1: BASIC FUNCTIONALITY")
-    print("="*60)
-    
-    data = {"channel_id": "test"}
-    
-    try:
-        response = requests.post(BASE_URL, json=data, timeout=10)
-        print(f"Status Code: {response.status_code}")
-        print(f"Response Headers: {dict(response.headers)}")
-        print(f"Response Length: {len(response.text)}")
-        print(f"Raw Response: [{response.text}]")
-        
-        if response.status_code == 200:
-            if response.text.strip():
-                try:
-                    result = response.json()
-                    print(f"Parsed JSON:")
-                    print(json.dumps(result, indent=2))
-                    print("✅ SUCCESS: Basic test passed")
-                    return True
-                except json.JSONDecodeError as e:
-                    print(f"❌ JSON Parse Error: {e}")
-                    return False
-            else:
-                print("❌ FAILED: Empty response body")
-                return False
-        else:
-            print(f"❌ FAILED: HTTP {response.status_code}")
-            return False
-            
-    except Exception as e:
-        print(f"❌ ERROR: {e}")
-        return False
-
-def test_analytics_demographics():
-    """Test demographics functionality."""
-    print("\n" + "="*60)
-    print("TEST 2: DEMOGRAPHICS INCLUDED")
-    print("="*60)
-    
-    data = {
-        "channel_id": "test_channel", 
-        "include_demographics": True,
-        "include_traffic_sources": False
-    }
-    
-    try:
-        response = requests.post(BASE_URL, json=data, timeout=10)
-        print(f"Status Code: {response.status_code}")
-        
-        if response.status_code == 200 and response.text.strip():
-            result = response.json()
-            print(f"Channel ID: {result.get('channel', {}).get('id')}")
-            demographics = result.get('demographics')
-            if demographics and demographics != 'not_included':
-                print(f"Demographics: {demographics}")
-                print("✅ SUCCESS: Demographics included correctly")
-                return True
-            else:
-                print("❌ FAILED: Demographics not included")
-                print(json.dumps(result, indent=2))
-                return False
-        else:
-            print(f"❌ FAILED: Status {response.status_code} or empty response")
-            return False
-            
-    except Exception as e:
-        print(f"❌ ERROR: {e}")
-        return False
-
-def test_analytics_traffic():
-    """Test traffic sources functionality."""
-    print("\n" + "="*60)
-    print("TEST 3: TRAFFIC SOURCES INCLUDED")
-    print("="*60)
-    
-    data = {
-        "channel_id": "test_channel",
-        "include_demographics": False,
-        "include_traffic_sources": True
-    }
-    
-    try:
-        response = requests.post(BASE_URL, json=data, timeout=10)
-        print(f"Status Code: {response.status_code}")
-        
-        if response.status_code == 200 and response.text.strip():
-            result = response.json()
-            traffic = result.get('traffic')
-            if traffic and traffic != 'not_included':
-                print(f"Traffic Sources: {traffic}")
-                print("✅ SUCCESS: Traffic sources included correctly")
-                return True
-            else:
-                print("❌ FAILED: Traffic sources not included")
-                print(json.dumps(result, indent=2))
-                return False
-        else:
-            print(f"❌ FAILED: Status {response.status_code} or empty response")
-            return False
-            
-    except Exception as e:
-        print(f"❌ ERROR: {e}")
-        return False
-
-def test_analytics_full():
-    """Test full functionality with both demographics and traffic."""
-    print("\n" + "="*60)
-    print("TEST 4: FULL ANALYTICS (DEMOGRAPHICS + TRAFFIC)")
-    print("="*60)
-    
-    data = {
-        "channel_id": "test_full_channel",
-        "include_demographics": True,
-        "include_traffic_sources": True,
-        "date_range": "last_7_days",
-        "start_date": "2024-09-01",
-        "end_date": "2024-09-07"
-    }
-    
-    try:
-        response = requests.post(BASE_URL, json=data, timeout=15)
-        print(f"Status Code: {response.status_code}")
-        
-        if response.status_code == 200 and response.text.strip():
-            result = response.json()
-            
-            # Validate structure
-            required_fields = ['status', 'channel', 'metrics', 'insights', 'recommendations']
-            missing_fields = [field for field in required_fields if field not in result]
-            
-            if missing_fields:
-                print(f"❌ FAILED: Missing required fields: {missing_fields}")
-                return False
-            
-            # Check demographics and traffic
-            demographics = result.get('demographics')
-            traffic = result.get('traffic')
-            
-            if not demographics or demographics == 'not_included':
-                print("❌ FAILED: Demographics should be included")
-                return False
-                
-            if not traffic or traffic == 'not_included':
-                print("❌ FAILED: Traffic sources should be included")
-                return False
-            
-            print(f"✅ SUCCESS: Full analytics working correctly")
-            print(f"Channel: {result['channel']['id']}")
-            print(f"Metrics: {len(result['metrics'])} fields")
-            print(f"Demographics: {demographics.get('age_group', 'N/A')}")
-            print(f"Top Traffic Source: {traffic.get('top_source', 'N/A')}")
-            print(f"Insights: {len(result['insights'])} items")
-            print(f"Recommendations: {len(result['recommendations'])} items")
-            return True
-        else:
-            print(f"❌ FAILED: Status {response.status_code} or empty response")
+"""Comprehensive test of the fixed YouTube Analytics workflow.
+
+The tests are independent, so run them in parallel:
+
+    pytest -n auto test_analytics_comprehensive.py
+"""
+
+import asyncio
+import sys
+
+import aiohttp
+import pytest
+
+from tests._analytics_helpers import (
+    ANALYTICS_URL as BASE_URL,
+    BASIC_PAYLOAD,
+    N8N_URL,
+    SESSION,
+    analytics_probe,
+    loads_json,
+    n8n_is_up,
+)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def n8n_running():
+    """Skip the module unless n8n is reachable."""
+    if not n8n_is_up(N8N_URL, SESSION):
+        pytest.skip(f"n8n is not running at {N8N_URL}; start it and activate the YouTube Analytics workflow")
+
+
+def check_response(response):
+    """Assert a JSON 200 from the analytics webhook and return the body."""
+    assert response.status_code == 200, f"HTTP {response.status_code}"
+    assert response.text.strip(), "Empty response body"
+    return loads_json(response.content)
+
+
+def assert_status_ok(result):
+    """Basic functionality: a JSON 200 is all that's required."""
+
+
+def assert_demographics(result):
+    demographics = result.get('demographics')
+    assert demographics and demographics != 'not_included', "Demographics not included"
+
+
+def assert_traffic(result):
+    traffic = result.get('traffic')
+    assert traffic and traffic != 'not_included', "Traffic sources not included"
+
+
+def assert_full(result):
+    # Validate structure
+    required_fields = ['status', 'channel', 'metrics', 'insights', 'recommendations']
+    missing_fields = [field for field in required_fields if field not in result]
+    assert not missing_fields, f"Missing required fields: {missing_fields}"
+
+    # Check demographics and traffic
+    assert_demographics(result)
+    assert_traffic(result)
+
+
+DEMOGRAPHICS_PAYLOAD = {
+    "channel_id": "test_channel",
+    "include_demographics": True,
+    "include_traffic_sources": False
+}
+
+TRAFFIC_PAYLOAD = {
+    "channel_id": "test_channel",
+    "include_demographics": False,
+    "include_traffic_sources": True
+}
+
+FULL_PAYLOAD = {
+    "channel_id": "test_full_channel",
+    "include_demographics": True,
+    "include_traffic_sources": True,
+    "date_range": "last_7_days",
+    "start_date": "2024-09-01",
+    "end_date": "2024-09-07"
+}
+
+
+@pytest.mark.parametrize("payload,assertion", [
+    (BASIC_PAYLOAD, assert_status_ok),
+    (DEMOGRAPHICS_PAYLOAD, assert_demographics),
+    (TRAFFIC_PAYLOAD, assert_traffic),
+    (FULL_PAYLOAD, assert_full),
+], ids=["basic", "demographics", "traffic", "full"])
+def test_analytics(payload, assertion):
+    """POST each feature payload and check the parts of the response it enables."""
+    assertion(check_response(analytics_probe(payload)))
+
+
+async def _edge(session, data):
+    """POST one edge-case payload; True if it got a JSON 200 back."""
+    async with session.post(BASE_URL, json=data, timeout=aiohttp.ClientTimeout(total=10)) as response:
+        body = await response.read()
+        if response.status != 200 or not body.strip():
             return False
-            
-    except Exception as e:
-        print(f"❌ ERROR: {e}")
-        return False
+        loads_json(body)
+        return True
+
+
+async def _run_edge_cases(test_cases):
+    """Fire all edge cases at once over one session."""
+    async with aiohttp.ClientSession() as session:
+        return await asyncio.gather(
+            *[_edge(session, data) for data in test_cases],
+            return_exceptions=True
+        )
+
 
-def test_analytics_edge_cases():
+def test_edge_cases():
     """Test edge cases and error handling."""
-    print("\n" + "="*60)
-    print("TEST 5: EDGE CASES")
-    print("="*60)
-    
     test_cases = [
-        {"data": {}, "desc": "Empty payload"},
-        {"data": {"channel_id": ""}, "desc": "Empty channel ID"},
-        {"data": {"channel_id": None}, "desc": "Null channel ID"},
-        {"data": {"channel_id": "test", "include_demographics": None}, "desc": "Null demographics flag"}
+        {},                                                # Empty payload
+        {"channel_id": ""},                                # Empty channel ID
+        {"channel_id": None},                              # Null channel ID
+        {"channel_id": "test", "include_demographics": None}  # Null demographics flag
     ]
-    
-    success_count = 0
-    
-    for test_case in test_cases:
-        print(f"\nTesting: {test_case['desc']}")
-        try:
-            response = requests.post(BASE_URL, json=test_case['data'], timeout=10)
-            if response.status_code == 200 and response.text.strip():
-                result = response.json()
-                print(f"  ✅ Handled correctly: {result.get('status', 'unknown')}")
-                success_count += 1
-            else:
-                print(f"  ❌ Failed: Status {response.status_code}")
-        except Exception as e:
-            print(f"  ❌ Error: {e}")
-    
-    print(f"\nEdge case results: {success_count}/{len(test_cases)} passed")
-    return success_count >= len(test_cases) // 2  # At least half should pass
-
-def main():
-    """Run all tests."""
-    print("🧪 COMPREHENSIVE YOUTUBE ANALYTICS WORKFLOW TEST")
-    print("="*80)
-    
-    # Check if n8n is running
-    try:
-        response = requests.get("http://localhost:5678")
-        print("✅ n8n is running")
-    except:
-        print("❌ n8n is not running at http://localhost:5678")
-        print("Please start n8n and make sure the YouTube Analytics workflow is active")
-        return False
-    
-    # Run all tests
-    tests = [
-        ("Basic Functionality", test_analytics_basic),
-        ("Demographics Feature", test_analytics_demographics),
-        ("Traffic Sources Feature", test_analytics_traffic),
-        ("Full Analytics", test_analytics_full),
-        ("Edge Cases", test_analytics_edge_cases)
-    ]
-    
-    results = []
-    
-    for test_name, test_func in tests:
-        print(f"\n🎯 Running: {test_name}")
-        try:
-            success = test_func()
-            results.append((test_name, success))
-        except Exception as e:
-            print(f"❌ Test failed with error: {e}")
-            results.append((test_name, False))
-        
-        time.sleep(0.5)  # Small delay between tests
-    
-    # Final summary
-    print("\n" + "="*80)
-    print("FINAL TEST SUMMARY")
-    print("="*80)
-    
-    passed = [name for name, success in results if success]
-    failed = [name for name, success in results if not success]
-    
-    print(f"\n✅ PASSED ({len(passed)}/{len(results)}):")
-    for name in passed:
-        print(f"   • {name}")
-    
-    if failed:
-        print(f"\n❌ FAILED ({len(failed)}/{len(results)}):")
-        for name in failed:
-            print(f"   • {name}")
-    
-    success_rate = len(passed) / len(results) * 100
-    print(f"\n🎯 Overall Success Rate: {success_rate:.1f}%")
-    
-    if success_rate >= 80:
-        print("\n🚀 WORKFLOW IS WORKING CORRECTLY!")
-        print("\nManual Import Instructions:")
-        print("1. Open n8n at http://localhost:5678")
-        print("2. Click 'Import from file'")
-        print("3. Import: import_analytics_fixed.json")
-        print("4. Click 'Activate' to enable the workflow")
-        print("5. Test with: POST http://localhost:5678/webhook/youtube-analytics")
-    else:
-        print(f"\n⚠️  WORKFLOW NEEDS MORE FIXES ({len(failed)} issues remaining)")
-    
-    return success_rate >= 80
+
+    results = asyncio.run(_run_edge_cases(test_cases))
+    success_count = sum(1 for ok in results if ok is True)
+
+    # At least half should pass
+    assert success_count >= len(test_cases) // 2, f"Edge cases: {success_count}/{len(test_cases)} passed"
+
 
 if __name__ == "__main__":
-    success = main()
-    exit(0 if success else 1)
\ No newline at end of file
+    sys.exit(pytest.main(["-n", "auto", __file__]))
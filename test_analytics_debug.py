@@ -1,14 +1,15 @@
-import requests
 import json
 
-url = "http://localhost:5678/webhook/youtube-analytics"
-data = {"channel_id": "test"}
+from tests._analytics_helpers import ANALYTICS_URL, BASIC_PAYLOAD, analytics_probe, loads_json
+
+url = ANALYTICS_URL
+data = BASIC_PAYLOAD
 
 print("Testing YouTube Analytics webhook...")
 print(f"URL: {url}")
 print(f"Data: {json.dumps(data, indent=2)}")
 
-response = requests.post(url, json=data)
+response = analytics_probe(data, url)
 
 print(f"\n--- Response Details ---")
 print(f"Status Code: {response.status_code}")
@@ -18,7 +19,7 @@ print(f"Raw Content: {repr(response.content)}")
 
 if response.content:
     try:
-        json_data = response.json()
+        json_data = loads_json(response.content)
         print(f"\n--- JSON Response ---")
         print(json.dumps(json_data, indent=2))
     except json.JSONDecodeError as e:
@@ -2,7 +2,7 @@
 """Test the anxiety script in the context of the full pipeline"""
 
 from claude_script_generator import generate_production_script
-import os
+from pathlib import Path
 
 # Simulate what the pipeline does
 title = "Beat Anxiety in 10 Minutes"
@@ -45,12 +45,11 @@ if script:
         print(f"  Need to add {int((10 - google_tts_minutes) * 130)} more words")
 
     # Save test output
-    test_dir = "content/test_anxiety_fix"
-    os.makedirs(test_dir, exist_ok=True)
+    test_dir = Path("content/test_anxiety_fix")
+    test_dir.mkdir(parents=True, exist_ok=True)
 
-    script_path = os.path.join(test_dir, "script.md")
-    with open(script_path, "w", encoding="utf-8") as f:
-        f.write(script)
+    script_path = test_dir / "script.md"
+    script_path.write_text(script, encoding="utf-8", newline="\n")
 
     print(f"\nScript saved to: {script_path}")
     print("Ready for TTS generation!")
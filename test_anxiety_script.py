@@ -1,8 +1,13 @@
 #!/usr/bin/env python
 """Test the anxiety script generation to ensure 10-minute content"""
 
+import re
+
 from claude_script_generator import generate_production_script
 
+# Template placeholders like "[Detailed explanation...]"
+PLACEHOLDER_RE = re.compile(r'\[[\w\s]+\.\.\.\]')
+
 # Test the exact title that was having issues
 title = "Beat Anxiety in 10 Minutes"
 hook = "The results will shock you"
@@ -42,8 +47,7 @@ if script:
         print("   [WARN] Routing: Unknown generator")
 
     # Check for placeholders
-    import re
-    placeholders = re.findall(r'\[[\w\s]+\.\.\.\]', script)
+    placeholders = PLACEHOLDER_RE.findall(script)
     if placeholders:
         print(f"   [ERROR] Found {len(placeholders)} placeholders: {placeholders[:3]}")
     else:
@@ -1,24 +1,30 @@
 #!/usr/bin/env python
 """Test that the CLI calendar dry-run print key is fixed."""
 
+import re
 import sys
 from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
+from tests._config_helpers import make_tmp_config
 
-def test_cli_calendar_print():
+CLI_PATH = Path(__file__).parent / "src" / "yt_faceless" / "cli.py"
+
+# Matches both the fixed and the old dry-run print key in one scan
+SCHEDULE_KEY_RE = re.compile(r"result\['would_schedule'\]\['(scheduled_time|publish_date)'\]")
+
+
+def test_cli_calendar_print(cli_source):
     """Test CLI calendar dry-run print uses correct key."""
     print("\n[TEST] CLI calendar dry-run print key...")
 
     try:
-        with open("src/yt_faceless/cli.py", 'r', encoding='utf-8') as f:
-            content = f.read()
-
         # Check for the correct key usage
-        has_correct_key = "result['would_schedule']['scheduled_time']" in content
-        has_wrong_key = "result['would_schedule']['publish_date']" in content
+        keys = set(SCHEDULE_KEY_RE.findall(cli_source))
+        has_correct_key = "scheduled_time" in keys
+        has_wrong_key = "publish_date" in keys
 
         if has_correct_key and not has_wrong_key:
             print("  [PASS] CLI uses correct 'scheduled_time' key")
@@ -35,36 +41,19 @@ def test_cli_calendar_print():
         return False
 
 
-def test_calendar_function_return():
+def test_calendar_function_return(tmp_config):
     """Test that schedule_content returns the expected keys."""
     print("\n[TEST] Calendar schedule_content return value...")
 
     try:
-        from yt_faceless.schedule.calendar import CalendarStore
-        from yt_faceless.core.config import AppConfig
-        import asyncio
-        from datetime import datetime, timezone
-        import tempfile
-
-        # Create temp config
-        temp_dir = Path(tempfile.mkdtemp())
-
-        class MockConfig:
-            class Dirs:
-                data_dir = temp_dir
-            directories = Dirs()
-
-        config = MockConfig()
-
-        # Import the async function
         from yt_faceless.schedule.calendar import schedule_content
 
         # Test dry-run mode
-        result = asyncio.run(schedule_content(
-            config,
+        result = schedule_content(
+            tmp_config,
             "test-slug",
             dry_run=True
-        ))
+        )
 
         # Check return structure
         if "would_schedule" in result:
@@ -93,8 +82,8 @@ def main():
     print("=" * 60)
 
     tests = [
-        ("CLI print key", test_cli_calendar_print),
-        ("Calendar return value", test_calendar_function_return),
+        ("CLI print key", lambda: test_cli_calendar_print(CLI_PATH.read_text(encoding='utf-8'))),
+        ("Calendar return value", lambda: test_calendar_function_return(make_tmp_config())),
     ]
 
     results = []
@@ -3,14 +3,101 @@
 Test ElevenLabs API Configuration
 """
 
+import hashlib
+import json
 import os
+from unittest import mock
+
+import pytest
 import requests
 from dotenv import load_dotenv
 
+try:
+    import requests_cache
+    REQUESTS_CACHE_AVAILABLE = True
+except ImportError:
+    REQUESTS_CACHE_AVAILABLE = False
+
 # Load environment variables
 load_dotenv()
 
-def test_elevenlabs():
+
+def _cache_key(request, **kwargs):
+    """Default requests-cache key plus a digest of the API key, so switching
+    keys in .env never replays another account's responses."""
+    api_key = request.headers.get("xi-api-key", "")
+    digest = hashlib.sha256(api_key.encode()).hexdigest()[:16]
+    return f"{requests_cache.create_key(request, **kwargs)}-{digest}"
+
+
+# Voice lookups replay from the user cache dir for 12h. Account usage
+# (/v1/user) and audio generation (POST) always hit the API, and the API key
+# is redacted from stored requests. Without requests-cache this is still one
+# pooled connection.
+if REQUESTS_CACHE_AVAILABLE:
+    session = requests_cache.CachedSession(
+        "elevenlabs-cache",
+        use_cache_dir=True,
+        expire_after=12 * 3600,
+        urls_expire_after={"api.elevenlabs.io/v1/user": requests_cache.DO_NOT_CACHE},
+        allowable_methods=("GET",),
+        key_fn=_cache_key,
+        ignored_parameters=["xi-api-key"],
+    )
+else:
+    session = requests.Session()
+
+# Canned bodies keyed by (method, first path segment after /v1/)
+FAKE_API = {
+    ("GET", "user"): {
+        "subscription": {"tier": "free", "character_count": 120, "character_limit": 10000}
+    },
+    ("GET", "voices"): {
+        "voices": [{"name": "Rachel", "voice_id": "21m00Tcm4TlvDq8ikWAM"}]
+    },
+    ("POST", "text-to-speech"): b"ID3fake-mp3",
+}
+
+
+def _fake_api(method):
+    """Build a side effect that answers ``method`` calls from FAKE_API."""
+    def send(url, **kwargs):
+        body = FAKE_API[method, url.split("/v1/", 1)[1].split("/", 1)[0]]
+        response = requests.Response()
+        response.status_code = 200
+        response._content = body if isinstance(body, bytes) else json.dumps(body).encode()
+        return response
+    return send
+
+
+@pytest.fixture(autouse=True)
+def elevenlabs_api(request, monkeypatch, tmp_path):
+    """Serve canned ElevenLabs responses unless pytest runs with --live-elevenlabs.
+
+    Yields True when the responses are canned.
+    """
+    if request.config.getoption("--live-elevenlabs"):
+        if not os.getenv('ELEVENLABS_API_KEY'):
+            pytest.skip("ELEVENLABS_API_KEY not set")
+        yield False
+        return
+
+    monkeypatch.setenv('ELEVENLABS_API_KEY', 'sk_test_00000000000000')
+    monkeypatch.chdir(tmp_path)  # test_audio.mp3 lands here
+    with mock.patch.object(session, "get", side_effect=_fake_api("GET")), \
+            mock.patch.object(session, "post", side_effect=_fake_api("POST")):
+        yield True
+
+
+def test_elevenlabs(elevenlabs_api):
+    """Run the API check and fail unless every step succeeds."""
+    assert check_elevenlabs()
+    if elevenlabs_api:
+        with open("test_audio.mp3", "rb") as f:
+            assert f.read() == FAKE_API["POST", "text-to-speech"]
+
+
+def check_elevenlabs():
     """Test ElevenLabs API key and configuration"""
     
     api_key = os.getenv('ELEVENLABS_API_KEY', '')
@@ -37,7 +124,7 @@ def test_elevenlabs():
     
     try:
         # Get user info
-        response = requests.get(
+        response = session.get(
             "https://api.elevenlabs.io/v1/user",
             headers=headers
         )
@@ -76,7 +163,7 @@ def test_elevenlabs():
     # Test 2: Check available voices
     print("\n[2/3] Checking available voices...")
     try:
-        response = requests.get(
+        response = session.get(
             "https://api.elevenlabs.io/v1/voices",
             headers=headers
         )
@@ -126,7 +213,7 @@ def test_elevenlabs():
     }
     
     try:
-        response = requests.post(url, json=data, headers=headers)
+        response = session.post(url, json=data, headers=headers)
         
         if response.status_code == 200:
             # Save test audio
@@ -195,7 +282,7 @@ def main():
         return
     
     # Test API
-    if test_elevenlabs():
+    if check_elevenlabs():
         print("\n" + "="*60)
         print("NEXT STEPS")
         print("="*60)
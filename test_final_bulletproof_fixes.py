@@ -4,7 +4,6 @@
 import json
 import os
 import sys
-import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 from datetime import datetime, timezone
@@ -12,6 +11,8 @@ from datetime import datetime, timezone
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
+from tests._config_helpers import make_tmp_config
+
 def test_ffmpeg_subtitle_escaping_comprehensive():
     """Test comprehensive FFmpeg subtitle path escaping."""
     print("\n[TEST] FFmpeg subtitle escaping (comprehensive)...")
@@ -225,7 +226,7 @@ def test_cli_commands_exist():
         return False
 
 
-def test_calendar_module_exists():
+def test_calendar_module_exists(tmp_config):
     """Test calendar module exists in correct location."""
     print("\n[TEST] Calendar module location...")
 
@@ -238,11 +239,7 @@ def test_calendar_module_exists():
         )
 
         # Verify it's functional
-        config = MagicMock()
-        config.directories.data_dir = Path(tempfile.mkdtemp()) / "data"
-        config.directories.data_dir.mkdir(parents=True, exist_ok=True)
-
-        calendar = ContentCalendar(config)
+        calendar = ContentCalendar(tmp_config)
 
         # Test basic functionality
         schedule = calendar.get_upcoming_schedule(days_ahead=7)
@@ -291,20 +288,14 @@ def test_webhook_access_pattern():
         return False
 
 
-def test_affiliate_url_guards_comprehensive():
+def test_affiliate_url_guards_comprehensive(tmp_config):
     """Test affiliate URL guards are in all methods."""
     print("\n[TEST] Affiliate URL guards (comprehensive)...")
 
     try:
         from yt_faceless.monetization.affiliates import AffiliateManager
 
-        config = MagicMock()
-        config.directories.data_dir = Path(tempfile.mkdtemp()) / "data"
-        config.directories.data_dir.mkdir(parents=True, exist_ok=True)
-        config.features = {"affiliate_injection": True}
-        config.webhooks.shortener_url = None
-
-        manager = AffiliateManager(config)
+        manager = AffiliateManager(tmp_config)
 
         # Test guards in get_placements_for_slug
         # This should handle empty URLs without errors
@@ -335,9 +326,9 @@ def main():
         ("DistributionTarget Validator", test_distribution_target_validator),
         ("Distribution Tag Handling", test_distribution_tag_handling),
         ("CLI Commands Exist", test_cli_commands_exist),
-        ("Calendar Module Location", test_calendar_module_exists),
+        ("Calendar Module Location", lambda: test_calendar_module_exists(make_tmp_config())),
         ("Webhook Access Pattern", test_webhook_access_pattern),
-        ("Affiliate URL Guards", test_affiliate_url_guards_comprehensive),
+        ("Affiliate URL Guards", lambda: test_affiliate_url_guards_comprehensive(make_tmp_config())),
     ]
 
     results = []
@@ -0,0 +1,79 @@
+"""Shared n8n reachability check, YouTube Analytics webhook probe and JSON
+decoding for the root-level scripts."""
+
+import json
+import time
+from pathlib import Path
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+N8N_URL = "http://localhost:5678"
+ANALYTICS_URL = f"{N8N_URL}/webhook/youtube-analytics"
+BASIC_PAYLOAD = {"channel_id": "test"}
+
+# Recent successful connectivity checks are cached here
+N8N_UP_CACHE = Path.home() / ".cache" / "yt_faceless" / "n8n_up.json"
+N8N_UP_TTL = 60  # seconds
+
+# One keep-alive pool for every request; retries cover transient connect errors
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.2)
+))
+
+
+def loads_json(body: bytes) -> Any:
+    """Parse a response body (None if empty), with orjson when available."""
+    if not body.strip():
+        return None
+    if ORJSON_AVAILABLE:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def n8n_is_up(base_url: str = N8N_URL, session: requests.Session = SESSION) -> bool:
+    """Check n8n is reachable, reusing a recent successful probe.
+
+    A success is remembered on disk for N8N_UP_TTL seconds so repeated runs
+    during development skip the round trip; failures are always re-probed.
+    """
+    try:
+        cached = json.loads(N8N_UP_CACHE.read_text())
+        if (cached.get("ok") and cached.get("url") == base_url
+                and time.time() - cached.get("ts", 0) < N8N_UP_TTL):
+            return True
+    except (OSError, ValueError, AttributeError):
+        pass
+
+    try:
+        session.get(f"{base_url}/", timeout=5)
+    except requests.exceptions.RequestException:
+        return False
+
+    try:
+        N8N_UP_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        N8N_UP_CACHE.write_text(json.dumps({"url": base_url, "ts": time.time(), "ok": True}))
+    except OSError:
+        pass
+    return True
+
+
+def analytics_probe(payload=None, url=ANALYTICS_URL, timeout=15):
+    """POST a payload to the analytics webhook over the shared session.
+
+    Returns the raw requests.Response so callers can inspect status, headers
+    and body themselves.
+    """
+    payload = BASIC_PAYLOAD if payload is None else payload
+    return SESSION.post(url, json=payload, timeout=timeout)
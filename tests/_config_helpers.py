@@ -0,0 +1,21 @@
+"""Throwaway MagicMock config for the root-level verification scripts."""
+
+import tempfile
+from pathlib import Path
+from unittest.mock import MagicMock
+
+
+def make_tmp_config(root=None):
+    """Return a MagicMock config whose data_dir lives under ``root``.
+
+    Without ``root`` a fresh temp directory is created, which the caller
+    owns (``config.directories.data_dir.parent``).
+    """
+    data_dir = Path(root or tempfile.mkdtemp()) / "data"
+    data_dir.mkdir(parents=True, exist_ok=True)
+
+    config = MagicMock()
+    config.directories.data_dir = data_dir
+    config.features = {"affiliate_injection": True, "cross_platform_distribution": True}
+    config.webhooks.shortener_url = None
+    return config
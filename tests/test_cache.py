@@ -0,0 +1,245 @@
+"""Tests for the SQLite and file caches."""
+
+import hashlib
+import io
+import pickle
+import sqlite3
+import struct
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from yt_faceless.utils import cache as cache_module
+from yt_faceless.utils.cache import CacheManager, FileCache, _decode, _dump_oob
+
+
+class ZeroCopyBytes(bytearray):
+    """bytearray that pickles its data out-of-band under protocol 5."""
+
+    def __reduce_ex__(self, protocol):
+        if protocol >= 5:
+            return type(self)._reconstruct, (pickle.PickleBuffer(self),), None
+        return type(self)._reconstruct, (bytearray(self),)
+
+    @classmethod
+    def _reconstruct(cls, obj):
+        with memoryview(obj) as m:
+            return cls(m)
+
+
+def _blob_count(manager):
+    """Number of rows left in the blobs tables of every shard."""
+    count = 0
+    for path in manager.db_paths:
+        if path.exists():
+            with sqlite3.connect(path) as conn:
+                count += conn.execute("SELECT COUNT(*) FROM blobs").fetchone()[0]
+    return count
+
+
+class TestCacheManager:
+    """Test the sharded SQLite cache."""
+
+    @pytest.fixture
+    def manager(self, tmp_path):
+        """Create a cache manager over a temporary directory."""
+        config = MagicMock()
+        config.directories.cache_dir = tmp_path / "cache"
+        config.performance.cache_ttl_hours = 1
+        config.performance.cache_max_size_mb = 10
+        manager = CacheManager(config)
+        yield manager
+        manager.close()
+
+    def test_removes_unsharded_db(self, tmp_path):
+        """Test the pre-sharding cache.db and its WAL files are deleted."""
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        legacy = [cache_dir / name for name in ("cache.db", "cache.db-wal", "cache.db-shm")]
+        for path in legacy:
+            path.write_bytes(b"old")
+
+        config = MagicMock()
+        config.directories.cache_dir = cache_dir
+        CacheManager(config).close()
+
+        assert not any(path.exists() for path in legacy)
+
+    def test_set_get_delete(self, manager):
+        """Test a value round trips through the disk cache."""
+        manager.set("key", {"a": [1, 2.5, None]}, use_memory=False)
+
+        assert manager.get("key", use_memory=False) == {"a": [1, 2.5, None]}
+        assert manager.delete("key") is True
+        assert manager.get("key", "missing", use_memory=False) == "missing"
+        assert manager.delete("key") is False
+
+    def test_rewrite_same_value_then_delete(self, manager):
+        """Test rewriting a key with its own value keeps one blob, freed on delete."""
+        manager.set("key", "same value")
+        manager.set("key", "same value")
+
+        assert manager.get("key", use_memory=False) == "same value"
+        assert _blob_count(manager) == 1
+
+        manager.delete("key")
+        assert _blob_count(manager) == 0
+
+    @pytest.mark.parametrize("order", [("a", "b"), ("b", "a")])
+    def test_shared_value_freed_after_last_delete(self, manager, order):
+        """Test a value shared by two keys survives until both are deleted."""
+        manager.set("a", "shared")
+        manager.set("b", "shared")
+
+        first, second = order
+        manager.delete(first)
+        assert manager.get(second, use_memory=False) == "shared"
+
+        manager.delete(second)
+        assert _blob_count(manager) == 0
+
+    def test_delete_after_delete_and_rewrite(self, manager):
+        """Test delete, rewrite and delete again leaves no blob behind."""
+        manager.set("key", "value")
+        manager.delete("key")
+        manager.set("key", "value")
+        manager.delete("key")
+
+        assert _blob_count(manager) == 0
+
+    def test_delete_many(self, manager):
+        """Test several keys are deleted across shards and their blobs freed."""
+        keys = [f"key-{i}" for i in range(40)]
+        for key in keys:
+            manager.set(key, key)
+
+        assert manager.delete_many(keys + ["absent"]) == 40
+        assert _blob_count(manager) == 0
+
+    def test_expired_sweep_runs_in_batches(self, manager):
+        """Test expired entries are swept batch by batch, live ones kept."""
+        for i in range(25):
+            manager.set(f"old-{i}", f"old-{i}", ttl_seconds=-1, use_memory=False)
+        for i in range(5):
+            manager.set(f"new-{i}", f"new-{i}", use_memory=False)
+
+        batch = 3
+        with patch.object(cache_module, "_SWEEP_BATCH", batch), patch.object(
+            cache_module,
+            "_SQL_DELETE_EXPIRED",
+            cache_module._SQL_DELETE_EXPIRED.replace(
+                f"LIMIT {cache_module._SWEEP_BATCH}", f"LIMIT {batch}"
+            ),
+        ):
+            assert manager.clear(expired_only=True) == 25
+
+        assert all(manager.get(f"new-{i}", use_memory=False) == f"new-{i}" for i in range(5))
+        assert manager.get_stats()["disk_cache_size"] == 5
+        assert _blob_count(manager) == 5
+
+    def test_clear_all(self, manager):
+        """Test clearing everything empties both tables."""
+        for i in range(10):
+            manager.set(f"key-{i}", i)
+
+        assert manager.clear() == 10
+        assert manager.get("key-0") is None
+        assert _blob_count(manager) == 0
+
+
+class TestFileCache:
+    """Test the file cache and its Bloom filter."""
+
+    def test_set_get_delete(self, tmp_path):
+        """Test JSON and pickled values round trip."""
+        cache = FileCache(tmp_path)
+        cache.set("json", {"a": [1, "b"]})
+        cache.set("pickle", {1, 2, 3})
+
+        assert cache.get("json") == {"a": [1, "b"]}
+        assert cache.get("pickle") == {1, 2, 3}
+        assert cache.delete("json") is True
+        assert cache.get("json") is None
+        assert cache.exists("pickle")
+
+    def test_finds_keys_written_before_startup(self, tmp_path):
+        """Test keys already on disk are found by a new instance."""
+        FileCache(tmp_path).set("key", "value")
+
+        assert FileCache(tmp_path).get("key") == "value"
+
+    def test_finds_keys_written_by_another_instance(self, tmp_path):
+        """Test a key written by another instance after startup is found."""
+        reader = FileCache(tmp_path)
+        writer = FileCache(tmp_path)
+
+        assert reader.get("key") is None
+        writer.set("key", "value")
+
+        assert reader.exists("key")
+        assert reader.get("key") == "value"
+
+    def test_finds_keys_in_already_scanned_subdirectory(self, tmp_path):
+        """Test a write to a subdirectory the reader already scanned is found."""
+        prefix = hashlib.sha256(b"first").hexdigest()[:2]
+        second = next(
+            f"key-{i}" for i in range(100000)
+            if hashlib.sha256(f"key-{i}".encode()).hexdigest()[:2] == prefix
+        )
+        FileCache(tmp_path).set("first", 1)
+
+        reader = FileCache(tmp_path)
+        assert reader.get(second) is None
+        FileCache(tmp_path).set(second, 2)
+
+        assert reader.get(second) == 2
+
+    def test_clear(self, tmp_path):
+        """Test clear removes every file and forgets the keys."""
+        cache = FileCache(tmp_path)
+        cache.set("a", 1)
+        cache.set("b", [2])
+
+        assert cache.clear() == 2
+        assert cache.get("a") is None
+        assert not cache.exists("b")
+
+
+class TestOutOfBandPickle:
+    """Test the protocol 5 out-of-band file format."""
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            ZeroCopyBytes(b"x" * 4096),
+            {"audio": ZeroCopyBytes(b"\x00\x01" * 1000), "empty": ZeroCopyBytes(), "tail": ZeroCopyBytes(b"end")},
+            (datetime(2024, 1, 2, 3, 4, 5), {1, 2}),
+        ],
+        ids=["one-buffer", "several-buffers", "no-buffers"],
+    )
+    def test_round_trip(self, value):
+        """Test _dump_oob output decodes to an equal value."""
+        f = io.BytesIO()
+        _dump_oob(value, f)
+
+        assert _decode(f.getvalue()) == value
+
+    def test_buffers_written_out_of_band(self):
+        """Test buffer bytes follow the pickle stream instead of being inside it."""
+        f = io.BytesIO()
+        _dump_oob(ZeroCopyBytes(b"payload"), f)
+        data = f.getvalue()
+
+        assert data[:1] == b"O"
+        assert data.count(b"payload") == 1
+        assert data.endswith(b"payload" + struct.pack("<QI", len(b"payload"), 1))
+
+    def test_file_cache_round_trip(self, tmp_path):
+        """Test FileCache stores non-JSON values in the out-of-band format."""
+        cache = FileCache(tmp_path)
+        value = {"chunks": [ZeroCopyBytes(b"a" * 100), ZeroCopyBytes(b"b" * 50)]}
+        cache.set("audio", value)
+
+        assert cache.get_path("audio").read_bytes()[:1] == b"O"
+        assert FileCache(tmp_path).get("audio") == value
@@ -1,6 +1,9 @@
 """Tests for Phase 8 distribution and localization features."""
 
+import asyncio
 import json
+import sqlite3
+from contextlib import closing
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -15,7 +18,12 @@ from yt_faceless.distribution.cross_platform import (
 )
 from yt_faceless.guardrails.safety_checker import BrandSafetyChecker, check_content_safety
 from yt_faceless.localization.translator import LocalizationManager, translate_content
-from yt_faceless.scheduling.calendar import ContentCalendar, schedule_content
+from yt_faceless.scheduling.calendar import (
+    ContentCalendar,
+    ContentCalendarSQLite,
+    get_publishing_schedule,
+    schedule_content,
+)
 
 
 class TestCrossPlatformDistributor:
@@ -395,7 +403,9 @@ class TestContentCalendar:
     @pytest.fixture
     def config(self, tmp_path):
         """Create test config."""
-        config = MagicMock(spec=AppConfig)
+        # AppConfig's fields are instance attributes, which spec=AppConfig
+        # hides from the mock, so build the directories explicitly
+        config = MagicMock()
         config.directories.data_dir = tmp_path / "data"
         config.directories.content_dir = tmp_path / "content"
         config.webhooks = {"scheduled_upload_url": "https://webhook.test/upload"}
@@ -434,6 +444,23 @@ class TestContentCalendar:
         upcoming = calendar.get_upcoming_schedule(days_ahead=7)
         assert any(item["slug"] == slug for item in upcoming)
 
+    def test_bulk_schedule(self, calendar, config):
+        """Test batch scheduling writes the calendar once."""
+        base = datetime.now(timezone.utc) + timedelta(days=2)
+        items = [
+            {"slug": f"video-{i}", "publish_date": base + timedelta(hours=8 * i)}
+            for i in range(3)
+        ]
+
+        with patch.object(calendar, "_save_calendar", wraps=calendar._save_calendar) as save:
+            results = calendar.bulk_schedule(items)
+
+        assert [r["slug"] for r in results] == ["video-0", "video-1", "video-2"]
+        assert save.call_count == 1
+
+        reloaded = ContentCalendar(config)
+        assert len(reloaded.calendar["scheduled"]) == 3
+
     def test_check_scheduling_conflicts(self, calendar):
         """Test conflict detection."""
         # Add existing scheduled item
@@ -470,4 +497,55 @@ class TestContentCalendar:
         assert success is True
         assert len(calendar.calendar["scheduled"]) == 0
         assert len(calendar.calendar["published"]) == 1
-        assert calendar.calendar["published"][0]["video_id"] == "abc123"
\ No newline at end of file
+        assert calendar.calendar["published"][0]["video_id"] == "abc123"
+
+    def test_sqlite_backend(self, calendar, config):
+        """Test SQLite calendar imports JSON items and persists changes."""
+        base = datetime.now(timezone.utc) + timedelta(days=2)
+        calendar.schedule_content("json-video", publish_date=base)
+
+        with closing(ContentCalendarSQLite(config)) as sqlite_calendar:
+            sqlite_calendar.schedule_content("sqlite-video", publish_date=base + timedelta(hours=8))
+            assert sqlite_calendar.mark_as_published("json-video", video_id="abc123")
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            sqlite_calendar._db.execute("SELECT 1")
+
+        with closing(ContentCalendarSQLite(config)) as reloaded:
+            assert [item["slug"] for item in reloaded.calendar["scheduled"]] == ["sqlite-video"]
+            assert reloaded.calendar["published"][0]["video_id"] == "abc123"
+            assert len(reloaded._row_ids) == 2
+
+        # Imported items live only in the database from then on
+        json_calendar = ContentCalendar(config)
+        assert json_calendar.calendar["scheduled"] == []
+        assert json_calendar.calendar["published"] == []
+
+    def test_execute_scheduled_uploads_reraises_cancellation(self, calendar, config):
+        """Test a cancelled upload is re-raised after finished uploads are saved."""
+        due = datetime.now(timezone.utc) - timedelta(hours=12)
+        for hours, slug in enumerate(("done-video", "cancelled-video")):
+            (config.directories.content_dir / slug).mkdir(parents=True)
+            calendar.schedule_content(slug, publish_date=due + timedelta(hours=6 * hours))
+
+        config.webhooks = MagicMock()
+        config.performance.max_concurrent_requests = 2
+        calendar.__dict__["n8n_client"] = MagicMock(execute_webhook=AsyncMock(side_effect=[
+            {"success": True, "video_id": "abc123", "url": "https://youtube.com/watch?v=abc123"},
+            asyncio.CancelledError(),
+        ]))
+
+        with pytest.raises(asyncio.CancelledError):
+            asyncio.run(calendar.execute_scheduled_uploads())
+
+        reloaded = ContentCalendar(config)
+        assert [item["slug"] for item in reloaded.calendar["published"]] == ["done-video"]
+
+    def test_open_calendar_closed_after_use(self, config):
+        """Test module-level helpers close the SQLite calendar they open."""
+        config.features["calendar_sqlite"] = True
+        with patch.object(
+            ContentCalendarSQLite, "close", autospec=True, side_effect=ContentCalendarSQLite.close
+        ) as close:
+            get_publishing_schedule(config)
+        close.assert_called_once()
\ No newline at end of file
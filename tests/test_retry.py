@@ -0,0 +1,359 @@
+"""Tests for retry, circuit breaker and timeout utilities."""
+
+import asyncio
+import contextvars
+import email.utils
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from yt_faceless.core.errors import CircuitBreakerOpenError, RateLimitError
+from yt_faceless.utils.retry import (
+    CircuitBreaker,
+    ExponentialBackoff,
+    FixedDelay,
+    RetryConfig,
+    _normalize_retry_after,
+    async_execute_with_retry,
+    execute_with_retry,
+    with_timeout,
+)
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+
+request_id = contextvars.ContextVar("request_id", default=None)
+
+
+def _run(mode, outcomes, config):
+    """Run a function through the sync or async executor.
+
+    Each call takes the next entry of ``outcomes``: exception classes are
+    raised, anything else is returned. Returns (result or raised exception,
+    number of calls).
+    """
+    calls = []
+
+    def step():
+        outcome = outcomes[len(calls)]
+        calls.append(outcome)
+        if isinstance(outcome, type) and issubclass(outcome, BaseException):
+            raise outcome("boom")
+        return outcome
+
+    async def astep():
+        return step()
+
+    try:
+        if mode == "sync":
+            result = execute_with_retry(step, (), {}, config)
+        else:
+            result = asyncio.run(async_execute_with_retry(astep, (), {}, config))
+    except BaseException as e:
+        result = e
+    return result, len(calls)
+
+
+@pytest.mark.parametrize("mode", ["sync", "async"])
+class TestExecuteWithRetry:
+    """The sync and async executors make the same decisions."""
+
+    def test_retries_then_succeeds(self, mode):
+        """Test retryable errors are retried until the call succeeds."""
+        on_retry = MagicMock()
+        config = RetryConfig(max_attempts=3, strategy=FixedDelay(0), on_retry=on_retry)
+
+        result, calls = _run(mode, [ConnectionError, ConnectionError, "ok"], config)
+
+        assert (result, calls) == ("ok", 3)
+        assert [c.args[0] for c in on_retry.call_args_list] == [0, 1]
+
+    def test_non_retryable_raises_immediately(self, mode):
+        """Test non-retryable errors are raised after a single call."""
+        config = RetryConfig(
+            max_attempts=3, strategy=FixedDelay(0), non_retryable_exceptions=(ValueError,)
+        )
+
+        result, calls = _run(mode, [ValueError, "ok"], config)
+
+        assert isinstance(result, ValueError)
+        assert calls == 1
+
+    def test_fails_after_max_attempts(self, mode):
+        """Test the last error is raised and on_failure called once attempts run out."""
+        on_failure = MagicMock()
+        config = RetryConfig(max_attempts=3, strategy=FixedDelay(0), on_failure=on_failure)
+
+        result, calls = _run(mode, [ConnectionError] * 3, config)
+
+        assert isinstance(result, ConnectionError)
+        assert calls == 3
+        on_failure.assert_called_once_with(result)
+
+    def test_unlisted_exception_is_not_retried(self, mode):
+        """Test exceptions outside retryable_exceptions propagate at once."""
+        config = RetryConfig(
+            max_attempts=3, strategy=FixedDelay(0), retryable_exceptions=(ConnectionError,)
+        )
+
+        result, calls = _run(mode, [KeyError, "ok"], config)
+
+        assert isinstance(result, KeyError)
+        assert calls == 1
+
+    @pytest.mark.parametrize("exc", [asyncio.CancelledError, KeyboardInterrupt])
+    def test_cancellation_is_never_retried(self, mode, exc):
+        """Test cancellation and interrupts propagate without a retry."""
+        on_failure = MagicMock()
+        config = RetryConfig(max_attempts=3, strategy=FixedDelay(0), on_failure=on_failure)
+
+        result, calls = _run(mode, [exc, "ok"], config)
+
+        assert isinstance(result, exc)
+        assert calls == 1
+        on_failure.assert_not_called()
+
+
+class TestRetryConfig:
+    """Tests for RetryConfig validation."""
+
+    def test_rejects_exception_in_both_lists(self):
+        """Test an exception cannot be both retryable and non-retryable."""
+        with pytest.raises(ValueError, match="both retryable and non-retryable: ValueError"):
+            RetryConfig(
+                retryable_exceptions=(ValueError, ConnectionError),
+                non_retryable_exceptions=(ValueError,),
+            )
+
+
+class TestRetryAfter:
+    """Tests for honoring a server's Retry-After hint."""
+
+    def test_delay_seconds(self):
+        """Test numeric hints get up to 25% jitter on top."""
+        rng = random.Random(0)
+        assert 5 <= _normalize_retry_after(5, 60.0, rng) <= 6.25
+        assert 5 <= _normalize_retry_after(" 5 ", 60.0, rng) <= 6.25
+
+    def test_capped(self):
+        """Test a huge hint is capped before jitter."""
+        assert 10 <= _normalize_retry_after(3600, 10.0, random.Random(0)) <= 12.5
+
+    def test_http_date(self):
+        """Test an HTTP-date hint becomes the seconds until that date."""
+        when = datetime.now(timezone.utc) + timedelta(seconds=30)
+        wait = _normalize_retry_after(email.utils.format_datetime(when, usegmt=True), 60.0, random.Random(0))
+        assert 28 <= wait <= 37.5
+
+    @pytest.mark.parametrize("value", [None, True, 0, -3, "soon", "Wed, 21 Oct 2015 07:28:00 GMT"])
+    def test_unusable_hints(self, value):
+        """Test missing, negative, unparsable and past hints are ignored."""
+        assert _normalize_retry_after(value, 60.0, random.Random(0)) is None
+
+    def test_hint_capped_at_strategy_max_wait(self):
+        """Test the retry loop caps the hint at the strategy's max_wait."""
+        waits = []
+
+        def limited():
+            if not waits:
+                raise RateLimitError("slow down", retry_after=3600)
+            return "ok"
+
+        config = RetryConfig(max_attempts=2, strategy=ExponentialBackoff(max_wait=1.0, rng=random.Random(1)))
+        with patch("yt_faceless.utils.retry._sleep", side_effect=waits.append):
+            assert execute_with_retry(limited, (), {}, config) == "ok"
+
+        assert len(waits) == 1
+        assert 1.0 <= waits[0] <= 1.25
+
+    def test_seeded_strategies_reproduce(self):
+        """Test Retry-After jitter comes from the strategy's seeded rng."""
+        def waits_for(seed):
+            waits = []
+            calls = []
+
+            def limited():
+                calls.append(1)
+                if len(calls) < 4:
+                    raise RateLimitError("slow down", retry_after=2)
+                return "ok"
+
+            config = RetryConfig(max_attempts=4, strategy=ExponentialBackoff(rng=random.Random(seed)))
+            with patch("yt_faceless.utils.retry._sleep", side_effect=waits.append):
+                assert execute_with_retry(limited, (), {}, config) == "ok"
+            return waits
+
+        assert waits_for(7) == waits_for(7)
+        assert waits_for(7) != waits_for(8)
+        assert all(2 <= wait <= 2.5 for wait in waits_for(7))
+
+
+class TestCircuitBreaker:
+    """Tests for the circuit breaker."""
+
+    @staticmethod
+    def _tripped(**kwargs):
+        """A breaker opened by one failure that half-opens straight away."""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0, **kwargs)
+        with pytest.raises(ConnectionError):
+            breaker.call(MagicMock(side_effect=ConnectionError("down"), __name__="fetch"))
+        assert breaker.state == "open"
+        return breaker
+
+    def test_open_circuit_rejects_calls(self):
+        """Test calls fail fast without running while the circuit is open."""
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60)
+        func = MagicMock(side_effect=ConnectionError("down"), __name__="fetch")
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                breaker.call(func)
+
+        with pytest.raises(CircuitBreakerOpenError, match="fetch"):
+            breaker.call(func)
+        assert func.call_count == 2
+
+    def test_single_probe_while_half_open(self):
+        """Test only one call gets through while half-open."""
+        breaker = self._tripped()
+        entered = threading.Event()
+        release = threading.Event()
+        results = []
+
+        def probe():
+            entered.set()
+            release.wait(5)
+            return "probed"
+
+        thread = threading.Thread(target=lambda: results.append(breaker.call(probe)))
+        thread.start()
+        try:
+            assert entered.wait(5)
+            with pytest.raises(CircuitBreakerOpenError):
+                breaker.call(lambda: "second")
+        finally:
+            release.set()
+            thread.join(5)
+
+        assert results == ["probed"]
+        assert breaker.state == "closed"
+        assert breaker.call(lambda: "after") == "after"
+
+    def test_probe_released_on_unexpected_exception(self):
+        """Test an exception the breaker doesn't count frees the probe slot."""
+        breaker = self._tripped(expected_exception=ConnectionError)
+
+        with pytest.raises(KeyError):
+            breaker.call(MagicMock(side_effect=KeyError("bug"), __name__="probe"))
+
+        assert breaker.state == "half-open"
+        assert breaker.call(lambda: "recovered") == "recovered"
+        assert breaker.state == "closed"
+
+    def test_async_probe_released_on_cancellation(self):
+        """Test a cancelled async probe frees the slot for the next caller."""
+        breaker = self._tripped(expected_exception=ConnectionError)
+
+        async def cancelled():
+            raise asyncio.CancelledError()
+
+        async def ok():
+            return "ok"
+
+        with pytest.raises(asyncio.CancelledError):
+            asyncio.run(breaker.acall(cancelled))
+        assert asyncio.run(breaker.acall(ok)) == "ok"
+        assert breaker.state == "closed"
+
+
+class TestWithTimeout:
+    """Tests for the with_timeout decorator on sync functions."""
+
+    def test_returns_result(self):
+        """Test a fast call returns its value."""
+        @with_timeout(1)
+        def add(a, b):
+            return a + b
+
+        assert add(2, b=3) == 5
+
+    def test_times_out(self):
+        """Test a slow call raises TimeoutError naming the function."""
+        release = threading.Event()
+
+        @with_timeout(0.05)
+        def hang():
+            release.wait(5)
+
+        try:
+            with pytest.raises(TimeoutError, match="hang timed out after 0.05s"):
+                hang()
+        finally:
+            release.set()
+
+    def test_own_timeout_error_passes_through(self):
+        """Test a TimeoutError raised by the function itself is not rewrapped."""
+        @with_timeout(5)
+        def read():
+            raise TimeoutError("socket read timed out")
+
+        with pytest.raises(TimeoutError, match="^socket read timed out$"):
+            read()
+
+    def test_hung_calls_do_not_starve_later_calls(self):
+        """Test calls still run after many earlier calls hung and timed out."""
+        release = threading.Event()
+
+        @with_timeout(0.05)
+        def hang():
+            release.wait(5)
+
+        @with_timeout(1)
+        def quick():
+            return "ran"
+
+        try:
+            for _ in range(12):
+                with pytest.raises(TimeoutError):
+                    hang()
+            assert quick() == "ran"
+        finally:
+            release.set()
+
+    def test_hung_call_does_not_block_exit(self):
+        """Test the interpreter exits without waiting for a timed out call."""
+        code = (
+            "import time\n"
+            "from yt_faceless.utils.retry import with_timeout\n"
+            "@with_timeout(0.1)\n"
+            "def hang():\n"
+            "    time.sleep(30)\n"
+            "try:\n"
+            "    hang()\n"
+            "except TimeoutError:\n"
+            "    pass\n"
+        )
+        env = {**os.environ, "PYTHONPATH": str(SRC_DIR)}
+
+        start = time.monotonic()
+        subprocess.run([sys.executable, "-c", code], env=env, check=True, timeout=20)
+
+        assert time.monotonic() - start < 10
+
+    def test_carries_context_vars(self):
+        """Test the call sees the caller's context variables."""
+        @with_timeout(1)
+        def current():
+            return request_id.get()
+
+        token = request_id.set("abc")
+        try:
+            assert current() == "abc"
+        finally:
+            request_id.reset(token)